@@ -1,14 +1,55 @@
-from aliceplex.schema.model import Actor, Album, Artist, Episode, Movie, \
-    Person, Show
-from aliceplex.schema.schema import ActorSchema, ActorStrictSchema, \
-    AlbumSchema, AlbumStrictSchema, ArtistSchema, ArtistStrictSchema, \
-    EpisodeSchema, EpisodeStrictSchema, MovieSchema, MovieStrictSchema, \
-    PersonSchema, PersonStrictSchema, ShowSchema, ShowStrictSchema
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aliceplex.schema.model import Actor, Album, Artist, Episode, \
+        Movie, Person, Show, SlottedActor, SlottedAlbum, SlottedArtist, \
+        SlottedEpisode, SlottedMovie, SlottedPerson, SlottedShow, slotted
+    from aliceplex.schema.pool import InternPool
+    from aliceplex.schema.schema import ActorSchema, ActorStrictSchema, \
+        AlbumSchema, AlbumStrictSchema, ArtistSchema, ArtistStrictSchema, \
+        EpisodeSchema, EpisodeStrictSchema, MovieSchema, MovieStrictSchema, \
+        PersonSchema, PersonStrictSchema, ShowSchema, ShowStrictSchema
 
 __all__ = [
     "Actor", "Album", "Artist", "Episode", "Movie", "Person", "Show",
+    "SlottedActor", "SlottedAlbum", "SlottedArtist", "SlottedEpisode",
+    "SlottedMovie", "SlottedPerson", "SlottedShow", "slotted",
+    "InternPool",
     "ActorSchema", "ActorStrictSchema", "AlbumSchema", "AlbumStrictSchema",
     "ArtistSchema", "ArtistStrictSchema", "EpisodeSchema",
     "EpisodeStrictSchema", "MovieSchema", "MovieStrictSchema", "PersonSchema",
     "PersonStrictSchema", "ShowSchema", "ShowStrictSchema"
 ]
+
+# Module of every exported name. Names are imported on first access, so that
+# importing a submodule, e.g. aliceplex.schema.format, does not import
+# marshmallow and the schemas.
+_MODULES = {
+    **dict.fromkeys([
+        "Actor", "Album", "Artist", "Episode", "Movie", "Person", "Show",
+        "SlottedActor", "SlottedAlbum", "SlottedArtist", "SlottedEpisode",
+        "SlottedMovie", "SlottedPerson", "SlottedShow", "slotted"
+    ], "aliceplex.schema.model"),
+    "InternPool": "aliceplex.schema.pool",
+    **dict.fromkeys([
+        "ActorSchema", "ActorStrictSchema", "AlbumSchema",
+        "AlbumStrictSchema", "ArtistSchema", "ArtistStrictSchema",
+        "EpisodeSchema", "EpisodeStrictSchema", "MovieSchema",
+        "MovieStrictSchema", "PersonSchema", "PersonStrictSchema",
+        "ShowSchema", "ShowStrictSchema"
+    ], "aliceplex.schema.schema")
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,753 @@
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date, datetime
+from itertools import accumulate, chain
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, \
+    Tuple, Type
+from weakref import WeakKeyDictionary
+
+from marshmallow import fields as ma_fields
+
+from aliceplex.schema.schema.base import DataClassSchema
+from aliceplex.schema.schema.codegen import CodeGenerator, dict_fields, \
+    list_inner
+from aliceplex.schema.schema.registry import get_schema
+
+__all__ = ["Archive", "BinaryFile", "dump_archive", "dump_binary",
+           "load_binary", "schema_version"]
+
+# File layout, all integers are little endian:
+#
+# header   magic, format version, marshal version, flags, schema version,
+#          number of records, offset of string table, offset of record
+#          offsets
+# records  length (u32) and marshal data of every record, a record is the
+#          tuple of its field values sorted by field name, strings are
+#          replaced by their index in the string table, index 0 is None
+# strings  number of strings (u64), start of every string in the text and
+#          the end of the text plus one (u64 * (number + 1)), and the text
+#          of all UTF-8 strings separated by NUL
+# offsets  offset of every record (u64)
+# keys     only in archives, start of every key and the end of the last key
+#          (u64 * (number of records + 1)), and the UTF-8 keys sorted by
+#          bytes, records are in the order of their keys
+_MAGIC = b"APLB"
+_FORMAT_VERSION = 1
+_MARSHAL_VERSION = 4
+_HEADER = struct.Struct("<4sHBBQQQQ")
+_LENGTH = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+_RANGE = struct.Struct("<QQ")
+
+# Flag of files with strings containing NUL, which cannot be split by NUL
+_FLAG_NUL = 1
+# Flag of archives, which have sorted keys
+_FLAG_KEYS = 2
+
+# Schema version of every schema class
+_VERSIONS: Dict[type, int] = {}
+# Codec of every schema
+_CODECS: "WeakKeyDictionary[DataClassSchema, _Codec]" = WeakKeyDictionary()
+
+
+class _StringTable:
+    """
+    Strings of a file being written, index 0 is None.
+    """
+
+    def __init__(self):
+        self.indexes: Dict[Optional[str], int] = {None: 0}
+
+    def add(self, value: Optional[str]) -> int:
+        indexes = self.indexes
+        index = indexes.get(value)
+        if index is None:
+            index = indexes[value] = len(indexes)
+        return index
+
+
+class _Codec(CodeGenerator):
+    """
+    Generated encoder and decoder of the objects of a schema.
+
+    Every schema, including nested schemas, gets a pair of functions, which
+    convert an object to the tuple of its encoded field values and back. The
+    code is compiled once, and executed for every file with its string
+    table, see :meth:`bind`.
+    """
+
+    prefixes = ("encode", "decode")
+
+    def __init__(self, schema: DataClassSchema):
+        super().__init__({"_date": date, "_datetime": datetime})
+        self._names = self.schema(schema)
+        self._code = self.compile(f"binary {type(schema).__name__}")
+
+    def bind(self, strings: Optional[List[Optional[str]]] = None,
+             table: Optional[_StringTable] = None
+             ) -> Tuple[Callable[[Any], Tuple[Any, ...]],
+                        Callable[[Tuple[Any, ...]], Any]]:
+        """
+        Get the encoder and decoder of the schema for a file.
+
+        :param strings: Decoded string table of the file being read
+        :type strings: Optional[List[Optional[str]]]
+        :param table: String table of the file being written
+        :type table: Optional[_StringTable]
+        :return: Encoder and decoder
+        :rtype: Tuple[Callable[[Any], Tuple[Any, ...]],
+            Callable[[Tuple[Any, ...]], Any]]
+        """
+        namespace = {
+            **self.namespace,
+            "_strings": strings,
+            "_string": None if strings is None else strings.__getitem__,
+            "_add": None if table is None else table.add
+        }
+        # pylint: disable=exec-used
+        exec(self._code, namespace)
+        encode_name, decode_name = self._names
+        return namespace[encode_name], namespace[decode_name]
+
+    def generate(self, schema: DataClassSchema, first: str, second: str):
+        """
+        Generate encode and decode functions for a schema.
+
+        :param schema: Schema
+        :type schema: DataClassSchema
+        :param first: Name of the encode function
+        :type first: str
+        :param second: Name of the decode function
+        :type second: str
+        """
+        fields = _fields(schema)
+        attributes = [field.attribute or name for name, field in fields]
+        codecs = [self.field(field) for _, field in fields]
+        variables = [f"v{index}" for index in range(len(codecs))]
+        encoded = "".join(
+            f"{encode(variable)}, "
+            for variable, (encode, _) in zip(variables, codecs)
+        )
+        self.function(first, "obj", [
+            f"{variable} = getattr(obj, {attribute!r})"
+            for variable, attribute in zip(variables, attributes)
+        ] + [f"return ({encoded})"])
+        class_name = self.constant(schema.model_class, "class")
+        decoded = f"{class_name}(" + ", ".join(
+            f"{attribute}={decode(variable)}"
+            for attribute, (_, decode), variable
+            in zip(attributes, codecs, variables)
+        ) + ")"
+        pool = schema.pool
+        if pool is not None:
+            pool_name = self.constant(pool, "pool")
+            decoded = f"{pool_name}.intern({decoded})"
+        self.function(second, "values", [
+            f"({''.join(f'{variable}, ' for variable in variables)}) = values",
+            f"return {decoded}"
+        ])
+
+    def field(
+            self, field: ma_fields.Field
+    ) -> Tuple[Callable[[str], str], Callable[[str], str]]:
+        """
+        Get the functions generating the encode and decode expression of a
+        field value.
+
+        :param field: Schema field
+        :type field: ma_fields.Field
+        :return: Functions of the value expression returning the encode and
+            decode expression
+        :rtype: Tuple[Callable[[str], str], Callable[[str], str]]
+        """
+        # pylint: disable=too-many-return-statements
+        if isinstance(field, ma_fields.String):
+            # Index 0 of the string table is None
+            return (lambda value: f"_add({value})",
+                    lambda value: f"_strings[{value}]")
+        # Date is a subclass of DateTime in some versions of marshmallow
+        if isinstance(field, ma_fields.Date):
+            # Ordinals start from 1, 0 is None
+            return (
+                lambda value: f"0 if {value} is None "
+                              f"else {value}.toordinal()",
+                lambda value: f"_date.fromordinal({value}) "
+                              f"if {value} else None"
+            )
+        if isinstance(field, ma_fields.DateTime):
+            return (
+                lambda value: f"_add(None if {value} is None "
+                              f"else {value}.isoformat())",
+                lambda value: f"_datetime.fromisoformat(_strings[{value}]) "
+                              f"if {value} else None"
+            )
+        if isinstance(field, (ma_fields.Number, ma_fields.Boolean)):
+            return (lambda value: value, lambda value: value)
+        if isinstance(field, ma_fields.List):
+            inner = list_inner(field)
+            if isinstance(inner, ma_fields.String):
+                return (
+                    lambda value: f"None if {value} is None "
+                                  f"else tuple(map(_add, {value}))",
+                    lambda value: f"None if {value} is None "
+                                  f"else list(map(_string, {value}))"
+                )
+            return self._list(self.field(inner))
+        if isinstance(field, ma_fields.Nested) and \
+                isinstance(field.schema, DataClassSchema):
+            encode_name, decode_name = self.schema(field.schema)
+            if field.many:
+                return (
+                    lambda value: f"None if {value} is None "
+                                  f"else tuple(map({encode_name}, {value}))",
+                    lambda value: f"None if {value} is None "
+                                  f"else list(map({decode_name}, {value}))"
+                )
+            return (
+                lambda value: f"None if {value} is None "
+                              f"else {encode_name}({value})",
+                lambda value: f"None if {value} is None "
+                              f"else {decode_name}({value})"
+            )
+        if isinstance(field, ma_fields.Dict):
+            return self._dict(field)
+        # Other fields are stored serialized and deserialized by marshmallow
+        field_name = self.constant(field, "field")
+        return (
+            lambda value: f"{field_name}._serialize({value}, None, None)",
+            lambda value: f"{field_name}.deserialize({value})"
+        )
+
+    def _list(self, codec: Tuple[Callable[[str], str], Callable[[str], str]]
+              ) -> Tuple[Callable[[str], str], Callable[[str], str]]:
+        encode, decode = codec
+        item = self.variable("i")
+        return (
+            lambda value: f"None if {value} is None else "
+                          f"tuple([{encode(item)} for {item} in {value}])",
+            lambda value: f"None if {value} is None else "
+                          f"[{decode(item)} for {item} in {value}]"
+        )
+
+    def _dict(self, field: ma_fields.Dict
+              ) -> Tuple[Callable[[str], str], Callable[[str], str]]:
+        keys, values = dict_fields(field)
+        same = (lambda value: value, lambda value: value)
+        encode_key, decode_key = self.field(keys) if keys else same
+        encode_value, decode_value = self.field(values) if values else same
+        key = self.variable("k")
+        item = self.variable("i")
+        return (
+            lambda value: f"None if {value} is None else tuple("
+                          f"({encode_key(key)}, {encode_value(item)}) "
+                          f"for {key}, {item} in {value}.items())",
+            lambda value: f"None if {value} is None else "
+                          f"{{{decode_key(key)}: {decode_value(item)} "
+                          f"for {key}, {item} in {value}}}"
+        )
+
+
+def _fields(schema: DataClassSchema) -> List[Tuple[str, ma_fields.Field]]:
+    """
+    Get the stored fields of a schema, sorted by name so that the order does
+    not depend on the order of schema fields.
+
+    :param schema: Schema
+    :type schema: DataClassSchema
+    :return: Name and field of the stored fields
+    :rtype: List[Tuple[str, ma_fields.Field]]
+    """
+    return sorted((
+        (name, field) for name, field in schema.fields.items()
+        if not field.dump_only and not field.load_only
+    ), key=lambda item: item[0])
+
+
+def _describe(schema: DataClassSchema) -> Tuple[Any, ...]:
+    """
+    Describe the structure of a schema for its version.
+
+    :param schema: Schema
+    :type schema: DataClassSchema
+    :return: Structure of the schema
+    :rtype: Tuple[Any, ...]
+    """
+    return (
+        f"{type(schema).__module__}.{type(schema).__qualname__}",
+        tuple(
+            (name, field.attribute, type(field).__name__,
+             _describe_field(field))
+            for name, field in _fields(schema)
+        )
+    )
+
+
+def _describe_field(field: ma_fields.Field) -> Any:
+    if isinstance(field, ma_fields.List):
+        inner = list_inner(field)
+        return type(inner).__name__, _describe_field(inner)
+    if isinstance(field, ma_fields.Nested) and \
+            isinstance(field.schema, DataClassSchema):
+        return field.many, _describe(field.schema)
+    if isinstance(field, ma_fields.Dict):
+        return tuple(
+            None if item is None else (type(item).__name__,
+                                       _describe_field(item))
+            for item in dict_fields(field)
+        )
+    return None
+
+
+def schema_version(schema_class: Type[DataClassSchema]) -> int:
+    """
+    Get the version of a schema stored in binary files.
+
+    The version changes when fields of the schema, or of its nested schemas,
+    are added, removed, renamed or change their type, so that files written
+    with another schema are rejected.
+
+    :param schema_class: Schema class
+    :type schema_class: Type[DataClassSchema]
+    :return: Schema version
+    :rtype: int
+    """
+    version = _VERSIONS.get(schema_class)
+    if version is None:
+        description = repr(_describe(get_schema(schema_class)))
+        digest = hashlib.blake2b(description.encode("utf-8"),
+                                 digest_size=8).digest()
+        version = _VERSIONS[schema_class] = int.from_bytes(digest, "little")
+    return version
+
+
+def _get_codec(schema: DataClassSchema) -> _Codec:
+    codec = _CODECS.get(schema)
+    if codec is None:
+        codec = _CODECS[schema] = _Codec(schema)
+    return codec
+
+
+def dump_binary(objs: Iterable[Any], path: str,
+                schema_class: Type[DataClassSchema]) -> int:
+    """
+    Write objects to a binary file, which can be loaded without validation
+    by :func:`load_binary` and :class:`BinaryFile`.
+
+    Every record is the tuple of its field values, without field names, and
+    all strings are stored once in a shared string table. The file is
+    written to a temporary file first and replaced atomically.
+
+    **Example:**
+
+    .. code-block:: python
+
+        dump_binary(episodes, "episodes.bin", EpisodeSchema)
+        episodes = load_binary("episodes.bin", EpisodeSchema)
+
+    :param objs: Objects to write, e.g. loaded
+        :class:`aliceplex.schema.model.Episode`
+    :type objs: Iterable[Any]
+    :param path: Path of the file
+    :type path: str
+    :param schema_class: Schema class of the objects
+    :type schema_class: Type[DataClassSchema]
+    :return: Number of written objects
+    :rtype: int
+    """
+    return _write(objs, path, schema_class)
+
+
+def dump_archive(items: Iterable[Tuple[str, Any]], path: str,
+                 schema_class: Type[DataClassSchema]) -> int:
+    """
+    Write objects to an archive, a binary file whose objects are looked up
+    by key with :class:`Archive`.
+
+    **Example:**
+
+    .. code-block:: python
+
+        result = LibraryScanner("/media/tv").scan()
+        dump_archive(result.items.items(), "library.bin", EpisodeSchema)
+        dump_archive(
+            ((f"{e.title[0]}|{e.aired}", e) for e in episodes),
+            "episodes.bin", EpisodeSchema
+        )
+
+    :param items: Key and object of every record, e.g. the path, or the
+        title and aired date
+    :type items: Iterable[Tuple[str, Any]]
+    :param path: Path of the file
+    :type path: str
+    :param schema_class: Schema class of the objects
+    :type schema_class: Type[DataClassSchema]
+    :return: Number of written objects
+    :rtype: int
+    :raises ValueError: if a key is duplicated
+    """
+    records = sorted(((key.encode("utf-8"), obj) for key, obj in items),
+                     key=itemgetter(0))
+    keys = [key for key, _ in records]
+    for previous, key in zip(keys, keys[1:]):
+        if previous == key:
+            raise ValueError(f"Duplicate key {key.decode('utf-8')!r}")
+    return _write((obj for _, obj in records), path, schema_class, keys)
+
+
+def _write(objs: Iterable[Any], path: str,
+           schema_class: Type[DataClassSchema],
+           keys: Optional[List[bytes]] = None) -> int:
+    """
+    Write a binary file.
+
+    :param objs: Objects to write
+    :type objs: Iterable[Any]
+    :param path: Path of the file
+    :type path: str
+    :param schema_class: Schema class of the objects
+    :type schema_class: Type[DataClassSchema]
+    :param keys: Sorted keys of the objects of an archive
+    :type keys: Optional[List[bytes]]
+    :return: Number of written objects
+    :rtype: int
+    """
+    # pylint: disable=too-many-locals
+    table = _StringTable()
+    encode, _ = _get_codec(get_schema(schema_class)).bind(table=table)
+    offsets = array("Q")
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        write = file.write
+        write(bytes(_HEADER.size))
+        offset = _HEADER.size
+        for obj in objs:
+            data = marshal.dumps(encode(obj), _MARSHAL_VERSION)
+            offsets.append(offset)
+            write(_LENGTH.pack(len(data)))
+            write(data)
+            offset += _LENGTH.size + len(data)
+        strings_offset = offset
+        values = [value.encode("utf-8") for value in table.indexes
+                  if value is not None]
+        flags = 0
+        if any(b"\0" in value for value in values):
+            flags |= _FLAG_NUL
+        starts = array("Q", [0])
+        start = 0
+        for value in values:
+            start += len(value) + 1
+            starts.append(start)
+        write(_OFFSET.pack(len(values)))
+        write(_little_endian(starts))
+        write(b"\0".join(values))
+        offsets_offset = file.tell()
+        write(_little_endian(offsets))
+        if keys is not None:
+            flags |= _FLAG_KEYS
+            write(_little_endian(array("Q", accumulate(
+                chain((0,), map(len, keys))
+            ))))
+            write(b"".join(keys))
+        file.seek(0)
+        write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, _MARSHAL_VERSION, flags,
+                           schema_version(schema_class), len(offsets),
+                           strings_offset, offsets_offset))
+    os.replace(temp_path, path)
+    return len(offsets)
+
+
+def load_binary(path: str, schema_class: Type[DataClassSchema],
+                **options) -> List[Any]:
+    """
+    Load all objects of a binary file written by :func:`dump_binary`,
+    without validation.
+
+    :param path: Path of the file
+    :type path: str
+    :param schema_class: Schema class of the objects
+    :type schema_class: Type[DataClassSchema]
+    :param options: Keyword arguments of the schema, e.g. ``slots=True``
+    :return: Loaded objects
+    :rtype: List[Any]
+    :raises ValueError: if the file is not a binary file of the schema
+    """
+    with BinaryFile(path, schema_class, **options) as file:
+        return list(file)
+
+
+class _LazyStrings:
+    """
+    String table of a binary file, decoding strings on access.
+    """
+
+    def __init__(self, buffer: mmap.mmap, offset: int, end: int):
+        (self.count,) = _OFFSET.unpack_from(buffer, offset)
+        self.buffer = buffer
+        self.starts_offset = offset + _OFFSET.size
+        self.text_offset = self.starts_offset + \
+            (self.count + 1) * _OFFSET.size
+        self.end = end
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        # Index 0 is None, index 1 is the first string
+        if index == 0:
+            return None
+        start, end = _RANGE.unpack_from(
+            self.buffer, self.starts_offset + (index - 1) * _OFFSET.size
+        )
+        offset = self.text_offset
+        return str(self.buffer[offset + start:offset + end - 1], "utf-8")
+
+    def decode(self, nul: bool) -> List[Optional[str]]:
+        """
+        Decode all strings.
+
+        :param nul: Whether strings contain NUL characters
+        :type nul: bool
+        :return: Strings by index
+        :rtype: List[Optional[str]]
+        """
+        if self.count == 0:
+            return [None]
+        if nul:
+            return [None] + [self[index]
+                             for index in range(1, self.count + 1)]
+        text = str(self.buffer[self.text_offset:self.end], "utf-8")
+        return [None] + text.split("\0")
+
+
+class BinaryFile:
+    """
+    Memory-mapped binary file written by :func:`dump_binary`.
+
+    Records are loaded without validation, by index or by offset, only the
+    requested records and their strings are decoded. Iterating decodes the
+    whole string table once. Binary files are a cache: they are only
+    readable by the same schema version (see :func:`schema_version`) and
+    marshal version, and must not be loaded from untrusted sources.
+
+    **Example:**
+
+    .. code-block:: python
+
+        with BinaryFile("episodes.bin", EpisodeSchema) as file:
+            len(file) # 10000
+            file[42] # Episode(...)
+            episodes = list(file)
+
+    :param path: Path of the file
+    :type path: str
+    :param schema_class: Schema class of the objects
+    :type schema_class: Type[DataClassSchema]
+    :param options: Keyword arguments of the schema, e.g. ``slots=True``
+    :raises ValueError: if the file is not a binary file of the schema
+    """
+
+    def __init__(self, path: str, schema_class: Type[DataClassSchema],
+                 **options):
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{path} is not a binary file")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, format_version, marshal_version, flags, version, count, \
+                strings_offset, offsets_offset = \
+                _HEADER.unpack_from(self._mmap)
+            end = offsets_offset + count * _OFFSET.size
+            if flags & _FLAG_KEYS:
+                end += (count + 1) * _OFFSET.size
+            if (magic, format_version, marshal_version) != \
+                    (_MAGIC, _FORMAT_VERSION, _MARSHAL_VERSION) or \
+                    end > size or end < size and not flags & _FLAG_KEYS:
+                raise ValueError(f"{path} is not a binary file")
+            if version != schema_version(schema_class):
+                raise ValueError(
+                    f"{path} is written with another version of "
+                    f"{schema_class.__name__}"
+                )
+        except Exception:
+            self._mmap.close()
+            raise
+        self._count = count
+        self._flags = flags
+        self._offsets_offset = offsets_offset
+        self._strings = _LazyStrings(self._mmap, strings_offset,
+                                     offsets_offset)
+        self._codec = _get_codec(get_schema(schema_class, **options))
+        _, self._decode = self._codec.bind(strings=self._strings)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+        return self.read(self.offset(index))
+
+    def __iter__(self) -> Iterator[Any]:
+        strings = self._strings.decode(bool(self._flags & _FLAG_NUL))
+        _, decode = self._codec.bind(strings=strings)
+        buffer = self._mmap
+        loads = marshal.loads
+        unpack_from = _LENGTH.unpack_from
+        offset = _HEADER.size
+        for _ in range(self._count):
+            (length,) = unpack_from(buffer, offset)
+            offset += _LENGTH.size
+            yield decode(loads(buffer[offset:offset + length]))
+            offset += length
+
+    def offset(self, index: int) -> int:
+        """
+        Get the offset of a record.
+
+        :param index: Index of the record
+        :type index: int
+        :return: Offset of the record
+        :rtype: int
+        """
+        position = self._offsets_offset + index * _OFFSET.size
+        return _OFFSET.unpack_from(self._mmap, position)[0]
+
+    def read(self, offset: int) -> Any:
+        """
+        Load the record at an offset returned by :meth:`offset`.
+
+        :param offset: Offset of the record
+        :type offset: int
+        :return: Loaded object
+        :rtype: Any
+        """
+        buffer = self._mmap
+        (length,) = _LENGTH.unpack_from(buffer, offset)
+        offset += _LENGTH.size
+        values = marshal.loads(buffer[offset:offset + length])
+        return self._decode(values)
+
+    def close(self):
+        """
+        Close the file.
+        """
+        self._mmap.close()
+
+    def __enter__(self) -> "BinaryFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class Archive(BinaryFile):
+    """
+    Memory-mapped archive written by :func:`dump_archive`, looking up
+    objects by key.
+
+    Keys are found by binary search in the memory-mapped file, only the
+    requested object is decoded and loaded, so that memory use does not
+    depend on the size of the archive.
+
+    **Example:**
+
+    .. code-block:: python
+
+        with Archive("library.bin", EpisodeSchema) as archive:
+            archive.get("Show/Season 1/S01E01.yaml") # Episode(...)
+            "Show/Season 1/S01E99.yaml" in archive # False
+
+    :param path: Path of the file
+    :type path: str
+    :param schema_class: Schema class of the objects
+    :type schema_class: Type[DataClassSchema]
+    :param options: Keyword arguments of the schema, e.g. ``slots=True``
+    :raises ValueError: if the file is not an archive of the schema
+    """
+
+    def __init__(self, path: str, schema_class: Type[DataClassSchema],
+                 **options):
+        super().__init__(path, schema_class, **options)
+        if not self._flags & _FLAG_KEYS:
+            self.close()
+            raise ValueError(f"{path} is not an archive")
+        self._keys_offset = self._offsets_offset + self._count * _OFFSET.size
+        self._text_offset = self._keys_offset + \
+            (self._count + 1) * _OFFSET.size
+
+    def _key(self, index: int) -> bytes:
+        start, end = _RANGE.unpack_from(
+            self._mmap, self._keys_offset + index * _OFFSET.size
+        )
+        offset = self._text_offset
+        return self._mmap[offset + start:offset + end]
+
+    def index(self, key: str) -> int:
+        """
+        Get the index of a key.
+
+        :param key: Key
+        :type key: str
+        :return: Index of the object
+        :rtype: int
+        :raises KeyError: if the key is not found
+        """
+        target = key.encode("utf-8")
+        low = 0
+        high = self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._key(low) == target:
+            return low
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Load the object of a key.
+
+        :param key: Key
+        :type key: str
+        :param default: Value returned if the key is not found
+        :type default: Any
+        :return: Loaded object, or default
+        :rtype: Any
+        """
+        try:
+            index = self.index(key)
+        except KeyError:
+            return default
+        return self.read(self.offset(index))
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self.index(key)
+        except KeyError:
+            return False
+        return True
+
+    def keys(self) -> Iterator[str]:
+        """
+        Iterate keys in sorted order.
+
+        :return: Keys
+        :rtype: Iterator[str]
+        """
+        for index in range(self._count):
+            yield self._key(index).decode("utf-8")
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
@@ -0,0 +1,324 @@
+import asyncio
+import json
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+from marshmallow import ValidationError
+
+from aliceplex.schema.schema.base import DataClassSchema
+from aliceplex.schema.schema.bulk import BulkResult
+from aliceplex.schema.schema.registry import get_schema
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
+__all__ = ["BACKENDS", "EXTENSIONS", "aload_file", "aload_many", "dump_file",
+           "dumps", "load_file", "load_files", "loads"]
+
+if yaml is None:  # pragma: no cover
+    #: Supported file extensions
+    EXTENSIONS: Tuple[str, ...] = (".json",)
+    _YAML_BACKEND = None
+    # pylint: disable=invalid-name
+    _SafeLoader = _YamlLoader = _YamlDumper = None
+else:
+    EXTENSIONS = (".json", ".yaml", ".yml")
+    # The libyaml based loader and dumper are several times faster
+    _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    _YAML_BACKEND = "libyaml" if _SafeLoader is not yaml.SafeLoader \
+        else "pyyaml"
+
+    class _YamlLoader(_SafeLoader):
+        """
+        Safe loader keeping unquoted dates and timestamps as strings, as in
+        JSON files, they are parsed by the schema.
+        """
+
+    _YamlLoader.yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers
+                if tag != "tag:yaml.org,2002:timestamp"]
+        for first, resolvers in _SafeLoader.yaml_implicit_resolvers.items()
+    }
+
+#: Backend used for every format, ``None`` if the format is not supported
+BACKENDS: Dict[str, Optional[str]] = {
+    "json": "json" if orjson is None else "orjson",
+    "yaml": _YAML_BACKEND
+}
+
+
+def loads(content: bytes, path: str) -> Any:
+    """
+    Parse the content of a JSON or YAML file with the fastest available
+    backend, see :data:`BACKENDS`.
+
+    :param content: Content of the file
+    :type content: bytes
+    :param path: Path of the file, its extension decides the format
+    :type path: str
+    :return: Parsed data
+    :rtype: Any
+    :raises ValueError: if the content is invalid or the format is not
+        supported
+    """
+    if _is_json(path):
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+    _check_yaml(path)
+    try:
+        return yaml.load(content, Loader=_YamlLoader)
+    except yaml.YAMLError as error:
+        raise ValueError(str(error)) from error
+
+
+def dumps(data: Any, path: str) -> bytes:
+    """
+    Serialize data to the content of a JSON or YAML file with the fastest
+    available backend, see :data:`BACKENDS`.
+
+    :param data: Data to be serialized
+    :type data: Any
+    :param path: Path of the file, its extension decides the format
+    :type path: str
+    :return: Content of the file
+    :rtype: bytes
+    :raises ValueError: if the format is not supported
+    """
+    if _is_json(path):
+        if orjson is not None:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    _check_yaml(path)
+    return yaml.dump(data, Dumper=_YamlDumper, encoding="utf-8",
+                     allow_unicode=True, sort_keys=False,
+                     default_flow_style=False)
+
+
+def load_file(path: str, schema_class: Type[DataClassSchema],
+              **options) -> Any:
+    """
+    Load a JSON or YAML metadata file.
+
+    **Example:**
+
+    .. code-block:: python
+
+        show = load_file("show.yaml", ShowSchema)
+
+    :param path: Path of the file
+    :type path: str
+    :param schema_class: Schema class of the file
+    :type schema_class: Type[DataClassSchema]
+    :param options: Keyword arguments of the schema, see
+        :func:`aliceplex.schema.schema.registry.get_schema`
+    :return: Loaded object
+    :rtype: Any
+    :raises ValueError: if the file cannot be parsed
+    :raises marshmallow.ValidationError: if the data is invalid
+    """
+    with open(path, "rb") as file:
+        data = loads(file.read(), path)
+    return get_schema(schema_class, **options).load(data, many=False)
+
+
+def dump_file(obj: Any, path: str, schema_class: Type[DataClassSchema],
+              **options):
+    """
+    Dump an object to a JSON or YAML metadata file.
+
+    **Example:**
+
+    .. code-block:: python
+
+        dump_file(show, "show.yaml", ShowSchema)
+
+    :param obj: Object to dump
+    :type obj: Any
+    :param path: Path of the file
+    :type path: str
+    :param schema_class: Schema class of the file
+    :type schema_class: Type[DataClassSchema]
+    :param options: Keyword arguments of the schema
+    """
+    data = get_schema(schema_class, **options).dump(obj, many=False)
+    content = dumps(data, path)
+    with open(path, "wb") as file:
+        file.write(content)
+
+
+def load_files(paths: Iterable[str], schema_class: Type[DataClassSchema],
+               workers: Optional[int] = None, **options) -> BulkResult:
+    """
+    Load many JSON or YAML metadata files in a thread pool, so that reading
+    files overlaps with parsing.
+
+    Files which cannot be read, parsed or validated do not stop loading,
+    their error messages are returned by index.
+
+    **Example:**
+
+    .. code-block:: python
+
+        result = load_files(paths, EpisodeSchema)
+        result.results # [Episode(...), None, ...]
+        result.errors # {1: {"_schema": ["... No such file ..."]}}
+
+    :param paths: Paths of the files
+    :type paths: Iterable[str]
+    :param schema_class: Schema class of the files
+    :type schema_class: Type[DataClassSchema]
+    :param workers: Number of threads, default to the default of
+        :class:`concurrent.futures.ThreadPoolExecutor`
+    :type workers: Optional[int]
+    :param options: Keyword arguments of the schema
+    :return: Loaded objects and error messages, in the order of paths
+    :rtype: BulkResult
+    """
+    load = partial(_load_path, schema_class=schema_class, options=options)
+    with ThreadPoolExecutor(workers) as executor:
+        return _result(executor.map(load, paths))
+
+
+async def aload_file(path: str, schema_class: Type[DataClassSchema],
+                     executor: Optional[Executor] = None, **options) -> Any:
+    """
+    Load a JSON or YAML metadata file without blocking the event loop, the
+    file is read, parsed and validated in an executor.
+
+    **Example:**
+
+    .. code-block:: python
+
+        show = await aload_file("show.yaml", ShowSchema)
+
+    :param path: Path of the file
+    :type path: str
+    :param schema_class: Schema class of the file
+    :type schema_class: Type[DataClassSchema]
+    :param executor: Executor loading the file, default to the default
+        executor of the event loop
+    :type executor: Optional[Executor]
+    :param options: Keyword arguments of the schema
+    :return: Loaded object
+    :rtype: Any
+    :raises ValueError: if the file cannot be parsed
+    :raises marshmallow.ValidationError: if the data is invalid
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, partial(load_file, path, schema_class, **options)
+    )
+
+
+async def aload_many(paths: Iterable[str],
+                     schema_class: Type[DataClassSchema],
+                     executor: Optional[Executor] = None, limit: int = 4,
+                     **options) -> BulkResult:
+    """
+    Load many JSON or YAML metadata files without blocking the event loop,
+    the files are read, parsed and validated in an executor.
+
+    At most limit files are submitted to the executor at a time, so that a
+    large rescan does not fill the executor queue and other work of the
+    event loop can still use the executor. Cancelling the coroutine cancels
+    the files which are not loaded yet. Errors are returned by index as
+    :func:`load_files`.
+
+    Validation holds the GIL, so threads loading files slow down the event
+    loop thread, a small limit keeps the event loop responsive. Use a
+    :class:`concurrent.futures.ProcessPoolExecutor` to validate files in
+    parallel.
+
+    **Example:**
+
+    .. code-block:: python
+
+        result = await aload_many(paths, EpisodeSchema, limit=8)
+        result.results # [Episode(...), None, ...]
+        result.errors # {1: {"_schema": ["... No such file ..."]}}
+
+    :param paths: Paths of the files
+    :type paths: Iterable[str]
+    :param schema_class: Schema class of the files
+    :type schema_class: Type[DataClassSchema]
+    :param executor: Executor loading the files, default to the default
+        executor of the event loop
+    :type executor: Optional[Executor]
+    :param limit: Maximum number of files loaded at a time
+    :type limit: int
+    :param options: Keyword arguments of the schema
+    :return: Loaded objects and error messages, in the order of paths
+    :rtype: BulkResult
+    :raises ValueError: if limit is not positive
+    """
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(limit)
+    load = partial(_load_path, schema_class=schema_class, options=options)
+
+    async def run(path: str) -> Tuple[Any, Any]:
+        async with semaphore:
+            return await loop.run_in_executor(executor, load, path)
+
+    tasks = [asyncio.ensure_future(run(path)) for path in paths]
+    try:
+        outcomes = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return _result(outcomes)
+
+
+def _load_path(path: str, schema_class: Type[DataClassSchema],
+               options: Dict[str, Any]) -> Tuple[Any, Any]:
+    """
+    Load a metadata file, it is a module level function so that it can be
+    run in other processes.
+
+    :return: Loaded object, or None, and error messages, or None
+    :rtype: Tuple[Any, Any]
+    """
+    try:
+        with open(path, "rb") as file:
+            data = loads(file.read(), path)
+        return get_schema(schema_class, **options).load(data, many=False), None
+    except ValidationError as error:
+        return None, error.messages
+    except (OSError, TypeError, ValueError) as error:
+        return None, {"_schema": [str(error)]}
+
+
+def _result(outcomes: Iterable[Tuple[Any, Any]]) -> BulkResult:
+    results = []
+    errors = {}
+    for index, (obj, messages) in enumerate(outcomes):
+        results.append(obj)
+        if messages is not None:
+            errors[index] = messages
+    return BulkResult(results, errors)
+
+
+def _is_json(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() == ".json"
+
+
+def _check_yaml(path: str):
+    if os.path.splitext(path)[1].lower() not in (".yaml", ".yml"):
+        raise ValueError(f"Unsupported file type: {path}")
+    if yaml is None:  # pragma: no cover
+        raise ValueError("PyYAML is required for YAML files")
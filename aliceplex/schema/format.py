@@ -1,5 +1,179 @@
 import re
+import sys
 import unicodedata
+from collections import OrderedDict
+from functools import partial
+from itertools import chain, islice
+from threading import Lock
+from typing import Callable, Dict, Iterable, Iterator, List, Match, \
+    NamedTuple, Optional, TextIO, Union
+
+from aliceplex.schema.parallel import map_chunks
+
+__all__ = [
+    "NORMALIZE_STEPS", "CacheInfo", "CharacterMap", "MemoizedNormalizer",
+    "Normalizer", "Pipeline",
+    "is_normalized", "normalize", "normalize_many", "normalize_stream",
+    "remove_leading_space", "remove_single_linebreak",
+    "remove_trailing_space", "replace_arrow_brackets",
+    "replace_continuous_newlines", "replace_continuous_space", "replace_dot",
+    "replace_ending_space", "replace_full_stop", "replace_tilde"
+]
+
+_TRAILING_LINE_SPACE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+_TRAILING_SPACE = re.compile(r"\s+$")
+_LEADING_SPACE = re.compile(r"^[ \t]*", re.MULTILINE)
+_CONTINUOUS_NEWLINES = re.compile(r"\n{3,}")
+_CONTINUOUS_SPACE = re.compile(r"[^\S\n]{2,}")
+# The first dot is factored out of the alternation, so that the regular
+# expression engine can skip to the next dot instead of trying both
+# alternatives at every position.
+_DOT = re.compile(r"[.．。、・]"
+                  r"(?:[.．。、・]{2}(?![.．。、・](?:[^.．。、・]|$))"
+                  r"|"
+                  r"[.．。、・])")
+_ARROW_BRACKETS = re.compile(r"[＜<](.*)[>＞]")
+_ENDING_SPACE = re.compile(r"([?!。])[^\S\n]+")
+_SINGLE_LINEBREAK = re.compile(r"(?<!\n)\n(?!\n)")
+# "…" next to another dot, which is changed by replace_dot after NFKC
+_ELLIPSIS_PAIRS = tuple(sorted(
+    {"…" + dot for dot in "….。、・"} | {dot + "…" for dot in ".。、・"}
+))
+
+if sys.version_info >= (3, 8):
+    def _is_nfkc(string: str) -> bool:
+        return unicodedata.is_normalized("NFKC", string)
+else:
+    def _is_nfkc(string: str) -> bool:
+        return unicodedata.normalize("NFKC", string) == string
+
+
+class CharacterMap:
+    """
+    Replace characters in a single ``str.translate`` pass.
+
+    Characters are registered in equivalence classes, every character of a
+    class is replaced with the same replacement. Strings without any
+    registered character are returned as is after a single scan.
+
+    **Example:**
+
+    .. code-block:: python
+
+        character_map = CharacterMap({"~〜": "〜"})
+        character_map.register("‐‑‒–—", "-")
+        result = character_map("~Hello–World~") # "〜Hello-World〜"
+    """
+
+    def __init__(self, classes: Optional[Dict[str, str]] = None):
+        """
+        :param classes: Characters of each equivalence class and their
+            replacement
+        :type classes: Optional[Dict[str, str]]
+        """
+        self._mapping = {}
+        self._table = {}
+        self._pattern = None
+        for characters, replacement in (classes or {}).items():
+            self._add(characters, replacement)
+        self._compile()
+
+    def __call__(self, string: str) -> str:
+        """
+        Replace registered characters of a string.
+
+        :param string: String to be processed
+        :type string: str
+        :return: Result string
+        :rtype: str
+        """
+        # str.translate is slow compared to scanning with a regular
+        # expression, so only translate when there is something to replace.
+        if self._pattern is None or self._pattern.search(string) is None:
+            return string
+        return string.translate(self._table)
+
+    @property
+    def mapping(self) -> Dict[str, str]:
+        """
+        Replacement of every registered character.
+
+        :return: Replacement of every registered character
+        :rtype: Dict[str, str]
+        """
+        return dict(self._mapping)
+
+    def register(self, characters: str, replacement: str) -> "CharacterMap":
+        """
+        Register an equivalence class of characters.
+
+        :param characters: Characters to be replaced
+        :type characters: str
+        :param replacement: Replacement of the characters
+        :type replacement: str
+        :return: This character map
+        :rtype: CharacterMap
+        :raises ValueError: if any character or the replacement is whitespace
+        """
+        self._add(characters, replacement)
+        self._compile()
+        return self
+
+    def merge(self, other: "CharacterMap") -> "CharacterMap":
+        """
+        Create a character map which gives the same result as applying this
+        character map and then ``other``.
+
+        :param other: Character map applied after this character map
+        :type other: CharacterMap
+        :return: Merged character map
+        :rtype: CharacterMap
+        """
+        mapping = {
+            char: other(replacement)
+            for char, replacement in self._mapping.items()
+        }
+        for char, replacement in other.mapping.items():
+            mapping.setdefault(char, replacement)
+        return CharacterMap(mapping)
+
+    def _add(self, characters: str, replacement: str):
+        if any(char.isspace() for char in characters + replacement):
+            raise ValueError("Whitespace cannot be used in CharacterMap")
+        for char in characters:
+            if char == replacement:
+                self._mapping.pop(char, None)
+            else:
+                self._mapping[char] = replacement
+
+    def _compile(self):
+        self._table = str.maketrans(self._mapping)
+        if self._mapping:
+            escaped = "".join(re.escape(char) for char in self._mapping)
+            self._pattern = re.compile(f"[{escaped}]")
+        else:
+            self._pattern = None
+
+    def matches(self, string: str) -> bool:
+        """
+        Check if any character of the string would be replaced.
+
+        :param string: String to be checked
+        :type string: str
+        :return: True if any character would be replaced
+        :rtype: bool
+        """
+        if len(self._mapping) <= 8:
+            # Substring checks are cheaper than a scan for a few characters
+            for char in self._mapping:
+                if char in string:
+                    return True
+            return False
+        return self._pattern.search(string) is not None
+
+
+_TILDE_MAP = CharacterMap({"~˜⁓∼∽∿〜～": "〜"})
+_FULL_STOP_MAP = CharacterMap({"．": "・"})
 
 
 def remove_trailing_space(string: str) -> str:
@@ -18,8 +192,8 @@ def remove_trailing_space(string: str) -> str:
         string = "Hello \\nWorld!"
         result = remove_trailing_space(string) # "Hello\\nWorld!"
     """
-    result = re.sub(r"[^\S\n]+$", "", string, flags=re.MULTILINE)
-    return re.sub(r"\s+$", "", result)
+    result = _TRAILING_LINE_SPACE.sub("", string)
+    return _TRAILING_SPACE.sub("", result)
 
 
 def remove_leading_space(string: str) -> str:
@@ -38,7 +212,7 @@ def remove_leading_space(string: str) -> str:
         string = " Hello \\nWorld!"
         result = remove_trailing_space(string) # "Hello \\nWorld!"
     """
-    return re.sub(r"^[ \t]*", "", string, flags=re.MULTILINE)
+    return _LEADING_SPACE.sub("", string)
 
 
 def replace_continuous_newlines(string: str) -> str:
@@ -57,7 +231,7 @@ def replace_continuous_newlines(string: str) -> str:
         string = "Hello\\n\\n\\nWorld!"
         result = replace_continuous_newlines(string) # "Hello\\n\\nWorld!"
     """
-    return re.sub(r"\n{3,}", "\n\n", string)
+    return _CONTINUOUS_NEWLINES.sub("\n\n", string)
 
 
 def replace_continuous_space(string: str) -> str:
@@ -76,7 +250,7 @@ def replace_continuous_space(string: str) -> str:
         string = "Hello \t World!"
         result = replace_continuous_space(string) # "Hello World!"
     """
-    return re.sub(r"[^\S\n]{2,}", " ", string)
+    return _CONTINUOUS_SPACE.sub(" ", string)
 
 
 def replace_tilde(string: str) -> str:
@@ -95,7 +269,7 @@ def replace_tilde(string: str) -> str:
         string = "~Hello World~"
         result = replace_tilde(string) # "〜Hello World〜"
     """
-    return re.sub(r"[~˜⁓∼∽∿〜～]", "〜", string)
+    return _TILDE_MAP(string)
 
 
 def replace_dot(string: str) -> str:
@@ -119,10 +293,7 @@ def replace_dot(string: str) -> str:
 
         `Stack Overflow <https://stackoverflow.com/a/51568290/3673259>`_
     """
-    return re.sub(r"([.．。、・]{3}(?![.．。、・](?:[^.．。、・]|$))"
-                  r"|"
-                  r"[.．。、・]{2})",
-                  "…", string)
+    return _DOT.sub("…", string)
 
 
 def replace_full_stop(string: str) -> str:
@@ -161,7 +332,7 @@ def replace_arrow_brackets(string: str) -> str:
         string = "<Hello World>"
         result = replace_arrow_brackets(string) # "〈Hello World〉"
     """
-    return re.sub(r"[＜<](.*)[>＞]", r"〈\g<1>〉", string)
+    return _ARROW_BRACKETS.sub(r"〈\g<1>〉", string)
 
 
 def replace_ending_space(string: str) -> str:
@@ -180,7 +351,7 @@ def replace_ending_space(string: str) -> str:
         string = "Hello World? Test"
         result = replace_ending_space(string) # "Hello World?Test"
     """
-    return re.sub(r"([?!。])[^\S\n]+", r"\g<1>", string)
+    return _ENDING_SPACE.sub(r"\g<1>", string)
 
 
 def remove_single_linebreak(string: str) -> str:
@@ -199,7 +370,428 @@ def remove_single_linebreak(string: str) -> str:
         string = "Hello\\n\\nWorld?\\nTest"
         result = replace_ending_space(string) # "Hello\\n\\nWorld?Test"
     """
-    return re.sub(r"(?<!\n)\n(?!\n)", "", string)
+    return _SINGLE_LINEBREAK.sub("", string)
+
+
+# Whitespace run, except a single space between two words
+_WHITESPACE = re.compile(r"\s(?:(?!\S)|(?<=\n)|(?<=[?!。].))\s*")
+# Whitespace run with more than one linebreak
+_PARAGRAPH = re.compile(r"\s*\n\s*\n\s*")
+
+
+def _replace_whitespace(match: Match) -> str:
+    start, end = match.span()
+    string = match.string
+    if start == 0 or end == len(string):
+        # Leading and trailing space of the whole string
+        return ""
+    space = match.group()
+    if "\n" not in space:
+        if string[start - 1] in "?!。":
+            return ""
+        return " " if len(space) > 1 else space
+    return _replace_linebreaks(space)
+
+
+def _replace_linebreaks(space: str) -> str:
+    # Space before the first linebreak is the trailing space of a line and
+    # lines between linebreaks only contain space, so both of them are
+    # removed. Single linebreak is removed and more linebreaks are replaced
+    # with two linebreaks.
+    first = space.find("\n")
+    last = space.rfind("\n")
+    linebreak = "" if first == last else "\n\n"
+    leading = space[last + 1:].lstrip(" \t")
+    if len(leading) > 1:
+        leading = " "
+    return linebreak + leading
+
+
+def _format_space(string: str) -> str:
+    # Leading and trailing space are removed by _replace_whitespace only at
+    # the edges of whitespace runs, so strip is needed to match the result
+    # of all whitespace and linebreak rules followed by str.strip.
+    return _WHITESPACE.sub(_replace_whitespace, string).strip()
+
+
+class Normalizer:
+    """
+    Precompiled normalization engine used by :func:`normalize`.
+
+    The steps of :func:`normalize` are fused into as few passes as possible.
+    All whitespace and linebreak rules are applied in a single scan which
+    only stops at whitespace that may change, so a single space between two
+    words is skipped without calling back into Python. All character
+    replacements, tilde and any extra equivalence classes of
+    ``characters``, are applied by a single :class:`CharacterMap`. The
+    result is identical to applying every step one by one.
+
+    **Example:**
+
+    .. code-block:: python
+
+        normalizer = Normalizer()
+        result = normalizer("Hello     World...") # "Hello World…"
+
+        characters = CharacterMap({"~˜⁓∼∽∿〜～": "〜", "‐‑‒–—": "-"})
+        normalizer = Normalizer(characters)
+        result = normalizer("Hello–World~") # "Hello-World〜"
+    """
+
+    def __init__(self, characters: Optional[CharacterMap] = None):
+        """
+        :param characters: Character replacements, default to tilde
+            replacement of :func:`replace_tilde`
+        :type characters: Optional[CharacterMap]
+        """
+        self.characters = characters or _TILDE_MAP
+
+    def __call__(self, string: str) -> str:
+        """
+        Normalize a string.
+
+        :param string: String to be processed
+        :type string: str
+        :return: Result string
+        :rtype: str
+        """
+        if self._is_clean(string):
+            return string
+        return self._format(unicodedata.normalize("NFKC", string)).strip()
+
+    def stream(self, stream: Union[TextIO, Iterable[str]],
+               chunksize: int = 65536) -> Iterator[str]:
+        """
+        Normalize a text stream chunk by chunk.
+
+        The stream is split at paragraph breaks, so only the current
+        paragraph is kept in memory. Joining the result chunks gives the same
+        result as normalizing the whole text at once.
+
+        :param stream: File object or chunks of text to be processed
+        :type stream: Union[TextIO, Iterable[str]]
+        :param chunksize: Number of characters read from a file object at once
+        :type chunksize: int
+        :return: Result chunks
+        :rtype: Iterator[str]
+        """
+        if hasattr(stream, "read"):
+            stream = iter(partial(stream.read, chunksize), "")
+        # Input after the last linebreak, not yet NFKC normalized. NFKC never
+        # combines characters across a linebreak, so everything before it
+        # can be normalized.
+        raw = ""
+        # NFKC normalized input after the last paragraph break
+        pending = ""
+        started = False
+        for chunk in stream:
+            raw += chunk
+            cut = raw.rfind("\n") + 1
+            if not cut:
+                continue
+            scanned = len(pending)
+            pending += unicodedata.normalize("NFKC", raw[:cut])
+            raw = raw[cut:]
+            # A paragraph break can only be complete when a non-space
+            # character follows it, otherwise more space or linebreaks may
+            # still be read.
+            while scanned and pending[scanned - 1].isspace():
+                scanned -= 1
+            paragraph = None
+            for paragraph in _PARAGRAPH.finditer(pending, scanned):
+                pass
+            if paragraph is None or paragraph.end() == len(pending):
+                continue
+            result = self._format(pending[:paragraph.start()])
+            pending = pending[paragraph.end():]
+            if not started:
+                result = result.lstrip()
+                if not result:
+                    continue
+                started = True
+            yield result + _replace_linebreaks(paragraph.group())
+        result = self._format(pending + unicodedata.normalize("NFKC", raw))
+        result = result.strip() if not started else result.rstrip()
+        if result:
+            yield result
+
+    def _format(self, string: str) -> str:
+        result = _WHITESPACE.sub(_replace_whitespace, string)
+        result = self.characters(result)
+        result = _DOT.sub("…", result)
+        if "<" in result:
+            # NFKC has already converted "＜" to "<"
+            result = _ARROW_BRACKETS.sub(r"〈\g<1>〉", result)
+        return result
+
+    def is_normalized(self, string: str) -> bool:
+        """
+        Check if normalizing the string does not change it.
+
+        :param string: String to be checked
+        :type string: str
+        :return: True if the string is already normalized
+        :rtype: bool
+        """
+        return self._is_clean(string) or self(string) == string
+
+    def _is_clean(self, string: str) -> bool:
+        """
+        Cheap check for strings which are not changed by normalization.
+
+        Only substring checks are used, which are much faster than a regular
+        expression scan. ``False`` does not mean that the string would be
+        changed, only that it has to be normalized to find out.
+        """
+        # pylint: disable=too-many-branches,too-many-return-statements
+        if not string:
+            return True
+        if string[0].isspace() or string[-1].isspace():
+            return False
+        if "…" in string:
+            # NFKC expands "…" to "...", which the dot rule turns back into
+            # "…" unless it is next to other dots
+            for pair in _ELLIPSIS_PAIRS:
+                if pair in string:
+                    return False
+            if not _is_nfkc(string.replace("…", "")):
+                return False
+        elif not _is_nfkc(string):
+            return False
+        if not string.isprintable():
+            # Space is the only printable whitespace, so a linebreak, another
+            # whitespace or a control character is in the string. Only
+            # accept paragraphs separated by two linebreaks.
+            linebreaks = string.count("\n")
+            if (not linebreaks
+                    or linebreaks != 2 * string.count("\n\n")
+                    or "\n\n\n" in string):
+                return False
+            if (" \n" in string
+                    or "\n " in string
+                    or not string.replace("\n", "").isprintable()):
+                return False
+        if ("  " in string
+                or "? " in string
+                or "! " in string
+                or "。 " in string):
+            return False
+        if self.characters.matches(string):
+            return False
+        # "．" is already changed by NFKC
+        for dot in ".。、・":
+            if dot in string:
+                for other in ".。、・":
+                    if dot + other in string:
+                        return False
+        return "<" not in string or not _ARROW_BRACKETS.search(string)
+
+
+#: Steps of :func:`normalize`
+NORMALIZE_STEPS = (
+    "nfkc", "whitespace", "replace_tilde", "replace_dot",
+    "replace_arrow_brackets"
+)
+
+_STEPS = {
+    "nfkc": partial(unicodedata.normalize, "NFKC"),
+    "whitespace": _format_space,
+    "strip": str.strip,
+    "remove_trailing_space": remove_trailing_space,
+    "remove_leading_space": remove_leading_space,
+    "replace_continuous_newlines": replace_continuous_newlines,
+    "replace_continuous_space": replace_continuous_space,
+    "replace_ending_space": replace_ending_space,
+    "remove_single_linebreak": remove_single_linebreak,
+    "replace_tilde": _TILDE_MAP,
+    "replace_full_stop": _FULL_STOP_MAP,
+    "replace_dot": replace_dot,
+    "replace_arrow_brackets": replace_arrow_brackets
+}
+
+
+class Pipeline:
+    """
+    Normalization with a custom list of steps.
+
+    A step is either the name of a step or a :class:`CharacterMap`. Steps
+    are validated and compiled once, and adjacent character replacements
+    (``replace_tilde``, ``replace_full_stop`` and character maps) are merged
+    into a single :class:`CharacterMap` pass.
+
+    Available steps:
+
+    - ``nfkc``: ``unicodedata.normalize`` with ``NFKC``
+    - ``whitespace``: all whitespace and linebreak rules of
+      :func:`normalize` followed by ``str.strip``, in a single pass
+    - ``strip``: ``str.strip``
+    - ``remove_trailing_space``, ``remove_leading_space``,
+      ``replace_continuous_newlines``, ``replace_continuous_space``,
+      ``replace_ending_space``, ``remove_single_linebreak``,
+      ``replace_tilde``, ``replace_full_stop``, ``replace_dot`` and
+      ``replace_arrow_brackets``: the function of the same name
+
+    **Example:**
+
+    .. code-block:: python
+
+        names = Pipeline(["nfkc", "whitespace"])
+        names(" Taro  Yamada ") # "Taro Yamada"
+
+        summaries = Pipeline(NORMALIZE_STEPS + ("replace_full_stop",))
+        summaries("Hello．World...") # "Hello・World…"
+    """
+
+    def __init__(self, steps: Iterable[Union[str, CharacterMap]]):
+        """
+        :param steps: Steps to be run in order
+        :type steps: Iterable[Union[str, CharacterMap]]
+        :raises ValueError: if a step is unknown
+        """
+        self.steps = tuple(steps)
+        functions = []
+        for step in self.steps:
+            if isinstance(step, CharacterMap):
+                function = step
+            elif step in _STEPS:
+                function = _STEPS[step]
+            else:
+                raise ValueError(f"Unknown normalization step: {step!r}")
+            if (isinstance(function, CharacterMap) and functions
+                    and isinstance(functions[-1], CharacterMap)):
+                function = functions.pop().merge(function)
+            functions.append(function)
+        self._functions = tuple(functions)
+
+    def __call__(self, string: str) -> str:
+        """
+        Run all steps on a string.
+
+        :param string: String to be processed
+        :type string: str
+        :return: Result string
+        :rtype: str
+        """
+        for function in self._functions:
+            string = function(string)
+        return string
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of :class:`MemoizedNormalizer` and
+    :class:`aliceplex.schema.pool.InternPool`.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class MemoizedNormalizer:
+    """
+    Normalizer with a bounded least recently used cache.
+
+    Strings longer than ``max_length`` are normalized without touching the
+    cache or its statistics, so that long summaries do not evict short and
+    frequently repeated values such as genres, studios or names.
+
+    **Example:**
+
+    .. code-block:: python
+
+        normalizer = MemoizedNormalizer(maxsize=1024)
+        normalizer("Hello  World") # "Hello World"
+        normalizer("Hello  World") # "Hello World", from cache
+        normalizer.cache_info() # CacheInfo(hits=1, misses=1, ...)
+    """
+
+    def __init__(self,
+                 maxsize: int = 4096,
+                 max_length: int = 256,
+                 normalizer: Optional[Callable[[str], str]] = None):
+        """
+        :param maxsize: Maximum number of cached strings
+        :type maxsize: int
+        :param max_length: Maximum length of a cached string
+        :type max_length: int
+        :param normalizer: Function used on cache miss, default to
+            :func:`normalize`
+        :type normalizer: Optional[Callable[[str], str]]
+        """
+        self.maxsize = maxsize
+        self.max_length = max_length
+        self.normalizer = normalizer or _NORMALIZER
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
+        self._lock = Lock()
+
+    def __call__(self, string: str) -> str:
+        """
+        Normalize a string, using the cached result if possible.
+
+        :param string: String to be processed
+        :type string: str
+        :return: Result string
+        :rtype: str
+        """
+        if len(string) > self.max_length:
+            return self.normalizer(string)
+        cache = self._cache
+        with self._lock:
+            try:
+                result = cache[string]
+            except KeyError:
+                pass
+            else:
+                cache.move_to_end(string)
+                self.hits += 1
+                return result
+        result = self.normalizer(string)
+        with self._lock:
+            self.misses += 1
+            cache[string] = result
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    @property
+    def currsize(self) -> int:
+        """
+        Number of cached strings.
+
+        :return: Number of cached strings
+        :rtype: int
+        """
+        return len(self._cache)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Get statistics of the cache.
+
+        :return: Statistics of the cache
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """
+        Clear the cache and its statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+_NORMALIZER = Normalizer()
 
 
 def normalize(string: str) -> str:
@@ -211,15 +803,100 @@ def normalize(string: str) -> str:
     :return: Result string
     :rtype: str
     """
-    result = unicodedata.normalize("NFKC", string)
-    result = remove_trailing_space(result)
-    result = remove_leading_space(result)
-    result = replace_continuous_newlines(result)
-    result = replace_continuous_space(result)
-    result = replace_ending_space(result)
-    result = remove_single_linebreak(result)
-    result = replace_tilde(result)
-    result = replace_dot(result)
-    result = replace_arrow_brackets(result)
-    result = result.strip()
-    return result
+    return _NORMALIZER(string)
+
+
+def is_normalized(string: str) -> bool:
+    """
+    Check if the string is already normalized, i.e. :func:`normalize` would
+    return it unchanged.
+
+    :param string: String to be checked
+    :type string: str
+    :return: True if the string is already normalized
+    :rtype: bool
+
+    **Example:**
+
+    .. code-block:: python
+
+        is_normalized("Hello World…") # True
+        is_normalized("Hello  World...") # False
+    """
+    return _NORMALIZER.is_normalized(string)
+
+
+def normalize_stream(stream: Union[TextIO, Iterable[str]],
+                     chunksize: int = 65536) -> Iterator[str]:
+    """
+    Run :func:`normalize` on a text stream chunk by chunk.
+
+    Only the current paragraph is kept in memory, so large text files can be
+    normalized without reading them at once. Joining the result chunks gives
+    the same result as :func:`normalize` on the whole text.
+
+    :param stream: File object or chunks of text to be processed
+    :type stream: Union[TextIO, Iterable[str]]
+    :param chunksize: Number of characters read from a file object at once
+    :type chunksize: int
+    :return: Result chunks
+    :rtype: Iterator[str]
+
+    **Example:**
+
+    .. code-block:: python
+
+        with open("summary.txt", encoding="utf-8") as file:
+            with open("result.txt", "w", encoding="utf-8") as result:
+                result.writelines(normalize_stream(file))
+    """
+    return _NORMALIZER.stream(stream, chunksize)
+
+
+# Minimum number of strings before normalize_many starts worker processes.
+# Smaller batches are faster in process than paying for process startup and
+# pickling.
+_PARALLEL_THRESHOLD = 10000
+
+
+def normalize_many(strings: Iterable[str],
+                   workers: Optional[int] = None,
+                   chunksize: int = 1000) -> Iterator[str]:
+    """
+    Run :func:`normalize` on many strings.
+
+    Results are yielded in input order as soon as they are ready. Large
+    batches are split into chunks and normalized by a
+    ``ProcessPoolExecutor``, small batches are normalized in process.
+
+    :param strings: Strings to be processed
+    :type strings: Iterable[str]
+    :param workers: Number of worker processes, default to number of CPUs,
+        ``1`` to always normalize in process
+    :type workers: Optional[int]
+    :param chunksize: Number of strings sent to a worker at once
+    :type chunksize: int
+    :return: Result strings
+    :rtype: Iterator[str]
+
+    **Example:**
+
+    .. code-block:: python
+
+        results = list(normalize_many(["Hello  World", "test....."]))
+        # ["Hello World", "test……"]
+    """
+    iterator = iter(strings)
+    head = list(islice(iterator, _PARALLEL_THRESHOLD))
+    if workers == 1 or len(head) < _PARALLEL_THRESHOLD:
+        yield from map(_NORMALIZER, head)
+        yield from map(_NORMALIZER, iterator)
+        return
+    iterator = chain(head, iterator)
+    del head
+    for results in map_chunks(_normalize_chunk, iterator, workers, chunksize):
+        yield from results
+
+
+def _normalize_chunk(strings: List[str]) -> List[str]:
+    return [_NORMALIZER(string) for string in strings]
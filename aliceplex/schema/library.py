@@ -0,0 +1,352 @@
+import hashlib
+import json
+import os
+import time
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, \
+    Sequence, Tuple, Type
+
+from marshmallow import ValidationError
+
+from aliceplex.schema.files import EXTENSIONS, loads
+from aliceplex.schema.schema import AlbumSchema, ArtistSchema, \
+    EpisodeSchema, MovieSchema, ShowSchema
+from aliceplex.schema.schema.base import DataClassSchema
+from aliceplex.schema.schema.registry import get_schema
+
+__all__ = ["DEFAULT_PATTERNS", "INDEX_NAME", "LibraryScanner", "ScanResult"]
+
+#: File name pattern, without extension and in lower case, and schema class
+#: of metadata files. The first matching pattern is used.
+DEFAULT_PATTERNS: Sequence[Tuple[str, Type[DataClassSchema]]] = (
+    ("show", ShowSchema),
+    ("movie", MovieSchema),
+    ("artist", ArtistSchema),
+    ("album", AlbumSchema),
+    ("s[0-9]*e[0-9]*", EpisodeSchema)
+)
+
+#: File name of the index in the library root
+INDEX_NAME = ".aliceplex-index.json"
+
+# Version of the index format, indexes of other versions are ignored
+_INDEX_VERSION = 1
+
+# Files modified this long before the previous scan started are trusted by
+# mtime and size, newer files may have been modified again within the mtime
+# resolution of the file system, so their content hash is checked.
+_RACY_NS = 2 * 10 ** 9
+
+
+class _Entry(NamedTuple):
+    """
+    Index entry of a metadata file.
+    """
+    mtime: int
+    size: int
+    hash: str
+    schema: str
+    data: Optional[Dict[str, Any]]
+    errors: Optional[Dict[str, Any]]
+
+
+class ScanResult(NamedTuple):
+    """
+    Result of :meth:`LibraryScanner.scan`, paths are relative to the library
+    root and use ``/`` as separator.
+    """
+    #: Loaded object of every valid metadata file by path
+    items: Dict[str, Any]
+    #: Error messages of every invalid metadata file by path
+    errors: Dict[str, Any]
+    #: Paths of new and modified files, which are parsed and validated
+    changed: List[str]
+    #: Paths of files removed since the previous scan
+    removed: List[str]
+
+
+class LibraryScanner:
+    """
+    Scanner loading metadata files of a media library incrementally.
+
+    Metadata files are found by their name, e.g. ``show.yaml`` is loaded by
+    :class:`aliceplex.schema.schema.ShowSchema` and ``S01E02.json`` by
+    :class:`aliceplex.schema.schema.EpisodeSchema`, see
+    :data:`DEFAULT_PATTERNS`. Files are parsed by
+    :func:`aliceplex.schema.files.loads`, JSON files are supported, and YAML
+    files if PyYAML is installed. Hidden files and directories are skipped.
+
+    The path, mtime, size, content hash and validated data of every file is
+    kept in an index file, by default :data:`INDEX_NAME` in the library root.
+    Only new and modified files are parsed and validated, the others are
+    loaded from the index with
+    :meth:`aliceplex.schema.schema.base.DataClassSchema.load_trusted`, or
+    reused from the previous scan of the same scanner. A file whose mtime
+    changed but content did not is not validated again.
+
+    **Example:**
+
+    .. code-block:: python
+
+        scanner = LibraryScanner("/media/tv")
+        result = scanner.scan()
+        result.items["Show/show.yaml"] # Show(...)
+        result.errors # {"Show/S01E02.yaml": {"aired": [...]}}
+        scanner.scan().changed # ["Show/S01E03.yaml"]
+    """
+
+    def __init__(self, root: str, index_path: Optional[str] = None,
+                 patterns: Sequence[Tuple[str, Type[DataClassSchema]]] =
+                 DEFAULT_PATTERNS,
+                 **options):
+        """
+        :param root: Library root directory
+        :type root: str
+        :param index_path: Path of the index file, default to
+            :data:`INDEX_NAME` in root
+        :type index_path: Optional[str]
+        :param patterns: File name pattern and schema class of metadata
+            files
+        :type patterns: Sequence[Tuple[str, Type[DataClassSchema]]]
+        :param options: Keyword arguments of the schemas, e.g.
+            ``slots=True``
+        """
+        self.root = root
+        self.index_path = index_path or os.path.join(root, INDEX_NAME)
+        self.patterns = patterns
+        self.options = options
+        self._index: Optional[Dict[str, _Entry]] = None
+        self._index_time = 0
+        self._objects: Dict[str, Any] = {}
+
+    def scan(self) -> ScanResult:
+        """
+        Scan the library and update the index file.
+
+        :return: Loaded objects, errors, changed and removed paths
+        :rtype: ScanResult
+        """
+        # pylint: disable=too-many-locals
+        started = time.time_ns()
+        index = self._index
+        if index is None:
+            index = self._index = self._load_index()
+        trusted = self._index_time - _RACY_NS
+        objects = self._objects
+        items = {}
+        errors = {}
+        changed = []
+        seen = set()
+        dirty = False
+        failed = {}
+        for path, file_path, schema_class in self._walk(failed):
+            seen.add(path)
+            schema_name = schema_class.__name__
+            entry = index.get(path)
+            try:
+                stat, content = self._read(file_path, entry, schema_name,
+                                           trusted)
+            except OSError as error:
+                # Removed or unreadable since it was found, it is not indexed
+                # so that it is read again by the next scan
+                errors[path] = {"_schema": [str(error)]}
+                objects.pop(path, None)
+                if index.pop(path, None) is not None:
+                    dirty = True
+                continue
+            if content is not None:
+                digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+                if entry is not None and entry.schema == schema_name and \
+                        entry.hash == digest:
+                    # Touched without change
+                    entry = entry._replace(mtime=stat.st_mtime_ns,
+                                           size=stat.st_size)
+                else:
+                    entry = self._parse(path, content, schema_class)
+                    entry = entry._replace(mtime=stat.st_mtime_ns,
+                                           size=stat.st_size, hash=digest)
+                    changed.append(path)
+                # Saved even if unchanged, so that the scan time of the index
+                # advances and the file is trusted by the next scan
+                index[path] = entry
+                dirty = True
+            if entry.errors is not None:
+                errors[path] = entry.errors
+                continue
+            obj = objects.get(path)
+            if obj is None:
+                schema = get_schema(schema_class, **self.options)
+                obj = schema.load_trusted(entry.data, many=False)
+                objects[path] = obj
+            items[path] = obj
+        # Files in directories which cannot be listed are kept in the index
+        errors.update(failed)
+        removed = [
+            path for path in index
+            if path not in seen and not path.startswith(tuple(failed))
+        ]
+        for path in removed:
+            del index[path]
+            objects.pop(path, None)
+        if dirty or removed:
+            self._save_index(index, started)
+        self._index_time = started
+        return ScanResult(items, errors, changed, removed)
+
+    @staticmethod
+    def _read(file_path: str, entry: Optional[_Entry], schema_name: str,
+              trusted: int) -> Tuple[os.stat_result, Optional[bytes]]:
+        """
+        Stat a metadata file, and read it unless the index entry is trusted.
+
+        :param file_path: Path of the file
+        :type file_path: str
+        :param entry: Index entry of the file, if any
+        :type entry: Optional[_Entry]
+        :param schema_name: Name of the schema class of the file
+        :type schema_name: str
+        :param trusted: Files modified before this time are trusted by mtime
+            and size
+        :type trusted: int
+        :return: Stat result and content, None if the entry is trusted
+        :rtype: Tuple[os.stat_result, Optional[bytes]]
+        :raises OSError: if the file cannot be read
+        """
+        stat = os.stat(file_path)
+        if entry is None or entry.schema != schema_name or \
+                entry.mtime != stat.st_mtime_ns or \
+                entry.size != stat.st_size or entry.mtime >= trusted:
+            with open(file_path, "rb") as file:
+                return stat, file.read()
+        return stat, None
+
+    def _walk(self, failed: Dict[str, Any]
+              ) -> Iterator[Tuple[str, str, Type[DataClassSchema]]]:
+        """
+        Find metadata files.
+
+        Symbolic links are followed, every directory is visited once, so
+        that links to parent directories terminate. Directories which cannot
+        be listed are skipped.
+
+        :param failed: Dictionary storing error messages of skipped
+            directories by relative path ending with ``/``
+        :type failed: Dict[str, Any]
+        :return: Relative path, path and schema class of metadata files
+        :rtype: Iterator[Tuple[str, str, Type[DataClassSchema]]]
+        """
+        stack = [("", self.root)]
+        visited = set()
+        while stack:
+            prefix, directory = stack.pop()
+            try:
+                stat = os.stat(directory)
+                key = (stat.st_dev, stat.st_ino)
+                if key in visited:
+                    continue
+                visited.add(key)
+                directories, files = self._list(directory)
+            except OSError as error:
+                failed[prefix] = {"_schema": [str(error)]}
+                continue
+            stack += ((f"{prefix}{name}/", path) for name, path in directories)
+            for name, path in files:
+                stem = os.path.splitext(name.lower())[0]
+                schema_class = self._match(stem)
+                if schema_class is not None:
+                    yield prefix + name, path, schema_class
+
+    @staticmethod
+    def _list(directory: str) -> Tuple[List[Tuple[str, str]],
+                                       List[Tuple[str, str]]]:
+        """
+        List visible subdirectories and metadata files of a directory.
+
+        :param directory: Path of the directory
+        :type directory: str
+        :return: Name and path of subdirectories and of files
+        :rtype: Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]
+        :raises OSError: if the directory cannot be listed
+        """
+        directories = []
+        files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    directories.append((name, entry.path))
+                elif os.path.splitext(name)[1].lower() in EXTENSIONS and \
+                        entry.is_file():
+                    files.append((name, entry.path))
+        return directories, files
+
+    def _match(self, stem: str) -> Optional[Type[DataClassSchema]]:
+        for pattern, schema_class in self.patterns:
+            if fnmatchcase(stem, pattern):
+                return schema_class
+        return None
+
+    def _parse(self, path: str, content: bytes,
+               schema_class: Type[DataClassSchema]) -> _Entry:
+        """
+        Parse and validate a metadata file, the new object is kept for the
+        scan result.
+
+        :param path: Relative path
+        :type path: str
+        :param content: Content of the file
+        :type content: bytes
+        :param schema_class: Schema class of the file
+        :type schema_class: Type[DataClassSchema]
+        :return: Entry without mtime, size and hash
+        :rtype: _Entry
+        """
+        self._objects.pop(path, None)
+        entry = _Entry(0, 0, "", schema_class.__name__, None, None)
+        try:
+            data = loads(content, path)
+        except ValueError as error:
+            return entry._replace(errors={"_schema": [str(error)]})
+        schema = get_schema(schema_class, **self.options)
+        try:
+            obj = schema.load(data, many=False)
+        except ValidationError as error:
+            return entry._replace(errors=error.messages)
+        except (TypeError, ValueError) as error:
+            # Data marshmallow does not expect, one file must not stop the
+            # scan
+            return entry._replace(errors={"_schema": [str(error)]})
+        self._objects[path] = obj
+        return entry._replace(data=schema.dump(obj, many=False))
+
+    def _load_index(self) -> Dict[str, _Entry]:
+        try:
+            with open(self.index_path, "rb") as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index, dict) or \
+                index.get("version") != _INDEX_VERSION:
+            return {}
+        self._index_time = index["time"]
+        return {path: _Entry(*entry) for path, entry in index["files"].items()}
+
+    def _save_index(self, index: Dict[str, _Entry], started: int):
+        """
+        Write the index file atomically.
+
+        :param index: Entry of every metadata file
+        :type index: Dict[str, _Entry]
+        :param started: Start time of the scan in nanoseconds
+        :type started: int
+        """
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({
+                "version": _INDEX_VERSION,
+                "time": started,
+                "files": index
+            }, file, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, self.index_path)
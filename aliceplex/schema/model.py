@@ -1,8 +1,12 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import date
 from typing import Dict, List, Optional
 
-__all__ = ["Actor", "Show", "Episode", "Movie", "Album", "Artist", "Person"]
+__all__ = [
+    "Actor", "Show", "Episode", "Movie", "Album", "Artist", "Person",
+    "SlottedActor", "SlottedShow", "SlottedEpisode", "SlottedMovie",
+    "SlottedAlbum", "SlottedArtist", "SlottedPerson", "slotted"
+]
 
 
 @dataclass
@@ -99,3 +103,70 @@ class Album:
     collections: List[str] = field(default_factory=list)
     genres: List[str] = field(default_factory=list)
     summary: Optional[str] = None
+
+
+# Slotted variant of each dataclass, created once on first use
+_SLOTTED: Dict[type, type] = {}
+
+
+def slotted(data_class: type) -> type:
+    """
+    Get the ``__slots__`` based variant of a dataclass.
+
+    The variant has the same fields, ``__init__``, ``__repr__`` and
+    ``__eq__``, and works with :func:`dataclasses.asdict`, but instances do
+    not carry a ``__dict__``, which saves memory. Instances of the variant
+    are not equal to instances of the original dataclass. The variant of a
+    subclass inherits from the variant of its base class.
+
+    **Example:**
+
+    .. code-block:: python
+
+        SlottedPerson = slotted(Person)
+        person = SlottedPerson(name="Name")
+
+    :param data_class: Dataclass
+    :type data_class: type
+    :return: Slotted dataclass
+    :rtype: type
+    :raises ValueError: if data_class is not a dataclass
+    """
+    if data_class in _SLOTTED:
+        return _SLOTTED[data_class]
+    if "__slots__" in data_class.__dict__:
+        return data_class
+    if not is_dataclass(data_class):
+        raise ValueError("Only dataclass can be slotted")
+    bases = tuple(
+        slotted(base) if is_dataclass(base) else base
+        for base in data_class.__bases__
+    )
+    inherited = {
+        slot
+        for base in bases
+        for cls in base.__mro__
+        for slot in cls.__dict__.get("__slots__", ())
+    }
+    names = [f.name for f in fields(data_class)]
+    namespace = {
+        key: value for key, value in data_class.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = tuple(
+        name for name in names if name not in inherited
+    )
+    name = "Slotted" + data_class.__name__
+    namespace["__qualname__"] = name
+    slotted_class = type(name, bases, namespace)
+    _SLOTTED[data_class] = slotted_class
+    return slotted_class
+
+
+SlottedPerson = slotted(Person)
+SlottedActor = slotted(Actor)
+SlottedShow = slotted(Show)
+SlottedEpisode = slotted(Episode)
+SlottedMovie = slotted(Movie)
+SlottedArtist = slotted(Artist)
+SlottedAlbum = slotted(Album)
@@ -0,0 +1,68 @@
+import os
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, \
+    Tuple, TypeVar
+
+__all__ = ["map_chunks"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_chunks(function: Callable[[List[T]], R],
+               iterable: Iterable[T],
+               workers: Optional[int] = None,
+               chunksize: int = 1000,
+               initializer: Optional[Callable[..., Any]] = None,
+               initargs: Tuple[Any, ...] = ()) -> Iterator[R]:
+    """
+    Run a function on chunks of items in a ``ProcessPoolExecutor``.
+
+    Results of chunks are yielded in input order as soon as they are ready.
+    Only a few chunks per worker are in flight, so that memory usage does
+    not depend on the size of the input. Function, items, results and
+    initializer must be picklable.
+
+    **Example:**
+
+    .. code-block:: python
+
+        for results in map_chunks(normalize_chunk, strings, workers=4):
+            ...
+
+    :param function: Function called with a list of items
+    :type function: Callable[[List[T]], R]
+    :param iterable: Items to be processed
+    :type iterable: Iterable[T]
+    :param workers: Number of worker processes, default to number of CPUs
+    :type workers: Optional[int]
+    :param chunksize: Number of items sent to a worker at once
+    :type chunksize: int
+    :param initializer: Function called once in every worker process
+    :type initializer: Optional[Callable[..., Any]]
+    :param initargs: Arguments of initializer
+    :type initargs: Tuple[Any, ...]
+    :return: Result of every chunk
+    :rtype: Iterator[R]
+    """
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    # Imported here, multiprocessing is slow to import and only needed for
+    # large inputs
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    iterator = iter(iterable)
+    workers = workers or os.cpu_count() or 1
+    max_pending = 2 * workers
+    with ProcessPoolExecutor(workers, initializer=initializer,
+                             initargs=initargs) as executor:
+        pending = deque()
+        chunk = list(islice(iterator, chunksize))
+        while chunk:
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            chunk = list(islice(iterator, chunksize))
+        while pending:
+            yield pending.popleft().result()
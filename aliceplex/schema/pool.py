@@ -0,0 +1,196 @@
+from dataclasses import fields, is_dataclass
+from threading import Lock
+from typing import (Any, Dict, FrozenSet, Iterable, Optional, Tuple, TypeVar,
+                    Union)
+
+from aliceplex.schema.format import CacheInfo
+
+__all__ = ["InternPool"]
+
+T = TypeVar("T")
+
+# Types of unhashable field values
+_COLLECTIONS = (list, dict, set)
+
+# Marker of dataclasses whose fields are not inspected yet
+_UNKNOWN: Any = object()
+
+# Fields of loaded data whose values repeat across records
+_FIELD_NAMES = frozenset([
+    "collections", "content_rating", "genres", "name", "photo", "role",
+    "similar", "studio"
+])
+
+
+class InternPool:  # pylint: disable=too-many-instance-attributes
+    """
+    Bounded pool sharing equal strings and equal dataclass objects.
+
+    Strings are pooled by value. Dataclass objects, such as
+    :class:`aliceplex.schema.model.Person` and
+    :class:`aliceplex.schema.model.Actor`, are pooled by their type and the
+    tuple of their field values, objects with unhashable field values, such
+    as lists, are not pooled. The pool is cleared when it is full, objects
+    loaded before keep sharing their pooled values. Pooling costs memory for
+    values which are not repeated, so use it for libraries with many
+    repeated people, genres, studios and ratings.
+
+    Values which are mostly unique, such as titles and summaries, would
+    fill the pool and clear the repeated ones, so schemas only pool strings
+    of the fields in ``field_names``, and strings longer than
+    ``max_length`` are never pooled.
+
+    Pooled objects are shared by every record loaded with the pool, so they
+    must be treated as read-only: modifying a pooled
+    :class:`aliceplex.schema.model.Person` changes it in all records. Use
+    :func:`dataclasses.replace` to get a modified copy instead.
+
+    **Example:**
+
+    .. code-block:: python
+
+        pool = InternPool(maxsize=100000)
+        schema = EpisodeSchema(pool=pool, many=True)
+        episodes = schema.load(records)
+        episodes[0].directors[0] is episodes[1].directors[0] # True
+        pool.cache_info() # CacheInfo(hits=..., misses=..., ...)
+    """
+
+    def __init__(self, maxsize: int = 65536, max_length: int = 256,
+                 field_names: Optional[Iterable[str]] = None):
+        """
+        :param maxsize: Maximum number of pooled strings and objects
+        :type maxsize: int
+        :param max_length: Maximum length of a pooled string
+        :type max_length: int
+        :param field_names: Fields whose strings are pooled by
+            :meth:`intern_data`, default to people, ratings, genres,
+            studios, collections and similar artists
+        :type field_names: Optional[Iterable[str]]
+        """
+        self.maxsize = maxsize
+        self.max_length = max_length
+        self.field_names: FrozenSet[str] = _FIELD_NAMES \
+            if field_names is None else frozenset(field_names)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pool: Dict[Any, Any] = {}
+        # Field names of every dataclass, None if it cannot be pooled
+        self._names: Dict[type, Optional[Tuple[str, ...]]] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def intern(self, value: T) -> T:
+        """
+        Get the pooled object equal to value, adding value to the pool if
+        there is none.
+
+        :param value: String or dataclass object
+        :type value: T
+        :return: Pooled object, or value if it cannot be pooled
+        :rtype: T
+        """
+        value_type = type(value)
+        if value_type is str:
+            if len(value) > self.max_length:
+                return value
+            key = value
+        elif is_dataclass(value_type):
+            names = self._names.get(value_type, _UNKNOWN)
+            if names is _UNKNOWN:
+                names = self._names[value_type] = _field_names(value_type)
+            if names is None:
+                return value
+            key = (value_type,) + tuple(getattr(value, n) for n in names)
+            try:
+                hash(key)
+            except TypeError:
+                return value
+        else:
+            return value
+        pool = self._pool
+        with self._lock:
+            pooled = pool.get(key)
+            if pooled is not None:
+                self.hits += 1
+                return pooled
+            self.misses += 1
+            if len(pool) >= self.maxsize:
+                self.evictions += len(pool)
+                pool.clear()
+            pool[key] = value
+        return value
+
+    def intern_data(self, data: Dict[str, Any], names: Iterable[str]):
+        """
+        Replace strings, and strings in lists, of the given keys of data by
+        pooled strings in place. Keys which are not in :attr:`field_names`
+        are skipped.
+
+        :param data: Data to be processed
+        :type data: Dict[str, Any]
+        :param names: Keys of data to be processed
+        :type names: Iterable[str]
+        """
+        intern = self.intern
+        field_names = self.field_names
+        for name in names:
+            if name not in field_names:
+                continue
+            value = data.get(name)
+            if isinstance(value, str):
+                data[name] = intern(value)
+            elif isinstance(value, list):
+                data[name] = [
+                    intern(item) if isinstance(item, str) else item
+                    for item in value
+                ]
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Get statistics of the pool.
+
+        :return: Statistics of the pool
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._pool))
+
+    def cache_clear(self):
+        """
+        Clear the pool and its statistics.
+        """
+        with self._lock:
+            self._pool.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+def _field_names(data_class: type) -> Optional[Tuple[str, ...]]:
+    """
+    Get field names of a dataclass.
+
+    :param data_class: Dataclass
+    :type data_class: type
+    :return: Field names, or None if a field is a list, dict or set, so that
+        objects of the dataclass cannot be pooled
+    :rtype: Optional[Tuple[str, ...]]
+    """
+    names = []
+    for field in fields(data_class):
+        if _is_collection(field.type):
+            return None
+        names.append(field.name)
+    return tuple(names)
+
+
+def _is_collection(f_type: Any) -> bool:
+    origin = getattr(f_type, "__origin__", None)
+    if origin is Union:
+        return any(map(_is_collection, f_type.__args__))
+    return f_type in _COLLECTIONS or origin in _COLLECTIONS
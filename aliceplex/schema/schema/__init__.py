@@ -1,17 +1,60 @@
-from aliceplex.schema.schema.actor import ActorSchema, ActorStrictSchema
-from aliceplex.schema.schema.album import AlbumSchema, AlbumStrictSchema
-from aliceplex.schema.schema.artist import ArtistSchema, ArtistStrictSchema
-from aliceplex.schema.schema.episode import EpisodeSchema, EpisodeStrictSchema
-from aliceplex.schema.schema.movie import MovieSchema, MovieStrictSchema
-from aliceplex.schema.schema.person import PersonSchema, PersonStrictSchema
-from aliceplex.schema.schema.show import ShowSchema, ShowStrictSchema
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aliceplex.schema.schema.actor import ActorSchema, ActorStrictSchema
+    from aliceplex.schema.schema.album import AlbumSchema, AlbumStrictSchema
+    from aliceplex.schema.schema.artist import ArtistSchema, \
+        ArtistStrictSchema
+    from aliceplex.schema.schema.bulk import BulkResult, bulk_dump, \
+        bulk_load
+    from aliceplex.schema.schema.compiler import CompiledSchema, \
+        compile_schema
+    from aliceplex.schema.schema.episode import EpisodeSchema, \
+        EpisodeStrictSchema
+    from aliceplex.schema.schema.movie import MovieSchema, MovieStrictSchema
+    from aliceplex.schema.schema.person import PersonSchema, \
+        PersonStrictSchema
+    from aliceplex.schema.schema.registry import clear_schemas, get_schema
+    from aliceplex.schema.schema.show import ShowSchema, ShowStrictSchema
 
 __all__ = [
     "ActorSchema", "ActorStrictSchema",
     "AlbumSchema", "AlbumStrictSchema",
     "ArtistSchema", "ArtistStrictSchema",
+    "BulkResult", "bulk_dump", "bulk_load",
+    "CompiledSchema", "compile_schema",
     "EpisodeSchema", "EpisodeStrictSchema",
     "MovieSchema", "MovieStrictSchema",
     "PersonSchema", "PersonStrictSchema",
+    "clear_schemas", "get_schema",
     "ShowSchema", "ShowStrictSchema"
 ]
+
+# Module of every exported name. Names are imported on first access, so that
+# only the modules of the used schemas are imported.
+_MODULES = {
+    "ActorSchema": "actor", "ActorStrictSchema": "actor",
+    "AlbumSchema": "album", "AlbumStrictSchema": "album",
+    "ArtistSchema": "artist", "ArtistStrictSchema": "artist",
+    "BulkResult": "bulk", "bulk_dump": "bulk", "bulk_load": "bulk",
+    "CompiledSchema": "compiler", "compile_schema": "compiler",
+    "EpisodeSchema": "episode", "EpisodeStrictSchema": "episode",
+    "MovieSchema": "movie", "MovieStrictSchema": "movie",
+    "PersonSchema": "person", "PersonStrictSchema": "person",
+    "clear_schemas": "registry", "get_schema": "registry",
+    "ShowSchema": "show", "ShowStrictSchema": "show"
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,57 +1,163 @@
-from dataclasses import Field, asdict, fields, is_dataclass
-from typing import Any, Dict, List, Optional
+from collections.abc import Mapping
+from dataclasses import Field, fields, is_dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, \
+    NamedTuple, Optional, Tuple
 
-from marshmallow import Schema, post_load, pre_dump, pre_load
+from marshmallow import Schema, ValidationError, fields as ma_fields, \
+    post_load, pre_dump, pre_load
+
+from aliceplex.schema.model import slotted
+from aliceplex.schema.pool import InternPool
+from aliceplex.schema.schema.codegen import dict_fields, list_inner
 
 __all__ = ["DataClassSchema"]
 
 
+class _FieldPlan(NamedTuple):
+    """
+    Names of dataclass fields.
+    """
+    names: Tuple[str, ...]
+    lists: Tuple[str, ...]
+    strings: Tuple[str, ...]
+
+
+# Field plan of each dataclass, computed once on first use
+_FIELD_PLANS: Dict[type, _FieldPlan] = {}
+
+
+# Converter of a field for trusted load
+_Converter = Callable[[Any], Any]
+
+
 class DataClassSchema(Schema):
+    """
+    Schema loading dataclass objects.
+
+    Pass ``slots=True``, or ``"slots": True`` in the context, to load the
+    ``__slots__`` based variant of the dataclass (see
+    :func:`aliceplex.schema.model.slotted`). The option is inherited by
+    nested schemas through the context.
+
+    Pass an :class:`aliceplex.schema.pool.InternPool` as ``pool``, or as
+    ``"pool"`` in the context, to share equal strings and equal objects,
+    such as :class:`aliceplex.schema.model.Person`, between loaded records.
+    Pooled objects must be treated as read-only.
+
+    **Example:**
+
+    .. code-block:: python
+
+        show = ShowSchema(slots=True).load(data)
+        episodes = EpisodeSchema(pool=InternPool(), many=True).load(records)
+
+    :param slots: Whether to load slotted dataclass objects
+    :type slots: bool
+    :param pool: Pool of loaded strings and objects
+    :type pool: Optional[InternPool]
+    """
+
+    # Converters of load_trusted, computed on first use
+    _trusted_converters: Optional[
+        List[Tuple[str, str, Optional[_Converter]]]
+    ] = None
+
+    def __init__(self, *args, slots: bool = False,
+                 pool: Optional[InternPool] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if slots:
+            self.context = {**self.context, "slots": True}
+        if pool is not None:
+            self.context = {**self.context, "pool": pool}
 
     @pre_dump
     def convert(self, data) -> Dict[str, Any]:
         """
         Convert dataclass object to dict.
 
+        Only a shallow copy is made, nested dataclass objects are converted
+        by their own schema.
+
         :param data: Input data
         :type data: Any
         :return: Dictionary for dumping.
         :rtype: Dict[str, Any]
         """
-        new_data = asdict(data) if is_dataclass(data) else {**data}
+        if is_dataclass(data):
+            names = self._get_field_plan().names
+            new_data = {name: getattr(data, name) for name in names}
+        else:
+            new_data = {**data}
         self.filter_data(new_data)
         return new_data
 
     @pre_load
     def filter(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(data, Mapping):
+            # Invalid input type is reported by marshmallow
+            return data
         new_data = {**data}
         self.filter_data(new_data)
+        pool = self.pool
+        if pool is not None:
+            self._intern_data(new_data, pool)
         return new_data
 
     def filter_data(self, data: Dict[str, Any]):
-        data_class_fields = self._get_field()
-        for field in data_class_fields:
-            name = field.name
-            if name not in data:
-                continue
+        plan = self._get_field_plan()
+        for name in plan.lists:
+            if name in data:
+                data[name] = self._filter_list(data[name])
+        for name in plan.strings:
+            if name in data and data[name] == "":
+                # Replace empty string with None
+                data[name] = None
+
+    def _get_field_plan(self) -> _FieldPlan:
+        """
+        Get names of all fields, list fields and string fields of the
+        dataclass.
+
+        The result is cached for every dataclass, so that the dataclass is
+        only inspected once.
+
+        :return: Names of all fields, list fields and string fields
+        :rtype: _FieldPlan
+        :raises ValueError: if data_class is not a dataclass
+        """
+        data_class = self.data_class
+        plan = _FIELD_PLANS.get(data_class)
+        if plan is not None:
+            return plan
+        names = []
+        lists = []
+        strings = []
+        for field in self._get_field():
+            names.append(field.name)
             f_type = field.type
             origin = getattr(f_type, "__origin__", None)
             args = getattr(f_type, "__args__", ())
             if list in (f_type, origin):
-                data[name] = self._filter_list(data[name])
-            elif self._is_str(f_type, origin, args) and data[name] == "":
-                # Replace empty string with None
-                data[name] = None
+                lists.append(field.name)
+            elif self._is_str(f_type, origin, args):
+                strings.append(field.name)
+        plan = _FieldPlan(tuple(names), tuple(lists), tuple(strings))
+        _FIELD_PLANS[data_class] = plan
+        return plan
 
     @staticmethod
     def _is_str(f_type, origin, args) -> bool:
         return str in (f_type, origin) or str in args
 
     @staticmethod
-    def _filter_list(data: Optional[list]) -> list:
+    def _filter_list(data: Any) -> Any:
         if data is None:
             # Convert None to empty list for List field
             return []
+        if not isinstance(data, (list, tuple)):
+            # Invalid input type is reported by marshmallow
+            return data
         # Filter None and empty string in list
         return [value for value in data if value is not None and value != ""]
 
@@ -69,6 +175,128 @@ class DataClassSchema(Schema):
         # noinspection PyDataclass
         return fields(data_class)
 
+    def iter_load(self, data: Iterable[Any],
+                  errors: Optional[Dict[int, Any]] = None) -> Iterator[Any]:
+        """
+        Load records one by one, yielding a dataclass object for every valid
+        record.
+
+        Invalid records are skipped and their error messages are stored in
+        errors by index, like ``ValidationError.messages`` of ``many=True``.
+        If errors is not given, a :class:`marshmallow.ValidationError` with
+        the messages of all invalid records is raised after the last record.
+        Only one record is held in memory at a time.
+
+        **Example:**
+
+        .. code-block:: python
+
+            errors = {}
+            for episode in EpisodeSchema().iter_load(records, errors):
+                ...
+            errors # {3: {"rating": [...]}}
+
+        :param data: Records to load
+        :type data: Iterable[Any]
+        :param errors: Dictionary storing error messages of invalid records
+        :type errors: Optional[Dict[int, Any]]
+        :return: Dataclass objects of valid records
+        :rtype: Iterator[Any]
+        :raises marshmallow.ValidationError: after the last record, if
+            errors is not given and any record is invalid
+        """
+        messages = {} if errors is None else errors
+        load = self.load
+        for index, item in enumerate(data):
+            try:
+                obj = load(item, many=False)
+            except ValidationError as error:
+                messages[index] = error.messages
+                continue
+            yield obj
+        if errors is None and messages:
+            raise ValidationError(messages)
+
+    def iter_dump(self, objs: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Dump objects one by one.
+
+        :param objs: Objects to dump
+        :type objs: Iterable[Any]
+        :return: Dumped data of every object
+        :rtype: Iterator[Dict[str, Any]]
+        """
+        dump = self.dump
+        for obj in objs:
+            yield dump(obj, many=False)
+
+    def load_trusted(self, data: Any, many: Optional[bool] = None) -> Any:
+        """
+        Load known-good data without validation.
+
+        Only types are coerced, e.g. ISO date strings to :class:`date`,
+        plucked names to :class:`aliceplex.schema.model.Person` and nested
+        dictionaries to :class:`aliceplex.schema.model.Actor`. The list and
+        empty string cleanup of :meth:`filter_data` is still applied, unknown
+        keys are ignored. Use it for data dumped by this schema earlier,
+        invalid data is not detected and may produce invalid objects.
+
+        **Example:**
+
+        .. code-block:: python
+
+            show = ShowSchema().load_trusted({"title": "Title", ...})
+
+        :param data: Data to load
+        :type data: Any
+        :param many: Whether to load data as a collection, default to
+            ``many`` of the schema
+        :type many: Optional[bool]
+        :return: Dataclass object, or list of dataclass objects
+        :rtype: Any
+        """
+        if many is None:
+            many = self.many
+        if many:
+            return [self._load_trusted(item) for item in data]
+        return self._load_trusted(data)
+
+    def _load_trusted(self, data: Dict[str, Any]) -> Any:
+        converters = self._trusted_converters
+        if converters is None:
+            converters = self._get_trusted_converters()
+            self._trusted_converters = converters
+        data = {**data}
+        self.filter_data(data)
+        pool = self.pool
+        if pool is not None:
+            self._intern_data(data, pool)
+        result = {}
+        for key, attr, converter in converters:
+            if key in data:
+                value = data[key]
+                if value is not None and converter is not None:
+                    value = converter(value)
+                result[attr] = value
+        obj = self.model_class(**result)
+        return obj if pool is None else pool.intern(obj)
+
+    def _get_trusted_converters(
+            self
+    ) -> List[Tuple[str, str, Optional[_Converter]]]:
+        """
+        Get data key, attribute name and converter of every loaded field.
+
+        :return: Data key, attribute name and converter of fields
+        :rtype: List[Tuple[str, str, Optional[_Converter]]]
+        """
+        return [
+            (field.data_key or name, field.attribute or name,
+             _trusted_converter(field))
+            for name, field in self.fields.items()
+            if not field.dump_only
+        ]
+
     @post_load
     def post_load(self, data) -> Any:
         """
@@ -79,8 +307,38 @@ class DataClassSchema(Schema):
         :return: Dataclass
         :rtype: Any
         """
+        model_class = self.model_class
+        obj = model_class(**data)
+        pool = self.pool
+        return obj if pool is None else pool.intern(obj)
+
+    def _intern_data(self, data: Dict[str, Any], pool: InternPool):
+        plan = self._get_field_plan()
+        pool.intern_data(data, plan.strings + plan.lists)
+
+    @property
+    def pool(self) -> Optional[InternPool]:
+        """
+        Provide the pool of loaded strings and objects, if any.
+
+        :return: Pool
+        :rtype: Optional[InternPool]
+        """
+        return self.context.get("pool")
+
+    @property
+    def model_class(self) -> type:
+        """
+        Provide the class of loaded objects, which is the slotted variant of
+        :attr:`data_class` if the ``slots`` option is set.
+
+        :return: Dataclass
+        :rtype: type
+        """
         data_class = self.data_class
-        return data_class(**data)
+        if self.context.get("slots", False):
+            return slotted(data_class)
+        return data_class
 
     @property
     def data_class(self) -> type:
@@ -91,3 +349,73 @@ class DataClassSchema(Schema):
         :rtype: type
         """
         raise NotImplementedError()
+
+
+def _trusted_converter(field: ma_fields.Field) -> Optional[_Converter]:
+    """
+    Get the function coercing a non-None value of the field without
+    validation.
+
+    :param field: Schema field
+    :type field: ma_fields.Field
+    :return: Converter, or None if the value is used as is
+    :rtype: Optional[_Converter]
+    """
+    # pylint: disable=too-many-return-statements
+    if isinstance(field, ma_fields.String):
+        return None
+    if isinstance(field, (ma_fields.Date, ma_fields.DateTime)) and \
+            field.format in (None, "iso", "iso8601"):
+        parse = _parse_date if isinstance(field, ma_fields.Date) \
+            else _parse_datetime
+        return parse
+    if isinstance(field, ma_fields.Float):
+        return float
+    if isinstance(field, ma_fields.Integer):
+        return int
+    if isinstance(field, ma_fields.List):
+        convert = _trusted_converter(list_inner(field))
+        if convert is None:
+            return list
+        return lambda value: [convert(item) if item is not None else None
+                              for item in value]
+    if isinstance(field, ma_fields.Nested) and \
+            isinstance(field.schema, DataClassSchema):
+        return _nested_converter(field)
+    if isinstance(field, ma_fields.Dict):
+        keys, values = dict_fields(field)
+        convert_key = _trusted_converter(keys) if keys else None
+        convert_value = _trusted_converter(values) if values else None
+        return lambda value: {
+            (k if convert_key is None or k is None else convert_key(k)):
+                (v if convert_value is None or v is None else convert_value(v))
+            for k, v in value.items()
+        }
+    # Other fields are deserialized by marshmallow
+    return field.deserialize
+
+
+def _nested_converter(field: ma_fields.Nested) -> _Converter:
+    schema = field.schema
+    many = field.many
+    if isinstance(field, ma_fields.Pluck):
+        only_field = schema.fields[field.field_name]
+        key = only_field.data_key or field.field_name
+        if many:
+            return lambda value: schema.load_trusted(
+                [{key: item} for item in value], many=True
+            )
+        return lambda value: schema.load_trusted({key: value}, many=False)
+    return lambda value: schema.load_trusted(value, many=many)
+
+
+def _parse_date(value: Any) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def _parse_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
@@ -0,0 +1,160 @@
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, \
+    Type, Union
+
+from marshmallow import ValidationError
+
+from aliceplex.schema.parallel import map_chunks
+from aliceplex.schema.schema.base import DataClassSchema
+from aliceplex.schema.schema.compiler import CompiledSchema, compile_schema
+from aliceplex.schema.schema.registry import get_schema
+
+__all__ = ["BulkResult", "bulk_dump", "bulk_load"]
+
+# Minimum number of records before worker processes are started. Smaller
+# batches are faster in process than paying for process startup and
+# pickling.
+_PARALLEL_THRESHOLD = 2000
+
+# Schema of the current worker process, created once by _init_worker
+_WORKER: Dict[str, Union[CompiledSchema, DataClassSchema]] = {}
+
+
+class BulkResult(NamedTuple):
+    """
+    Result of :func:`bulk_load`.
+    """
+    #: Loaded object of every record in input order, None if invalid
+    results: List[Any]
+    #: Error messages of invalid records by index
+    errors: Dict[int, Any]
+
+
+def bulk_load(schema_class: Type[DataClassSchema],
+              records: Iterable[Any],
+              workers: Optional[int] = None,
+              chunksize: int = 500,
+              **options) -> BulkResult:
+    """
+    Load many records in worker processes.
+
+    Records are sent to the workers in chunks. Every worker creates the
+    schema once, compiled with
+    :func:`aliceplex.schema.schema.compiler.compile_schema` when possible.
+    Invalid records do not stop loading, their error messages are returned
+    by index. Small batches are loaded in process.
+
+    **Example:**
+
+    .. code-block:: python
+
+        result = bulk_load(MovieSchema, records, workers=8)
+        result.results # [Movie(...), None, ...]
+        result.errors # {1: {"rating": [...]}}
+
+    :param schema_class: Schema class, it must be importable by the workers
+    :type schema_class: Type[DataClassSchema]
+    :param records: Records to load
+    :type records: Iterable[Any]
+    :param workers: Number of worker processes, default to number of CPUs,
+        ``1`` to always load in process
+    :type workers: Optional[int]
+    :param chunksize: Number of records sent to a worker at once
+    :type chunksize: int
+    :param options: Picklable keyword arguments of the schema, e.g.
+        ``slots=True``
+    :return: Loaded objects and error messages
+    :rtype: BulkResult
+    """
+    # pylint: disable=too-many-locals
+    iterator = iter(records)
+    head = list(islice(iterator, _PARALLEL_THRESHOLD))
+    if workers == 1 or len(head) < _PARALLEL_THRESHOLD:
+        schema = _create_schema(schema_class, options)
+        results, errors = _load_records(schema, chain(head, iterator))
+        return BulkResult(results, errors)
+    iterator = chain(head, iterator)
+    del head
+    results = []
+    errors = {}
+    chunks = map_chunks(_load_chunk, iterator, workers, chunksize,
+                        _init_worker, (schema_class, options))
+    for chunk_results, chunk_errors in chunks:
+        offset = len(results)
+        results.extend(chunk_results)
+        for index, messages in chunk_errors.items():
+            errors[offset + index] = messages
+    return BulkResult(results, errors)
+
+
+def bulk_dump(schema_class: Type[DataClassSchema],
+              objs: Iterable[Any],
+              workers: Optional[int] = None,
+              chunksize: int = 500,
+              **options) -> List[Dict[str, Any]]:
+    """
+    Dump many objects in worker processes.
+
+    :param schema_class: Schema class, it must be importable by the workers
+    :type schema_class: Type[DataClassSchema]
+    :param objs: Objects to dump
+    :type objs: Iterable[Any]
+    :param workers: Number of worker processes, default to number of CPUs,
+        ``1`` to always dump in process
+    :type workers: Optional[int]
+    :param chunksize: Number of objects sent to a worker at once
+    :type chunksize: int
+    :param options: Picklable keyword arguments of the schema
+    :return: Dumped data in input order
+    :rtype: List[Dict[str, Any]]
+    """
+    iterator = iter(objs)
+    head = list(islice(iterator, _PARALLEL_THRESHOLD))
+    if workers == 1 or len(head) < _PARALLEL_THRESHOLD:
+        schema = _create_schema(schema_class, options)
+        return [schema.dump(obj, many=False) for obj in chain(head, iterator)]
+    iterator = chain(head, iterator)
+    del head
+    chunks = map_chunks(_dump_chunk, iterator, workers, chunksize,
+                        _init_worker, (schema_class, options))
+    return list(chain.from_iterable(chunks))
+
+
+def _create_schema(
+        schema_class: Type[DataClassSchema],
+        options: Dict[str, Any]
+) -> Union[CompiledSchema, DataClassSchema]:
+    schema = get_schema(schema_class, **options)
+    try:
+        return compile_schema(schema)
+    except ValueError:
+        return schema
+
+
+def _init_worker(schema_class: Type[DataClassSchema],
+                 options: Dict[str, Any]):
+    _WORKER["schema"] = _create_schema(schema_class, options)
+
+
+def _load_records(
+        schema: Union[CompiledSchema, DataClassSchema],
+        records: Iterable[Any]
+) -> Tuple[List[Any], Dict[int, Any]]:
+    results = []
+    errors = {}
+    for index, record in enumerate(records):
+        try:
+            results.append(schema.load(record, many=False))
+        except ValidationError as error:
+            results.append(None)
+            errors[index] = error.messages
+    return results, errors
+
+
+def _load_chunk(records: List[Any]) -> Tuple[List[Any], Dict[int, Any]]:
+    return _load_records(_WORKER["schema"], records)
+
+
+def _dump_chunk(objs: List[Any]) -> List[Dict[str, Any]]:
+    schema = _WORKER["schema"]
+    return [schema.dump(obj, many=False) for obj in objs]
@@ -0,0 +1,180 @@
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple
+
+from marshmallow import fields
+
+__all__ = ["CodeGenerator", "dict_fields", "indent", "list_inner"]
+
+
+class CodeGenerator:
+    """
+    Base of the generators of specialized functions for schemas, such as
+    :class:`aliceplex.schema.schema.compiler.CompiledSchema`.
+
+    Generated functions are collected as source lines, and the values they
+    use as constants of a namespace. Every schema, including nested
+    schemas, gets a pair of functions generated by :meth:`generate`, named
+    after :attr:`prefixes`.
+    """
+
+    #: Name prefixes of the pair of functions of a schema
+    prefixes: Tuple[str, str] = ("load", "dump")
+
+    def __init__(self, namespace: Optional[Dict[str, Any]] = None):
+        """
+        :param namespace: Initial namespace of the generated code
+        :type namespace: Optional[Dict[str, Any]]
+        """
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {**(namespace or {})}
+        self._counter = 0
+        self._schemas: Dict[int, Tuple[str, str]] = {}
+
+    def constant(self, value: Any, prefix: str) -> str:
+        """
+        Add a constant to the namespace of the generated code.
+
+        :param value: Constant value
+        :type value: Any
+        :param prefix: Prefix of the generated name
+        :type prefix: str
+        :return: Name of the constant
+        :rtype: str
+        """
+        name = f"_{self.variable(prefix)}"
+        self.namespace[name] = value
+        return name
+
+    def variable(self, prefix: str) -> str:
+        """
+        Get a unique variable name, e.g. of a comprehension.
+
+        :param prefix: Prefix of the generated name
+        :type prefix: str
+        :return: Variable name
+        :rtype: str
+        """
+        self._counter += 1
+        return f"{prefix}_{self._counter}"
+
+    def schema(self, schema: Any) -> Tuple[str, str]:
+        """
+        Generate the pair of functions of a schema, once for every schema.
+
+        :param schema: Schema
+        :type schema: DataClassSchema
+        :return: Names of the functions
+        :rtype: Tuple[str, str]
+        :raises ValueError: if the schema is not supported
+        """
+        names = self._schemas.get(id(schema))
+        if names is not None:
+            return names
+        self.check(schema)
+        first, second = self.prefixes
+        names = (self.constant(None, first), self.constant(None, second))
+        # Register before generating, so that recursive schemas terminate
+        self._schemas[id(schema)] = names
+        self.generate(schema, *names)
+        return names
+
+    def check(self, schema: Any):
+        """
+        Check if the schema is supported.
+
+        :param schema: Schema
+        :type schema: DataClassSchema
+        :raises ValueError: if the schema is not supported
+        """
+
+    def generate(self, schema: Any, first: str, second: str):
+        """
+        Generate the pair of functions of a schema.
+
+        :param schema: Schema
+        :type schema: DataClassSchema
+        :param first: Name of the first function
+        :type first: str
+        :param second: Name of the second function
+        :type second: str
+        """
+        raise NotImplementedError()
+
+    def function(self, name: str, argument: str, body: List[str]):
+        """
+        Add a function of a single argument.
+
+        :param name: Function name
+        :type name: str
+        :param argument: Argument name
+        :type argument: str
+        :param body: Statements of the function
+        :type body: List[str]
+        """
+        self.lines.append(f"def {name}({argument}):")
+        self.lines += indent(body)
+        self.lines.append("")
+
+    @property
+    def source(self) -> str:
+        """
+        Provide the generated source.
+
+        :return: Source code
+        :rtype: str
+        """
+        return "\n".join(self.lines)
+
+    def compile(self, label: str) -> CodeType:
+        """
+        Compile the generated source.
+
+        :param label: Label of the code in tracebacks
+        :type label: str
+        :return: Code object
+        :rtype: CodeType
+        """
+        return compile(self.source, f"<{label}>", "exec")
+
+
+def indent(lines: List[str]) -> List[str]:
+    """
+    Indent statements by one level.
+
+    :param lines: Statements
+    :type lines: List[str]
+    :return: Indented statements
+    :rtype: List[str]
+    """
+    return ["    " + line for line in lines]
+
+
+def list_inner(field: fields.List) -> fields.Field:
+    """
+    Get the item field of a list field, ``inner`` or ``container`` depending
+    on the version of marshmallow.
+
+    :param field: List field
+    :type field: fields.List
+    :return: Item field
+    :rtype: fields.Field
+    """
+    inner = getattr(field, "inner", None)
+    return inner if inner is not None else field.container
+
+
+def dict_fields(
+        field: fields.Dict
+) -> Tuple[Optional[fields.Field], Optional[fields.Field]]:
+    """
+    Get the key and value fields of a dict field, named differently
+    depending on the version of marshmallow.
+
+    :param field: Dict field
+    :type field: fields.Dict
+    :return: Key and value field, None if not set
+    :rtype: Tuple[Optional[fields.Field], Optional[fields.Field]]
+    """
+    if hasattr(field, "key_field"):
+        return field.key_field, field.value_field
+    return field.key_container, field.value_container
@@ -0,0 +1,400 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from marshmallow import EXCLUDE, INCLUDE, fields, missing
+
+from aliceplex.schema.schema.base import DataClassSchema
+from aliceplex.schema.schema.codegen import CodeGenerator, indent, \
+    list_inner
+from aliceplex.schema.schema.registry import get_schema
+
+__all__ = ["CompiledSchema", "compile_schema"]
+
+# Hooks which are defined by DataClassSchema and understood by the compiler
+_HOOKS = ("convert", "filter", "post_load")
+
+
+class _Fallback(Exception):
+    """
+    Raised by generated code when the input needs the generic schema.
+    """
+
+
+class _Generator(CodeGenerator):
+    """
+    Generate the source code of specialized load and dump functions.
+
+    Every schema, including nested schemas, gets a pair of functions. The
+    generated functions only handle the common case, any unexpected input
+    raises an exception, so that the caller can fall back to marshmallow.
+    """
+
+    def __init__(self):
+        super().__init__({
+            "missing": missing,
+            "_Fallback": _Fallback,
+            "_filter_list": DataClassSchema._filter_list
+        })
+
+    def check(self, schema: DataClassSchema):
+        _check_schema(schema)
+
+    def generate(self, schema: DataClassSchema, first: str, second: str):
+        self._load(schema, first)
+        self._dump(schema, second)
+
+    def _load(self, schema: DataClassSchema, name: str):
+        # pylint: disable=too-many-locals
+        plan = schema._get_field_plan()  # pylint: disable=protected-access
+        body = ["data = {**data}"]
+        body += _filter_lines(plan)
+        pool = schema.pool
+        if pool is not None:
+            pool_name = self.constant(pool, "pool")
+            pooled = pool.field_names.intersection(plan.strings + plan.lists)
+            if pooled:
+                names = self.constant(tuple(sorted(pooled)), "names")
+                body.append(f"{pool_name}.intern_data(data, {names})")
+        body.append("result = {}")
+        known = set()
+        for attr_name, field in schema.fields.items():
+            if field.dump_only:
+                continue
+            key = field.data_key or attr_name
+            target = field.attribute or attr_name
+            known.add(key)
+            steps = self._load_steps(field)
+            if steps is None or field.missing is not missing:
+                field_name = self.constant(field, "field")
+                body += [
+                    f"value = {field_name}.deserialize("
+                    f"data.get({key!r}, missing), {key!r}, data)",
+                    "if value is not missing:",
+                    f"    result[{target!r}] = value"
+                ]
+                continue
+            body += [
+                f"value = data.get({key!r}, missing)",
+                "if value is not missing:"
+            ]
+            body += indent(steps)
+            body.append(f"    result[{target!r}] = value")
+            if field.required:
+                body += ["else:", "    raise _Fallback"]
+        if schema.unknown == INCLUDE:
+            known_name = self.constant(frozenset(known), "known")
+            body += [
+                f"for key in data.keys() - {known_name}:",
+                "    result[key] = data[key]"
+            ]
+        elif schema.unknown != EXCLUDE:
+            known_name = self.constant(frozenset(known), "known")
+            body += [
+                f"if not {known_name}.issuperset(data):",
+                "    raise _Fallback"
+            ]
+        class_name = self.constant(schema.model_class, "class")
+        if pool is None:
+            body.append(f"return {class_name}(**result)")
+        else:
+            body.append(f"return {pool_name}.intern({class_name}(**result))")
+        self.function(name, "data", body)
+
+    def _dump(self, schema: DataClassSchema, name: str):
+        plan = schema._get_field_plan()  # pylint: disable=protected-access
+        class_name = self.constant(schema.model_class, "class")
+        body = [
+            f"if type(obj) is not {class_name}:",
+            "    raise _Fallback",
+            "data = {"
+        ]
+        body += [f"    {field!r}: obj.{field}," for field in plan.names]
+        body.append("}")
+        body += _filter_lines(plan)
+        body.append("result = {}")
+        accessor = self.constant(schema.get_attribute, "accessor")
+        for attr_name, field in schema.fields.items():
+            if field.load_only:
+                continue
+            key = field.data_key or attr_name
+            source = field.attribute or attr_name
+            steps = self._dump_steps(field)
+            if (steps is None or source not in plan.names or
+                    field.attribute is not None):
+                field_name = self.constant(field, "field")
+                body += [
+                    f"value = {field_name}.serialize("
+                    f"{attr_name!r}, data, accessor={accessor})",
+                    "if value is not missing:",
+                    f"    result[{key!r}] = value"
+                ]
+                continue
+            body.append(f"value = data[{source!r}]")
+            body += steps
+            body.append(f"result[{key!r}] = value")
+        if schema.dict_class is dict:
+            body.append("return result")
+        else:
+            dict_name = self.constant(schema.dict_class, "dict")
+            body.append(f"return {dict_name}(result)")
+        self.function(name, "obj", body)
+
+    def _load_steps(self, field: fields.Field) -> Optional[List[str]]:
+        """
+        Generate statements which deserialize and validate ``value``.
+
+        :param field: Field to deserialize
+        :type field: fields.Field
+        :return: Statements, or None if the field is not supported
+        :rtype: Optional[List[str]]
+        """
+        field_type = type(field)
+        if field_type is fields.String:
+            steps = ["if type(value) is not str:", "    raise _Fallback"]
+        elif field_type is fields.List:
+            inner = list_inner(field)
+            inner_steps = self._load_steps(inner)
+            if inner_steps is None:
+                return None
+            convert = self._converter(inner_steps)
+            steps = [
+                "if type(value) is not list:",
+                "    raise _Fallback",
+                f"value = [{convert}(item) for item in value]"
+            ]
+        elif field_type in (fields.Nested, fields.Pluck):
+            names = self._nested(field)
+            if names is None:
+                return None
+            load_name, _ = names
+            steps = []
+            if field_type is fields.Pluck:
+                key = _pluck_key(field)
+                steps.append(f"value = {load_name}({{{key!r}: value}})")
+            else:
+                steps += [
+                    "if type(value) is not dict:",
+                    "    raise _Fallback",
+                    f"value = {load_name}(value)"
+                ]
+        else:
+            return None
+        for validator in field.validators:
+            validator_name = self.constant(validator, "validator")
+            steps += [
+                f"if {validator_name}(value) is False:",
+                "    raise _Fallback"
+            ]
+        return [
+            "if value is None:",
+            "    pass" if field.allow_none else "    raise _Fallback",
+            "else:"
+        ] + indent(steps)
+
+    def _dump_steps(self, field: fields.Field) -> Optional[List[str]]:
+        """
+        Generate statements which serialize ``value``.
+
+        :param field: Field to serialize
+        :type field: fields.Field
+        :return: Statements, or None if the field is not supported
+        :rtype: Optional[List[str]]
+        """
+        field_type = type(field)
+        if field_type is fields.String:
+            steps = ["if type(value) is not str:", "    raise _Fallback"]
+        elif field_type is fields.List:
+            inner_steps = self._dump_steps(list_inner(field))
+            if inner_steps is None:
+                return None
+            convert = self._converter(inner_steps)
+            steps = [
+                "if type(value) is not list:",
+                "    raise _Fallback",
+                f"value = [{convert}(item) for item in value]"
+            ]
+        elif field_type in (fields.Nested, fields.Pluck):
+            names = self._nested(field)
+            if names is None:
+                return None
+            _, dump_name = names
+            if field_type is fields.Pluck:
+                key = _pluck_key(field)
+                steps = [f"value = {dump_name}(value)[{key!r}]"]
+            else:
+                steps = [f"value = {dump_name}(value)"]
+        else:
+            return None
+        return ["if value is not None:"] + indent(steps)
+
+    def _nested(self, field: fields.Nested) -> Optional[Tuple[str, str]]:
+        if (field.many or getattr(field, "unknown", None) is not None or
+                not isinstance(field.schema, DataClassSchema)):
+            return None
+        try:
+            return self.schema(field.schema)
+        except ValueError:
+            # Nested schema is handled by marshmallow
+            return None
+
+    def _converter(self, steps: List[str]) -> str:
+        name = self.constant(None, "convert")
+        self.function(name, "value", steps + ["return value"])
+        return name
+
+
+class CompiledSchema:
+    """
+    Specialized load and dump functions of a :class:`DataClassSchema`.
+
+    The functions are generated once from the fields of the schema and skip
+    marshmallow's generic field dispatch and hook processing for the common
+    case. Whenever the input is not handled by the generated code, or fails
+    validation, the original schema is used, so that the result and the
+    raised :class:`marshmallow.ValidationError` are identical to those of
+    the schema.
+
+    **Example:**
+
+    .. code-block:: python
+
+        compiled = compile_schema(ShowStrictSchema())
+        show = compiled.load({"title": "Title", ...})
+        data = compiled.dump(show)
+
+    :param schema: Schema to compile
+    :type schema: DataClassSchema
+    :raises ValueError: if the schema cannot be compiled
+    """
+
+    def __init__(self, schema: DataClassSchema):
+        generator = _Generator()
+        load_name, dump_name = generator.schema(schema)
+        self.schema = schema
+        self.source = generator.source
+        namespace = generator.namespace
+        code = generator.compile(f"compiled {type(schema).__name__}")
+        # pylint: disable=exec-used
+        exec(code, namespace)
+        self._load: Callable[[Any], Any] = namespace[load_name]
+        self._dump: Callable[[Any], Dict[str, Any]] = namespace[dump_name]
+
+    def load(self, data: Any, many: Optional[bool] = None) -> Any:
+        """
+        Deserialize data to dataclass object, same as
+        :meth:`marshmallow.Schema.load`.
+
+        :param data: Data to deserialize
+        :type data: Any
+        :param many: Whether to deserialize data as a collection, default to
+            ``many`` of the schema
+        :type many: Optional[bool]
+        :return: Dataclass object, or list of dataclass objects
+        :rtype: Any
+        :raises marshmallow.ValidationError: if data is invalid
+        """
+        many = self.schema.many if many is None else bool(many)
+        # pylint: disable=broad-except
+        try:
+            if not many:
+                return self._load(data)
+            if isinstance(data, list):
+                load = self._load
+                return [load(item) for item in data]
+        except Exception:
+            pass
+        return self.schema.load(data, many=many)
+
+    def dump(self, obj: Any, many: Optional[bool] = None) -> Any:
+        """
+        Serialize dataclass object, same as :meth:`marshmallow.Schema.dump`.
+
+        :param obj: Object to serialize
+        :type obj: Any
+        :param many: Whether to serialize obj as a collection, default to
+            ``many`` of the schema
+        :type many: Optional[bool]
+        :return: Serialized data
+        :rtype: Any
+        """
+        many = self.schema.many if many is None else bool(many)
+        # pylint: disable=broad-except
+        try:
+            if not many:
+                return self._dump(obj)
+            if isinstance(obj, list):
+                dump = self._dump
+                return [dump(item) for item in obj]
+        except Exception:
+            pass
+        return self.schema.dump(obj, many=many)
+
+
+def compile_schema(
+        schema: Union[DataClassSchema, Type[DataClassSchema]]
+) -> CompiledSchema:
+    """
+    Compile a schema to specialized load and dump functions.
+
+    **Example:**
+
+    .. code-block:: python
+
+        compiled = compile_schema(EpisodeSchema)
+        episodes = compiled.load(records, many=True)
+
+    :param schema: Schema, or schema class whose cached instance of
+        :func:`aliceplex.schema.schema.registry.get_schema` is compiled
+    :type schema: Union[DataClassSchema, Type[DataClassSchema]]
+    :return: Compiled schema
+    :rtype: CompiledSchema
+    :raises ValueError: if the schema has hooks or validators which are not
+        defined by :class:`DataClassSchema`
+    """
+    if isinstance(schema, type):
+        schema = get_schema(schema)
+    return CompiledSchema(schema)
+
+
+def _check_schema(schema: DataClassSchema):
+    if not isinstance(schema, DataClassSchema):
+        raise ValueError("Only DataClassSchema can be compiled")
+    if schema.partial:
+        raise ValueError("Partial schema cannot be compiled")
+    schema_class = type(schema)
+    for name in dir(schema_class):
+        attr = getattr(schema_class, name, None)
+        if not hasattr(attr, "__marshmallow_hook__"):
+            continue
+        if name not in _HOOKS or attr is not getattr(DataClassSchema, name):
+            raise ValueError(
+                f"{schema_class.__name__}.{name} cannot be compiled"
+            )
+    for field in schema.fields.values():
+        if "." in (field.attribute or ""):
+            raise ValueError(
+                f"{schema_class.__name__} has dotted attribute "
+                f"{field.attribute}"
+            )
+
+
+def _filter_lines(plan) -> List[str]:
+    """
+    Generate statements equivalent to :meth:`DataClassSchema.filter_data`.
+    """
+    lines = []
+    for name in plan.lists:
+        lines += [
+            f"if {name!r} in data:",
+            f"    data[{name!r}] = _filter_list(data[{name!r}])"
+        ]
+    for name in plan.strings:
+        lines += [
+            f"if {name!r} in data and data[{name!r}] == \"\":",
+            f"    data[{name!r}] = None"
+        ]
+    return lines
+
+
+def _pluck_key(field: fields.Pluck) -> str:
+    only_field = field.schema.fields[field.field_name]
+    return only_field.data_key or field.field_name
@@ -0,0 +1,102 @@
+from threading import Lock
+from typing import Any, Dict, Hashable, Tuple, Type, TypeVar
+
+from aliceplex.schema.schema.base import DataClassSchema
+
+__all__ = ["clear_schemas", "get_schema"]
+
+S = TypeVar("S", bound=DataClassSchema)
+
+# Cached schema instances by schema class and frozen options
+_SCHEMAS: Dict[Tuple[type, Hashable], DataClassSchema] = {}
+_LOCK = Lock()
+
+
+def get_schema(schema_class: Type[S], **options) -> S:
+    """
+    Get a cached schema instance.
+
+    Creating a marshmallow schema deep-copies and binds all of its fields,
+    and nested schemas are created again for every new schema, so reuse
+    schema instances instead of creating one for every call. One instance is
+    created for every schema class and combination of options, and shared by
+    every caller in the process.
+
+    Thread safety:
+
+    * ``get_schema`` is safe to call from any thread. Concurrent calls with
+      the same schema class and options get the same instance, the schema is
+      only created once.
+    * ``load``, ``dump``, ``iter_load``, ``iter_dump`` and ``load_trusted``
+      of the returned schema are safe to call concurrently, they keep their
+      state in local variables. Nested schemas and converters are created
+      lazily on first use, concurrent first uses may create them twice but
+      always get equal results.
+    * The returned schema is shared, so it must not be modified: do not
+      assign ``many``, ``only``, ``context`` or fields of it, and do not
+      update its ``context``. Pass the options to ``get_schema`` instead.
+    * An :class:`aliceplex.schema.pool.InternPool` passed as ``pool`` is
+      shared by every caller with the same options, it is thread-safe.
+
+    **Example:**
+
+    .. code-block:: python
+
+        schema = get_schema(ShowStrictSchema, many=True)
+        schema is get_schema(ShowStrictSchema, many=True) # True
+        shows = schema.load(records)
+
+    :param schema_class: Schema class
+    :type schema_class: Type[S]
+    :param options: Keyword arguments of the schema, e.g. ``many=True``,
+        ``only=("title",)`` or ``slots=True``. Lists and sets are compared
+        by value.
+    :return: Cached schema
+    :rtype: S
+    :raises ValueError: if an option cannot be used as a cache key, e.g.
+        ``context``
+    """
+    key = (schema_class, _freeze(options))
+    schema = _SCHEMAS.get(key)
+    if schema is not None:
+        return schema
+    with _LOCK:
+        schema = _SCHEMAS.get(key)
+        if schema is None:
+            schema = schema_class(**options)
+            _SCHEMAS[key] = schema
+    return schema
+
+
+def clear_schemas():
+    """
+    Clear cached schemas of :func:`get_schema`.
+
+    Schemas already returned are not affected.
+    """
+    with _LOCK:
+        _SCHEMAS.clear()
+
+
+def _freeze(options: Dict[str, Any]) -> Hashable:
+    """
+    Convert options to a hashable cache key.
+
+    :param options: Keyword arguments of the schema
+    :type options: Dict[str, Any]
+    :return: Cache key
+    :rtype: Hashable
+    :raises ValueError: if an option cannot be hashed
+    """
+    items = []
+    for name, value in sorted(options.items()):
+        if isinstance(value, (list, tuple)):
+            value = tuple(value)
+        elif isinstance(value, (set, frozenset)):
+            value = frozenset(value)
+        try:
+            hash(value)
+        except TypeError:
+            raise ValueError(f"Option {name} cannot be cached") from None
+        items.append((name, value))
+    return tuple(items)
@@ -0,0 +1,800 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import fields, is_dataclass
+from datetime import date
+from itertools import accumulate, compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, \
+    Union
+
+from aliceplex.schema.model import Person, slotted
+
+__all__ = [
+    "Column", "DateColumn", "FloatColumn", "ObjectColumn", "PersonListColumn",
+    "Row", "StringColumn", "StringListColumn", "Table", "mask_and",
+    "mask_not", "mask_or"
+]
+
+
+def mask_and(*masks: bytes) -> bytearray:
+    """
+    Combine masks, keeping rows selected by all of them.
+
+    A mask has one byte per row, ``1`` for selected rows and ``0`` for other
+    rows.
+
+    :param masks: Masks of the same length
+    :type masks: bytes
+    :return: Combined mask
+    :rtype: bytearray
+    """
+    length = len(masks[0])
+    result = int.from_bytes(masks[0], "little")
+    for mask in masks[1:]:
+        result &= int.from_bytes(mask, "little")
+    return bytearray(result.to_bytes(length, "little"))
+
+
+def mask_or(*masks: bytes) -> bytearray:
+    """
+    Combine masks, keeping rows selected by any of them.
+
+    :param masks: Masks of the same length
+    :type masks: bytes
+    :return: Combined mask
+    :rtype: bytearray
+    """
+    length = len(masks[0])
+    result = int.from_bytes(masks[0], "little")
+    for mask in masks[1:]:
+        result |= int.from_bytes(mask, "little")
+    return bytearray(result.to_bytes(length, "little"))
+
+
+def mask_not(mask: bytes) -> bytearray:
+    """
+    Invert a mask.
+
+    :param mask: Mask
+    :type mask: bytes
+    :return: Inverted mask
+    :rtype: bytearray
+    """
+    return bytearray(mask.translate(_INVERT))
+
+
+_INVERT = bytes([1, 0]) + bytes(254)
+_NoneType = type(None)
+
+
+class Column:
+    """
+    Column of a :class:`Table`.
+
+    :param name: Field name
+    :type name: str
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __len__(self) -> int:
+        raise NotImplementedError()
+
+    def __getitem__(self, index: int) -> Any:
+        raise NotImplementedError()
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[index] for index in range(len(self)))
+
+    def append(self, value: Any):
+        """
+        Append the value of a row.
+
+        :param value: Value of the field, or its dumped value
+        :type value: Any
+        """
+        raise NotImplementedError()
+
+    def take(self, mask: bytes) -> "Column":
+        """
+        Get a column of the selected rows.
+
+        :param mask: Selected rows
+        :type mask: bytes
+        :return: New column
+        :rtype: Column
+        """
+        raise NotImplementedError()
+
+    def valid(self) -> bytearray:
+        """
+        Get the mask of rows having a value.
+
+        :return: Mask of rows which are not None
+        :rtype: bytearray
+        """
+        return bytearray(value is not None for value in self)
+
+
+class _MaskedColumn(Column):
+    """
+    Column of numbers in an array, with a validity mask.
+
+    A sorted index of valid rows is created on the first :meth:`between`,
+    so that range filters only visit the selected rows.
+    """
+    typecode = "d"
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.values = array(self.typecode)
+        self.mask = bytearray()
+        self._order: Optional[array] = None
+        self._sorted: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def __getitem__(self, index: int) -> Any:
+        if not self.mask[index]:
+            return None
+        return self._decode(self.values[index])
+
+    def append(self, value: Any):
+        if value is None:
+            self.values.append(0)
+            self.mask.append(0)
+        else:
+            self.values.append(self._encode(value))
+            self.mask.append(1)
+        self._order = None
+
+    def take(self, mask: bytes) -> "_MaskedColumn":
+        column = type(self)(self.name)
+        column.values = array(self.typecode, compress(self.values, mask))
+        column.mask = bytearray(compress(self.mask, mask))
+        return column
+
+    def valid(self) -> bytearray:
+        return bytearray(self.mask)
+
+    def between(self, low: Any = None, high: Any = None) -> bytearray:
+        """
+        Get the mask of rows with value between low and high, inclusively.
+
+        :param low: Lower bound, or None for no lower bound
+        :type low: Any
+        :param high: Upper bound, or None for no upper bound
+        :type high: Any
+        :return: Mask of rows
+        :rtype: bytearray
+        """
+        order, sorted_values = self._sorted_index()
+        start = 0
+        end = len(order)
+        if low is not None:
+            start = bisect_left(sorted_values, self._encode(low))
+        if high is not None:
+            end = bisect_right(sorted_values, self._encode(high))
+        mask = bytearray(len(self))
+        for index in order[start:end]:
+            mask[index] = 1
+        return mask
+
+    def count(self, mask: Optional[bytes] = None) -> int:
+        """
+        Count rows having a value.
+
+        :param mask: Selected rows, default to all rows
+        :type mask: Optional[bytes]
+        :return: Number of rows
+        :rtype: int
+        """
+        return self._selected(mask).count(1)
+
+    def min(self, mask: Optional[bytes] = None) -> Any:
+        """
+        Get the minimum value.
+
+        :param mask: Selected rows, default to all rows
+        :type mask: Optional[bytes]
+        :return: Minimum value, or None if there is no value
+        :rtype: Any
+        """
+        value = min(compress(self.values, self._selected(mask)), default=None)
+        return None if value is None else self._decode(value)
+
+    def max(self, mask: Optional[bytes] = None) -> Any:
+        """
+        Get the maximum value.
+
+        :param mask: Selected rows, default to all rows
+        :type mask: Optional[bytes]
+        :return: Maximum value, or None if there is no value
+        :rtype: Any
+        """
+        value = max(compress(self.values, self._selected(mask)), default=None)
+        return None if value is None else self._decode(value)
+
+    def _sorted_index(self) -> Tuple[array, array]:
+        """
+        Get indexes of valid rows sorted by value, and the sorted values.
+        """
+        if self._order is None:
+            values = self.values
+            order = sorted(compress(range(len(values)), self.mask),
+                           key=values.__getitem__)
+            self._order = array("L", order)
+            self._sorted = array(self.typecode, map(values.__getitem__, order))
+        return self._order, self._sorted
+
+    def _selected(self, mask: Optional[bytes]) -> bytes:
+        if mask is None:
+            return self.mask
+        return mask_and(self.mask, mask)
+
+    def _encode(self, value: Any) -> Any:
+        raise NotImplementedError()
+
+    def _decode(self, value: Any) -> Any:
+        raise NotImplementedError()
+
+
+class FloatColumn(_MaskedColumn):
+    """
+    Column of optional floats, such as ``rating``, stored in ``array("d")``
+    with a validity mask.
+    """
+    typecode = "d"
+
+    def sum(self, mask: Optional[bytes] = None) -> float:
+        """
+        Sum values.
+
+        :param mask: Selected rows, default to all rows
+        :type mask: Optional[bytes]
+        :return: Sum of values
+        :rtype: float
+        """
+        return sum(compress(self.values, self._selected(mask)))
+
+    def mean(self, mask: Optional[bytes] = None) -> Optional[float]:
+        """
+        Get the mean of values.
+
+        :param mask: Selected rows, default to all rows
+        :type mask: Optional[bytes]
+        :return: Mean of values, or None if there is no value
+        :rtype: Optional[float]
+        """
+        selected = self._selected(mask)
+        count = selected.count(1)
+        if count == 0:
+            return None
+        return sum(compress(self.values, selected)) / count
+
+    def _encode(self, value: Any) -> float:
+        return float(value)
+
+    def _decode(self, value: float) -> float:
+        return value
+
+
+class DateColumn(_MaskedColumn):
+    """
+    Column of optional dates, such as ``aired``, stored as ordinals in
+    ``array("l")`` with a validity mask.
+    """
+    typecode = "l"
+
+    def _encode(self, value: Union[date, str]) -> int:
+        if isinstance(value, str):
+            value = date.fromisoformat(value)
+        return value.toordinal()
+
+    def _decode(self, value: int) -> date:
+        return date.fromordinal(value)
+
+
+class StringColumn(Column):
+    """
+    Column of optional strings, such as ``content_rating``, dictionary
+    encoded as codes in an array. Code ``0`` is None. Codes are stored in
+    ``array("B")`` until there are more than 256 distinct values, so that
+    :meth:`isin` translates all codes at once.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.dictionary: List[Optional[str]] = [None]
+        self.codes = array("B")
+        self._index: Dict[Optional[str], int] = {None: 0}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.dictionary[self.codes[index]]
+
+    def append(self, value: Optional[str]):
+        # Encoding may replace the array of codes
+        code = self._encode(value)
+        self.codes.append(code)
+
+    def take(self, mask: bytes) -> "StringColumn":
+        column = self._empty()
+        column.codes = array(self.codes.typecode, compress(self.codes, mask))
+        return column
+
+    def valid(self) -> bytearray:
+        return self.isin([None], invert=True)
+
+    def isin(self, values: Iterable[Optional[str]],
+             invert: bool = False) -> bytearray:
+        """
+        Get the mask of rows with one of the values.
+
+        :param values: Values to select
+        :type values: Iterable[Optional[str]]
+        :param invert: Whether to select rows with other values
+        :type invert: bool
+        :return: Mask of rows
+        :rtype: bytearray
+        """
+        return self._translate(self._lookup(values, invert))
+
+    def value_counts(self, mask: Optional[bytes] = None) -> Dict[str, int]:
+        """
+        Count rows of every value, None is not counted.
+
+        :param mask: Selected rows, default to all rows
+        :type mask: Optional[bytes]
+        :return: Number of rows of every value
+        :rtype: Dict[str, int]
+        """
+        codes = self.codes
+        if mask is not None:
+            codes = array(codes.typecode, compress(codes, mask))
+        dictionary = self.dictionary
+        if codes.typecode == "B":
+            data = codes.tobytes()
+            counts = [
+                (code, data.count(code))
+                for code in range(1, min(len(dictionary), 256))
+            ]
+            counts.sort(key=lambda item: item[1], reverse=True)
+        else:
+            counts = Counter(codes).most_common()
+        return {
+            dictionary[code]: count
+            for code, count in counts
+            if code != 0 and count > 0
+        }
+
+    def _encode(self, value: Optional[str]) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.dictionary)
+            self.dictionary.append(value)
+            self._index[value] = code
+        if code > 255 and self.codes.typecode == "B":
+            self.codes = array("L", self.codes)
+        return code
+
+    def _empty(self) -> "StringColumn":
+        column = type(self)(self.name)
+        # Dictionary is shared, it is append only
+        column.dictionary = self.dictionary
+        column._index = self._index  # pylint: disable=protected-access
+        return column
+
+    def _lookup(self, values: Iterable[Optional[str]],
+                invert: bool) -> bytearray:
+        selected, other = (0, 1) if invert else (1, 0)
+        lookup = bytearray([other]) * len(self.dictionary)
+        index = self._index
+        for value in values:
+            code = index.get(value)
+            if code is not None:
+                lookup[code] = selected
+        return lookup
+
+    def _translate(self, lookup: bytearray) -> bytearray:
+        """
+        Map every code to its byte in lookup.
+        """
+        codes = self.codes
+        if codes.typecode == "B":
+            table = bytes(lookup[:256]).ljust(256, b"\0")
+            return bytearray(codes.tobytes().translate(table))
+        return bytearray(map(lookup.__getitem__, codes))
+
+
+class StringListColumn(StringColumn):
+    """
+    Column of string lists, such as ``genres``, dictionary encoded as codes
+    like :class:`StringColumn`, with offsets of every row in ``array("L")``.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.offsets = array("L", [0])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> List[str]:
+        if index < 0:
+            index += len(self)
+        dictionary = self.dictionary
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return [dictionary[code] for code in self.codes[start:end]]
+
+    def append(self, value: Optional[Iterable[Any]]):
+        if value:
+            encode = self._encode
+            items = map(self._item, value)
+            codes = [encode(item) for item in items if item is not None]
+            self.codes.extend(codes)
+        self.offsets.append(len(self.codes))
+
+    def take(self, mask: bytes) -> "StringListColumn":
+        column = self._empty()
+        offsets = self.offsets
+        codes = self.codes
+        column.codes = array(codes.typecode)
+        for index in compress(range(len(self)), mask):
+            column.codes.extend(codes[offsets[index]:offsets[index + 1]])
+            column.offsets.append(len(column.codes))
+        return column
+
+    def valid(self) -> bytearray:
+        offsets = self.offsets
+        return bytearray(map(int.__lt__, offsets, offsets[1:]))
+
+    def isin(self, values: Iterable[Optional[str]],
+             invert: bool = False) -> bytearray:
+        """
+        Get the mask of rows containing any of the values.
+
+        :param values: Values to select
+        :type values: Iterable[Optional[str]]
+        :param invert: Whether to select rows containing none of the values
+        :type invert: bool
+        :return: Mask of rows
+        :rtype: bytearray
+        """
+        items = self._translate(self._lookup(values, False))
+        offsets = self.offsets
+        # Number of selected items before every offset
+        before = array("L", [0])
+        before.extend(accumulate(items))
+        found = bytearray(
+            before[end] > before[start]
+            for start, end in zip(offsets, offsets[1:])
+        )
+        return mask_not(found) if invert else found
+
+    def value_counts(self, mask: Optional[bytes] = None) -> Dict[str, int]:
+        if mask is not None:
+            return self.take(mask).value_counts()
+        return super().value_counts()
+
+    def _item(self, item: Any) -> Optional[str]:
+        return item
+
+
+class PersonListColumn(StringListColumn):
+    """
+    Column of :class:`aliceplex.schema.model.Person` lists, such as
+    ``directors``, loaded as person_class. Names are dictionary encoded like
+    :class:`StringListColumn`, so :meth:`isin` and :meth:`value_counts`
+    work on names, and photos are stored in a :class:`StringColumn` with
+    one row per person.
+    """
+
+    def __init__(self, name: str, person_class: type = Person):
+        super().__init__(name)
+        self.person_class = person_class
+        self.photos = StringColumn(name)
+
+    def __getitem__(self, index: int) -> List[Any]:
+        if index < 0:
+            index += len(self)
+        dictionary = self.dictionary
+        photos = self.photos
+        person_class = self.person_class
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return [
+            person_class(name=dictionary[self.codes[item]],
+                         photo=photos[item])
+            for item in range(start, end)
+        ]
+
+    def append(self, value: Optional[Iterable[Any]]):
+        if value:
+            encode = self._encode
+            photos = self.photos
+            for item in value:
+                # Person or any variant of it, e.g. SlottedPerson
+                if is_dataclass(item):
+                    name, photo = item.name, item.photo
+                else:
+                    name, photo = item, None
+                if name is None and photo is None:
+                    continue
+                # Encoding may replace the array of codes
+                code = encode(name)
+                self.codes.append(code)
+                photos.append(photo)
+        self.offsets.append(len(self.codes))
+
+    def take(self, mask: bytes) -> "PersonListColumn":
+        column = super().take(mask)
+        offsets = self.offsets
+        photos = self.photos
+        # pylint: disable=protected-access
+        column.photos = photos._empty()
+        codes = column.photos.codes = array(photos.codes.typecode)
+        for index in compress(range(len(self)), mask):
+            codes.extend(photos.codes[offsets[index]:offsets[index + 1]])
+        return column
+
+    def _empty(self) -> "PersonListColumn":
+        column = super()._empty()
+        column.person_class = self.person_class
+        return column
+
+
+class ObjectColumn(Column):
+    """
+    Column of any other values, such as ``actors``, stored in a list.
+
+    :param name: Field name
+    :type name: str
+    :param item_class: Dataclass of list items, dumped dictionaries are
+        converted to it
+    :type item_class: Optional[type]
+    """
+
+    def __init__(self, name: str, item_class: Optional[type] = None):
+        super().__init__(name)
+        self.item_class = item_class
+        self.values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.values[index]
+
+    def append(self, value: Any):
+        item_class = self.item_class
+        if item_class is not None and isinstance(value, list):
+            value = [
+                item_class(**item) if isinstance(item, dict) else item
+                for item in value
+            ]
+        self.values.append(value)
+
+    def take(self, mask: bytes) -> "ObjectColumn":
+        column = type(self)(self.name, self.item_class)
+        column.values = list(compress(self.values, mask))
+        return column
+
+
+class Row:
+    """
+    Lightweight view of a row of a :class:`Table`, values are decoded on
+    attribute access.
+    """
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "Table", index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Slots which are not set yet, e.g. while copying or unpickling
+            raise AttributeError(name)
+        try:
+            column = self._table.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return column[self._index]
+
+    def __repr__(self) -> str:
+        return f"Row({self._index}, {self._table.model.__name__})"
+
+    def to_object(self) -> Any:
+        """
+        Create the model object of the row.
+
+        :return: Model object
+        :rtype: Any
+        """
+        return self._table.model(**{
+            name: column[self._index]
+            for name, column in self._table.columns.items()
+        })
+
+
+class Table:
+    """
+    Columnar table of model objects, such as
+    :class:`aliceplex.schema.model.Episode`, for analytics over a whole
+    library.
+
+    Dates are stored as ordinals and floats in arrays with a validity mask,
+    strings and string lists are dictionary encoded, other fields are stored
+    in lists. Filters return masks, one byte per row, which can be combined
+    with :func:`mask_and`, :func:`mask_or` and :func:`mask_not`, and passed
+    to aggregates of columns or :meth:`filter`.
+
+    **Example:**
+
+    .. code-block:: python
+
+        table = Table.from_objects(episodes)
+        mask = mask_and(table["rating"].between(8, 10),
+                        table["content_rating"].isin(["TV-14"]))
+        table["rating"].mean(mask)
+        table["aired"].min(mask)
+        table.filter(mask)[0].title
+
+    :param model: Dataclass of rows
+    :type model: type
+    :raises ValueError: if model is not a dataclass
+    """
+
+    def __init__(self, model: type):
+        if not is_dataclass(model):
+            raise ValueError("Table model should be a dataclass")
+        self.model = model
+        # Field types of slotted variants name the original dataclasses
+        slots = "__slots__" in model.__dict__
+        self.columns: Dict[str, Column] = {
+            field.name: _column(field.name, field.type, slots)
+            for field in fields(model)
+        }
+
+    @classmethod
+    def from_objects(cls, objects: Iterable[Any],
+                     model: Optional[type] = None) -> "Table":
+        """
+        Create a table from model objects.
+
+        :param objects: Model objects
+        :type objects: Iterable[Any]
+        :param model: Dataclass of rows, default to the type of the first
+            object
+        :type model: Optional[type]
+        :return: Table
+        :rtype: Table
+        """
+        objects = iter(objects)
+        first = next(objects, None)
+        if model is None:
+            if first is None:
+                raise ValueError("Table model is required for no objects")
+            model = type(first)
+        table = cls(model)
+        if first is not None:
+            table.append(first)
+            for obj in objects:
+                table.append(obj)
+        return table
+
+    @classmethod
+    def from_dicts(cls, data: Iterable[Dict[str, Any]],
+                   model: type) -> "Table":
+        """
+        Create a table from dumped dictionaries, e.g. output of
+        ``EpisodeSchema().dump``.
+
+        :param data: Dumped dictionaries
+        :type data: Iterable[Dict[str, Any]]
+        :param model: Dataclass of rows
+        :type model: type
+        :return: Table
+        :rtype: Table
+        """
+        table = cls(model)
+        columns = list(table.columns.items())
+        for row in data:
+            for name, column in columns:
+                column.append(row.get(name))
+        return table
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __getitem__(self, key: Union[int, str]) -> Union[Row, Column]:
+        """
+        Get a row view by index, or a column by name.
+
+        :param key: Row index or column name
+        :type key: Union[int, str]
+        :return: Row or column
+        :rtype: Union[Row, Column]
+        """
+        if isinstance(key, str):
+            return self.columns[key]
+        length = len(self)
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("Table index out of range")
+        return Row(self, key)
+
+    def __iter__(self) -> Iterator[Row]:
+        return (Row(self, index) for index in range(len(self)))
+
+    def append(self, obj: Any):
+        """
+        Append a model object.
+
+        :param obj: Model object
+        :type obj: Any
+        """
+        for name, column in self.columns.items():
+            column.append(getattr(obj, name))
+
+    def filter(self, mask: bytes) -> "Table":
+        """
+        Get a table of the selected rows.
+
+        :param mask: Selected rows
+        :type mask: bytes
+        :return: New table
+        :rtype: Table
+        """
+        table = type(self)(self.model)
+        table.columns = {
+            name: column.take(mask) for name, column in self.columns.items()
+        }
+        return table
+
+    def rows(self, mask: Optional[bytes] = None) -> Iterator[Row]:
+        """
+        Iterate views of the selected rows.
+
+        :param mask: Selected rows, default to all rows
+        :type mask: Optional[bytes]
+        :return: Row views
+        :rtype: Iterator[Row]
+        """
+        indexes = range(len(self))
+        if mask is not None:
+            indexes = compress(indexes, mask)
+        return (Row(self, index) for index in indexes)
+
+
+def _column(name: str, field_type: Any, slots: bool = False) -> Column:
+    """
+    Create the column of a dataclass field by its type, with slotted item
+    classes if slots is set.
+    """
+    # pylint: disable=too-many-return-statements
+    origin = getattr(field_type, "__origin__", None)
+    args = [arg for arg in getattr(field_type, "__args__", ())
+            if arg is not _NoneType]
+    if origin is Union and len(args) == 1:
+        field_type = args[0]
+    if field_type is date:
+        return DateColumn(name)
+    if field_type is float:
+        return FloatColumn(name)
+    if field_type is str:
+        return StringColumn(name)
+    if origin is list and args == [str]:
+        return StringListColumn(name)
+    if origin is list and args == [Person]:
+        return PersonListColumn(name, slotted(Person) if slots else Person)
+    if origin is list and len(args) == 1 and is_dataclass(args[0]):
+        return ObjectColumn(name, slotted(args[0]) if slots else args[0])
+    return ObjectColumn(name)
@@ -1,4 +1,22 @@
 import re
+from itertools import islice
+from typing import Any, Iterable, List
+
+__all__ = ["has_diacritics", "has_diacritics_many"]
+
+# Voiced and semi-voiced sound marks, combining and spacing, U+3099 to U+309C
+_FIRST = 0x3099
+_LAST = 0x309C
+_DIACRITICS = re.compile(f"[{chr(_FIRST)}-{chr(_LAST)}]")
+
+# NumPy module, None if it is not installed. It is imported on first use by
+# has_diacritics_many, so that importing this module stays fast.
+_NOT_IMPORTED = object()
+numpy: Any = _NOT_IMPORTED
+
+# Number of strings scanned at a time by NumPy, so that the UTF-32 buffer of
+# a chunk fits in cache and memory use does not depend on the input size
+_CHUNK = 65536
 
 
 def has_diacritics(string: str) -> bool:
@@ -10,4 +28,82 @@ def has_diacritics(string: str) -> bool:
     :return:
     :rtype: bool
     """
-    return bool(re.search("[゙゚゛゜]", string))
+    return _DIACRITICS.search(string) is not None
+
+
+def has_diacritics_many(strings: Iterable[str]) -> bytearray:
+    """
+    Check if each string contains diacritics.
+
+    The strings are scanned in chunks with NumPy if it is installed,
+    otherwise one by one with a precompiled pattern.
+
+    **Example:**
+
+    .. code-block:: python
+
+        flags = has_diacritics_many(["\\u304c", "\\u304b\\u3099"])
+        flags # bytearray(b"\\x00\\x01")
+        broken = [title for title, flag in zip(titles, flags) if flag]
+
+    :param strings: Strings to be checked
+    :type strings: Iterable[str]
+    :return: 1 for every string containing diacritics and 0 for the others,
+        e.g. ``numpy.frombuffer(flags, dtype=bool)`` views it as a boolean
+        array
+    :rtype: bytearray
+    """
+    np = _import_numpy()
+    if np is None:
+        search = _DIACRITICS.search
+        return bytearray(map(bool, map(search, strings)))
+    flags = bytearray()
+    iterator = iter(strings)
+    chunk = list(islice(iterator, _CHUNK))
+    while chunk:
+        flags += _scan(np, chunk).tobytes()
+        chunk = list(islice(iterator, _CHUNK))
+    return flags
+
+
+def _import_numpy() -> Any:
+    """
+    Import NumPy once.
+
+    :return: NumPy module, or None if it is not installed
+    :rtype: Any
+    """
+    global numpy  # pylint: disable=global-statement,invalid-name
+    if numpy is _NOT_IMPORTED:
+        try:
+            # pylint: disable=import-outside-toplevel
+            import numpy as module
+        except ImportError:  # pragma: no cover
+            module = None
+        numpy = module
+    return numpy
+
+
+def _scan(np: Any, strings: List[str]) -> Any:
+    """
+    Check if each string contains diacritics with NumPy, by finding
+    diacritics in the code points of the joined strings and the strings
+    they belong to.
+
+    :param np: NumPy module
+    :type np: Any
+    :param strings: Strings to be checked
+    :type strings: List[str]
+    :return: 1 for every string containing diacritics and 0 for the others
+    :rtype: numpy.ndarray
+    """
+    text = "\0".join(strings).encode("utf-32-le", "surrogatepass")
+    codes = np.frombuffer(text, dtype=np.uint32)
+    positions = np.flatnonzero((codes >= _FIRST) & (codes <= _LAST))
+    flags = np.zeros(len(strings), dtype=np.uint8)
+    if len(positions):
+        lengths = np.fromiter(map(len, strings), dtype=np.int64,
+                              count=len(strings))
+        ends = np.cumsum(lengths + 1)
+        flags[np.searchsorted(ends, positions, side="right")] = 1
+    return flags
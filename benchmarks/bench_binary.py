@@ -0,0 +1,67 @@
+"""
+Benchmarks of :mod:`aliceplex.schema.binary`.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+from typing import Callable, Iterator, Tuple
+
+from aliceplex.schema import schema as schemas
+from aliceplex.schema.binary import Archive, BinaryFile, dump_archive, \
+    dump_binary, load_binary
+from aliceplex.schema.files import dumps, loads
+from benchmarks.data import library
+
+__all__ = ["SIZED", "benchmarks"]
+
+SIZED = True
+
+
+def benchmarks(size: int) -> Iterator[Tuple[str, int, Callable[[], object]]]:
+    """
+    Benchmarks of writing and loading a binary file of each model and
+    getting an object from an archive by key, compared with loading a JSON
+    file with and without validation.
+
+    :param size: Number of records of each model
+    :return: Name, number of items and function of each benchmark
+    """
+    root = tempfile.mkdtemp(prefix="aliceplex-binary-")
+    atexit.register(shutil.rmtree, root, True)
+    for model in ("Show", "Episode", "Movie"):
+        schema_class = getattr(schemas, f"{model}Schema")
+        schema = schema_class(many=True)
+        objects = schema.load(library(model, size))
+        path = os.path.join(root, f"{model}.bin")
+        dump_binary(objects, path, schema_class)
+        json_path = os.path.join(root, f"{model}.json")
+        content = dumps(schema.dump(objects), json_path)
+
+        archive_path = os.path.join(root, f"{model}.archive.bin")
+        dump_archive(((f"{index:08d}", obj)
+                      for index, obj in enumerate(objects)),
+                     archive_path, schema_class)
+        archive = Archive(archive_path, schema_class)
+        atexit.register(archive.close)
+        key = f"{size // 2:08d}"
+
+        def get(path=path, schema_class=schema_class):
+            with BinaryFile(path, schema_class) as file:
+                return file[len(file) // 2]
+
+        yield (f"{model}.dump_binary", size,
+               lambda objects=objects, path=path, schema_class=schema_class:
+               dump_binary(objects, path, schema_class))
+        yield (f"{model}.load_binary", size,
+               lambda path=path, schema_class=schema_class:
+               load_binary(path, schema_class))
+        yield f"{model}.get", 1, get
+        yield (f"{model}.archive.get", 1,
+               lambda archive=archive, key=key: archive.get(key))
+        yield (f"{model}.json.load_trusted", size,
+               lambda content=content, path=json_path, schema=schema:
+               schema.load_trusted(loads(content, path)))
+        yield (f"{model}.json.load", size,
+               lambda content=content, path=json_path, schema=schema:
+               schema.load(loads(content, path)))
@@ -0,0 +1,75 @@
+"""
+Benchmarks of :mod:`aliceplex.schema.files`.
+"""
+import asyncio
+import atexit
+import json
+import os
+import shutil
+import tempfile
+from typing import Callable, Iterator, Tuple
+
+from aliceplex.schema.files import EXTENSIONS, aload_many, dumps, \
+    load_file, load_files, loads
+from aliceplex.schema.schema import ShowSchema
+from benchmarks.data import library
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
+__all__ = ["SIZED", "benchmarks"]
+
+SIZED = True
+
+
+def benchmarks(size: int) -> Iterator[Tuple[str, int, Callable[[], object]]]:
+    """
+    Benchmarks of parsing show files with the pure Python and the fastest
+    backends, and of loading them one by one, with :func:`load_files` and with
+    :func:`aload_many`.
+
+    :param size: Number of files of each format
+    :return: Name, number of items and function of each benchmark
+    """
+    root = tempfile.mkdtemp(prefix="aliceplex-files-")
+    atexit.register(shutil.rmtree, root, True)
+    records = library("Show", size)
+    for extension in EXTENSIONS[:2]:
+        paths = []
+        contents = []
+        for index, record in enumerate(records):
+            path = os.path.join(root, f"show{index}{extension}")
+            content = dumps(record, path)
+            with open(path, "wb") as file:
+                file.write(content)
+            paths.append(path)
+            contents.append(content)
+        name = extension[1:]
+
+        if name == "json":
+            def parse_python(contents=contents):
+                for content in contents:
+                    json.loads(content)
+        else:
+            def parse_python(contents=contents):
+                for content in contents:
+                    yaml.load(content, Loader=yaml.SafeLoader)
+
+        def parse(contents=contents, path=paths[0]):
+            for content in contents:
+                loads(content, path)
+
+        def load(paths=paths):
+            for path in paths:
+                load_file(path, ShowSchema)
+
+        yield f"{name}.parse.stdlib", size, parse_python
+        yield f"{name}.parse", size, parse
+        yield f"{name}.load_file", size, load
+        yield (f"{name}.load_files", size,
+               lambda paths=paths: load_files(paths, ShowSchema))
+        yield (f"{name}.aload_many", size,
+               lambda paths=paths:
+               asyncio.run(aload_many(paths, ShowSchema)))
@@ -0,0 +1,29 @@
+"""
+Benchmarks of :mod:`aliceplex.schema.format`.
+"""
+from typing import Callable, Iterator, Tuple
+
+from aliceplex.schema.format import is_normalized, normalize
+from benchmarks.data import CJK_TEXT, LONG_TEXT, SHORT_TEXT
+
+__all__ = ["SIZED", "benchmarks"]
+
+SIZED = False
+
+
+def benchmarks(size: int) -> Iterator[Tuple[str, int, Callable[[], object]]]:
+    """
+    Benchmarks of normalize.
+
+    :param size: Library size, unused
+    :return: Name, number of items and function of each benchmark
+    """
+    del size
+    texts = {"short": SHORT_TEXT, "long": LONG_TEXT, "cjk": CJK_TEXT}
+    for name, text in texts.items():
+        normalized = normalize(text)
+        yield f"normalize.{name}", 1, lambda text=text: normalize(text)
+        yield (f"normalize.{name}.normalized", 1,
+               lambda text=normalized: normalize(text))
+        yield (f"is_normalized.{name}", 1,
+               lambda text=normalized: is_normalized(text))
@@ -0,0 +1,38 @@
+"""
+Benchmarks of import time, each import runs in a new interpreter.
+"""
+import subprocess
+import sys
+from typing import Callable, Iterator, Tuple
+
+__all__ = ["SIZED", "benchmarks"]
+
+SIZED = False
+
+#: Name and statement of each benchmark, "python" is the interpreter startup
+#: time to be subtracted from the others
+IMPORTS = [
+    ("python", "pass"),
+    ("model", "import aliceplex.schema.model"),
+    ("format", "import aliceplex.schema.format"),
+    ("verify", "import aliceplex.schema.verify"),
+    ("package", "import aliceplex.schema"),
+    ("package.model", "from aliceplex.schema import Show"),
+    ("package.schema", "from aliceplex.schema import ShowSchema"),
+    ("package.all", "from aliceplex.schema import *")
+]
+
+
+def benchmarks(size: int) -> Iterator[Tuple[str, int, Callable[[], object]]]:
+    """
+    Benchmarks of importing modules and names in a new interpreter.
+
+    :param size: Library size, unused
+    :return: Name, number of items and function of each benchmark
+    """
+    del size
+    for name, statement in IMPORTS:
+        yield (name, 1,
+               lambda statement=statement: subprocess.run(
+                   [sys.executable, "-c", statement], check=True
+               ))
@@ -0,0 +1,67 @@
+"""
+Benchmarks of :class:`aliceplex.schema.library.LibraryScanner`.
+"""
+import atexit
+import json
+import os
+import shutil
+import tempfile
+from typing import Callable, Iterator, Tuple
+
+from aliceplex.schema.library import LibraryScanner
+from benchmarks.data import library
+
+__all__ = ["SIZED", "benchmarks"]
+
+SIZED = True
+
+
+def _create(size: int) -> str:
+    """
+    Create a library of one show file for every 10 episode files in a
+    temporary directory, which is removed at exit.
+
+    :param size: Number of episode files
+    :return: Library root
+    """
+    root = tempfile.mkdtemp(prefix="aliceplex-library-")
+    atexit.register(shutil.rmtree, root, True)
+    shows = library("Show", max(size // 10, 1))
+    for index, record in enumerate(library("Episode", size)):
+        directory = os.path.join(root, f"Show {index // 10}")
+        if index % 10 == 0:
+            os.mkdir(directory)
+            with open(os.path.join(directory, "show.json"), "w") as file:
+                json.dump(shows[index // 10], file)
+        name = f"S01E{index % 10 + 1:02d}.json"
+        with open(os.path.join(directory, name), "w") as file:
+            json.dump(record, file)
+    # Make the files older than the scans, so that they are trusted by mtime
+    for directory, _, names in os.walk(root):
+        for name in names:
+            os.utime(os.path.join(directory, name), (0, 0))
+    return root
+
+
+def benchmarks(size: int) -> Iterator[Tuple[str, int, Callable[[], object]]]:
+    """
+    Benchmarks of a full scan, a rescan by the same scanner and a rescan
+    from the index by a new scanner.
+
+    :param size: Number of episode files
+    :return: Name, number of items and function of each benchmark
+    """
+    root = _create(size)
+    items = size + max(size // 10, 1)
+    index_path = os.path.join(root, "index.json")
+
+    def scan():
+        os.remove(index_path)
+        LibraryScanner(root, index_path).scan()
+
+    scanner = LibraryScanner(root, index_path)
+    scanner.scan()
+    yield "scan", items, scan
+    yield "rescan", items, scanner.scan
+    yield "rescan.index", items, \
+        lambda: LibraryScanner(root, index_path).scan()
@@ -0,0 +1,65 @@
+"""
+Benchmarks of load and dump of every schema.
+"""
+from typing import Callable, Iterator, Tuple
+
+from aliceplex.schema import schema as schemas
+from aliceplex.schema.schema.compiler import compile_schema
+from aliceplex.schema.schema.registry import get_schema
+from benchmarks.data import RECORDS, library
+
+__all__ = ["SIZED", "benchmarks"]
+
+SIZED = True
+
+
+def benchmarks(size: int) -> Iterator[Tuple[str, int, Callable[[], object]]]:
+    """
+    Benchmarks of load and dump with ``many=False`` and ``many=True``, with
+    the generic and the compiled schema, of trusted load, and of schema
+    creation with and without :func:`get_schema`.
+
+    :param size: Number of records of each model
+    :return: Name, number of items and function of each benchmark
+    """
+    for model in RECORDS:
+        records = library(model, size)
+        for variant in ("Schema", "StrictSchema"):
+            schema_class = getattr(schemas, model + variant)
+            schema = schema_class()
+            many_schema = schema_class(many=True)
+            compiled = compile_schema(schema)
+            objects = many_schema.load(records)
+            name = f"{model}{variant}"
+
+            def load(records=records, schema=schema):
+                for record in records:
+                    schema.load(record)
+
+            def dump(objects=objects, schema=schema):
+                for obj in objects:
+                    schema.dump(obj)
+
+            yield f"{name}.load", size, load
+            yield (f"{name}.load.many", size,
+                   lambda records=records, schema=many_schema:
+                   schema.load(records))
+            yield f"{name}.dump", size, dump
+            yield (f"{name}.dump.many", size,
+                   lambda objects=objects, schema=many_schema:
+                   schema.dump(objects))
+            yield (f"{name}.compiled.load.many", size,
+                   lambda records=records, compiled=compiled:
+                   compiled.load(records, many=True))
+            yield (f"{name}.compiled.dump.many", size,
+                   lambda objects=objects, compiled=compiled:
+                   compiled.dump(objects, many=True))
+            yield (f"{name}.load_trusted.many", size,
+                   lambda records=records, schema=schema:
+                   schema.load_trusted(records, many=True))
+            yield (f"{name}.create", 1,
+                   lambda schema_class=schema_class:
+                   schema_class().load({}, many=True))
+            yield (f"{name}.get_schema", 1,
+                   lambda schema_class=schema_class:
+                   get_schema(schema_class).load({}, many=True))
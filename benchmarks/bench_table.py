@@ -0,0 +1,53 @@
+"""
+Benchmarks of :mod:`aliceplex.schema.table` against lists of objects.
+"""
+from typing import Callable, Iterator, Tuple
+
+from aliceplex.schema.schema import EpisodeSchema
+from aliceplex.schema.table import Table, mask_and
+from benchmarks.data import library
+
+__all__ = ["SIZED", "benchmarks"]
+
+SIZED = True
+
+
+def benchmarks(size: int) -> Iterator[Tuple[str, int, Callable[[], object]]]:
+    """
+    Benchmarks of filtered aggregates over episodes.
+
+    :param size: Number of episodes
+    :return: Name, number of items and function of each benchmark
+    """
+    episodes = EpisodeSchema(many=True).load(library("Episode", size))
+    table = Table.from_objects(episodes)
+    rating = table["rating"]
+    content_rating = table["content_rating"]
+    directors = table["directors"]
+
+    def objects_mean():
+        ratings = [
+            episode.rating for episode in episodes
+            if episode.rating is not None and 5 <= episode.rating <= 10 and
+            episode.content_rating == "PG"
+        ]
+        return sum(ratings) / len(ratings)
+
+    def table_mean():
+        return rating.mean(mask_and(rating.between(5, 10),
+                                    content_rating.isin(["PG"])))
+
+    def objects_director():
+        return sum(
+            any(person.name == "Person 1" for person in episode.directors)
+            for episode in episodes
+        )
+
+    def table_director():
+        return directors.isin(["Person 1"]).count(1)
+
+    yield "Episode.from_objects", size, lambda: Table.from_objects(episodes)
+    yield "objects.rating_mean", size, objects_mean
+    yield "table.rating_mean", size, table_mean
+    yield "objects.director", size, objects_director
+    yield "table.director", size, table_director
@@ -0,0 +1,38 @@
+"""
+Benchmarks of :mod:`aliceplex.schema.verify`.
+"""
+from typing import Callable, Iterator, Tuple
+from unittest import mock
+
+from aliceplex.schema import verify
+from aliceplex.schema.verify import has_diacritics, has_diacritics_many
+from benchmarks.data import TITLES
+
+__all__ = ["SIZED", "benchmarks"]
+
+SIZED = False
+
+
+def benchmarks(size: int) -> Iterator[Tuple[str, int, Callable[[], object]]]:
+    """
+    Benchmarks of has_diacritics and has_diacritics_many, with and without
+    NumPy.
+
+    :param size: Library size, unused
+    :return: Name, number of items and function of each benchmark
+    """
+    del size
+
+    def run():
+        for title in TITLES:
+            has_diacritics(title)
+
+    yield "has_diacritics", len(TITLES), run
+
+    def run_python():
+        with mock.patch.object(verify, "numpy", None):
+            has_diacritics_many(TITLES)
+
+    yield "has_diacritics_many", len(TITLES), \
+        lambda: has_diacritics_many(TITLES)
+    yield "has_diacritics_many.python", len(TITLES), run_python
@@ -0,0 +1,137 @@
+"""
+Deterministic synthetic library for benchmarks.
+
+Every record is valid for both the normal and the strict schema.
+"""
+from datetime import date, timedelta
+from random import Random
+from typing import Any, Callable, Dict, List
+
+__all__ = ["SHORT_TEXT", "LONG_TEXT", "CJK_TEXT", "TITLES", "RECORDS",
+           "library"]
+
+_WORDS = [
+    "alice", "plex", "schema", "summer", "night", "river", "story", "sky",
+    "garden", "letter", "winter", "station", "memory", "light", "ocean"
+]
+_KANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよ"
+_NAMES = [f"Person {i}" for i in range(200)]
+_GENRES = ["Action", "Comedy", "Drama", "Fantasy", "Romance", "Sci-Fi"]
+_STUDIOS = [f"Studio {i}" for i in range(30)]
+_RATINGS = ["G", "PG", "PG-13", "R", "TV-14", "TV-MA"]
+
+SHORT_TEXT = "Plain  title..."
+LONG_TEXT = (
+    "A normal english summary sentence with  some words...\n"
+    "Another line!  It continues here ~ with <tags>.\n\n\n"
+) * 40
+CJK_TEXT = "これはテストです。　とても長い文章ですね！\n～第１話～\n\n" * 40
+
+
+def _text(rand: Random, words: int) -> str:
+    return " ".join(rand.choice(_WORDS) for _ in range(words))
+
+
+def _kana(rand: Random, length: int) -> str:
+    return "".join(rand.choice(_KANA) for _ in range(length))
+
+
+def _aired(rand: Random) -> str:
+    return (date(1990, 1, 1) + timedelta(days=rand.randint(0, 12000))) \
+        .isoformat()
+
+
+def _person(rand: Random) -> Dict[str, Any]:
+    return {"name": rand.choice(_NAMES), "photo": None}
+
+
+def _actor(rand: Random) -> Dict[str, Any]:
+    return {
+        "name": rand.choice(_NAMES),
+        "role": _text(rand, 2),
+        "photo": "http://example.com/photo.jpg"
+    }
+
+
+def _show(rand: Random) -> Dict[str, Any]:
+    return {
+        "title": _text(rand, 3),
+        "sort_title": _text(rand, 3),
+        "original_title": _kana(rand, 8),
+        "content_rating": rand.choice(_RATINGS),
+        "tagline": [_text(rand, 6)],
+        "studio": [rand.choice(_STUDIOS)],
+        "aired": _aired(rand),
+        "summary": _text(rand, 80),
+        "rating": round(rand.uniform(0, 10), 1),
+        "genres": rand.sample(_GENRES, 2),
+        "collections": [_text(rand, 2)],
+        "actors": [_actor(rand) for _ in range(8)],
+        "season_summary": {1: _text(rand, 40), 2: _text(rand, 40)}
+    }
+
+
+def _episode(rand: Random) -> Dict[str, Any]:
+    return {
+        "title": [_text(rand, 4)],
+        "aired": _aired(rand),
+        "content_rating": rand.choice(_RATINGS),
+        "summary": _text(rand, 60),
+        "directors": [rand.choice(_NAMES)],
+        "writers": [rand.choice(_NAMES), rand.choice(_NAMES)],
+        "rating": round(rand.uniform(0, 10), 1)
+    }
+
+
+def _movie(rand: Random) -> Dict[str, Any]:
+    movie = _show(rand)
+    del movie["season_summary"]
+    movie["directors"] = [rand.choice(_NAMES)]
+    movie["writers"] = [rand.choice(_NAMES)]
+    return movie
+
+
+def _artist(rand: Random) -> Dict[str, Any]:
+    return {
+        "summary": _text(rand, 40),
+        "similar": [rand.choice(_NAMES)],
+        "genres": rand.sample(_GENRES, 2),
+        "collections": [_text(rand, 2)]
+    }
+
+
+def _album(rand: Random) -> Dict[str, Any]:
+    return {
+        "summary": _text(rand, 40),
+        "aired": _aired(rand),
+        "genres": rand.sample(_GENRES, 2),
+        "collections": [_text(rand, 2)]
+    }
+
+
+#: Record generator of each model name
+RECORDS: Dict[str, Callable[[Random], Dict[str, Any]]] = {
+    "Person": _person,
+    "Actor": _actor,
+    "Show": _show,
+    "Episode": _episode,
+    "Movie": _movie,
+    "Artist": _artist,
+    "Album": _album
+}
+
+TITLES = [_text(Random(i), 3) + "が" + "゙" * (i % 2) for i in range(1000)]
+
+
+def library(model: str, size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate dumped records of a model.
+
+    :param model: Name of the model
+    :param size: Number of records
+    :param seed: Random seed
+    :return: Dumped records
+    """
+    rand = Random(seed)
+    generate = RECORDS[model]
+    return [generate(rand) for _ in range(size)]
@@ -0,0 +1,92 @@
+"""
+Measure memory of loaded model objects, plain, slotted and pooled.
+
+Run with the default library size::
+
+    python -m benchmarks.memory --sizes 10000
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from aliceplex.schema import schema as schemas
+from aliceplex.schema.pool import InternPool
+from benchmarks.data import RECORDS, library
+
+__all__ = ["main", "measure", "run"]
+
+
+def measure(function: Callable[[], Any]) -> int:
+    """
+    Measure memory allocated by the result of a function.
+
+    :param function: Function creating objects
+    :return: Allocated bytes still in use after the call
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def run(sizes: List[int]) -> Dict[str, Any]:
+    """
+    Measure memory per loaded object of every model, plain, slotted and with
+    an intern pool.
+
+    Records are parsed from JSON inside the measurement, so that strings are
+    not shared as in the synthetic library, and only the loaded objects,
+    the strings they own and the pool are counted.
+
+    :param sizes: Library sizes
+    :return: Machine-readable results
+    """
+    results = {}
+    for size in sizes:
+        for model in RECORDS:
+            text = json.dumps(library(model, size))
+            schema_class = getattr(schemas, model + "Schema")
+
+            def load(schema_class=schema_class, text=text, **options):
+                pool = InternPool() if options.pop("pool", False) else None
+                schema = schema_class(many=True, pool=pool, **options)
+                return pool, schema.load(json.loads(text))
+
+            plain = measure(load)
+            slots = measure(lambda load=load: load(slots=True))
+            pooled = measure(lambda load=load: load(slots=True, pool=True))
+            results[f"{model}[{size}]"] = {
+                "bytes_per_item": plain / size,
+                "slotted_bytes_per_item": slots / size,
+                "slotted_pooled_bytes_per_item": pooled / size,
+                "saving": 1 - pooled / plain
+            }
+            print(f"{model}[{size}]: {plain / size:.0f} B, "
+                  f"slotted {slots / size:.0f} B, "
+                  f"slotted and pooled {pooled / size:.0f} B",
+                  file=sys.stderr)
+    return {"results": results}
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Command line entry point.
+
+    :param argv: Command line arguments
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10000],
+                        help="library sizes, e.g. 1000 100000")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.sizes), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Run benchmarks and write the results as JSON.
+
+Run all benchmarks with the default library size::
+
+    python -m benchmarks --output results.json
+
+Run schema benchmarks over libraries of 1k and 100k items and compare them
+with the results of a previous release::
+
+    python -m benchmarks --sizes 1000 100000 --only schema \\
+        --compare previous.json --output results.json
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime, timezone
+from importlib import import_module
+from typing import Any, Dict, List, Optional
+
+__all__ = ["MODULES", "main", "run"]
+
+#: Benchmark modules, each of them has a ``benchmarks(size)`` function and
+#: ``SIZED`` telling if the benchmarks depend on library size
+MODULES = ["format", "verify", "schema", "table", "import", "library",
+           "files", "binary"]
+
+
+def _measure(function, repeat: int, min_time: float) -> float:
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    # autorange stops at 0.2 seconds, run more loops for longer min_time
+    number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(modules: List[str], sizes: List[int], repeat: int = 3,
+        min_time: float = 0.2) -> Dict[str, Any]:
+    """
+    Run benchmarks.
+
+    :param modules: Names of benchmark modules
+    :param sizes: Library sizes
+    :param repeat: Number of repeats, the best one is reported
+    :param min_time: Minimum time of each repeat in seconds
+    :return: Machine-readable results
+    """
+    results = {}
+    for module_name in modules:
+        module = import_module(f"benchmarks.bench_{module_name}")
+        # Benchmarks which do not depend on library size only run once
+        for size in sizes if module.SIZED else sizes[:1]:
+            for name, items, function in module.benchmarks(size):
+                key = f"{module_name}.{name}"
+                if module.SIZED:
+                    key = f"{key}[{size}]"
+                seconds = _measure(function, repeat, min_time)
+                results[key] = {
+                    "seconds": seconds,
+                    "items": items,
+                    "seconds_per_item": seconds / items
+                }
+                print(f"{key}: {seconds * 1e3:.3f} ms", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "sizes": sizes,
+            "repeat": repeat
+        },
+        "results": results
+    }
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any]) -> List[str]:
+    """
+    Compare results with previous results.
+
+    :param current: Current results
+    :param previous: Previous results
+    :return: One line for every benchmark in both results
+    """
+    lines = []
+    for key, result in current["results"].items():
+        if key not in previous["results"]:
+            continue
+        ratio = result["seconds"] / previous["results"][key]["seconds"]
+        lines.append(f"{key}: {ratio:.2f}x")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Command line entry point.
+
+    :param argv: Command line arguments
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--only", nargs="+", choices=MODULES,
+                        default=MODULES, help="benchmark modules to run")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000],
+                        help="library sizes, e.g. 1000 100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="previous JSON results")
+    args = parser.parse_args(argv)
+    results = run(args.only, args.sizes, args.repeat, args.min_time)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output)
+    else:
+        print(output)
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)
+        for line in compare(results, previous):
+            print(line, file=sys.stderr)
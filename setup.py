@@ -17,6 +17,8 @@ setup(
     packages=["aliceplex.schema"],
     setup_requires=["pytest-runner"],
     install_requires=["marshmallow>=3.0.0b20,<4.0.0"],
+    extras_require={"json": ["orjson"], "numpy": ["numpy"],
+                    "yaml": ["PyYAML"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3 :: Only",
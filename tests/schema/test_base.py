@@ -0,0 +1,113 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pytest
+from marshmallow import ValidationError, fields
+
+from aliceplex.schema.model import slotted
+from aliceplex.schema.schema.base import DataClassSchema
+
+
+@dataclass
+class Sample:
+    name: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    count: Optional[int] = None
+    names: Dict[int, str] = field(default_factory=dict)
+
+
+class SampleSchema(DataClassSchema):
+    name = fields.Str(allow_none=True)
+    tags = fields.List(fields.Str(allow_none=False), allow_none=False)
+    count = fields.Int(allow_none=True)
+    names = fields.Dict(keys=fields.Int(), values=fields.Str())
+
+    @property
+    def data_class(self) -> type:
+        return Sample
+
+
+class InvalidSchema(DataClassSchema):
+    @property
+    def data_class(self) -> type:
+        return dict
+
+
+def test_filter_data():
+    schema = SampleSchema()
+    data = {"name": "", "tags": ["a", None, ""], "count": 0, "names": ""}
+    schema.filter_data(data)
+    assert data == {"name": None, "tags": ["a"], "count": 0, "names": None}
+    data = {"tags": None}
+    schema.filter_data(data)
+    assert data == {"tags": []}
+    assert schema.load({"name": "", "tags": None}) == Sample()
+
+
+def test_filter_data_invalid():
+    with pytest.raises(ValueError):
+        InvalidSchema().filter_data({})
+
+
+def test_convert():
+    schema = SampleSchema()
+    sample = Sample(name="", tags=["a", ""], names={1: "a"})
+    assert schema.dump(sample) == {
+        "name": None, "tags": ["a"], "count": None, "names": {1: "a"}
+    }
+    # Dumping does not change the object
+    assert sample == Sample(name="", tags=["a", ""], names={1: "a"})
+
+
+def test_load_trusted():
+    schema = SampleSchema()
+    data = {"name": "", "tags": ["a", None], "count": "1", "unknown": 1}
+    assert schema.load_trusted(data) == Sample(tags=["a"], count=1)
+    assert schema.load_trusted({"names": {"1": "a"}}) == \
+        Sample(names={1: "a"})
+    assert schema.load_trusted([{}, {"tags": None}], many=True) == \
+        [Sample(), Sample()]
+    # No validation
+    assert schema.load_trusted({"name": 1}) == Sample(name=1)
+
+
+def test_slots():
+    schema = SampleSchema(slots=True)
+    sample = schema.load({"name": "name", "tags": ["a"]})
+    assert type(sample) is slotted(Sample)
+    assert sample == slotted(Sample)(name="name", tags=["a"])
+    assert schema.load_trusted({}) == slotted(Sample)()
+    assert schema.dump(sample) == SampleSchema().dump(
+        Sample(name="name", tags=["a"])
+    )
+    assert SampleSchema(context={"slots": True}).model_class is \
+        slotted(Sample)
+    assert SampleSchema().model_class is Sample
+
+
+def test_iter_load():
+    schema = SampleSchema(many=True)
+    data = iter([{"name": "a"}, {"count": "x"}, {"tags": None}, [],
+                 {"tags": 5}, {"name": "b"}])
+    errors = {}
+    loaded = schema.iter_load(data, errors)
+    assert next(loaded) == Sample(name="a")
+    assert next(loaded) == Sample()
+    assert list(loaded) == [Sample(name="b")]
+    assert errors == {
+        1: {"count": ["Not a valid integer."]},
+        3: {"_schema": ["Invalid input type."]},
+        4: {"tags": ["Not a valid list."]}
+    }
+    loaded = schema.iter_load([{"count": "x"}, {"name": "a"}])
+    assert next(loaded) == Sample(name="a")
+    with pytest.raises(ValidationError) as error:
+        next(loaded)
+    assert error.value.messages == {0: {"count": ["Not a valid integer."]}}
+
+
+def test_iter_dump():
+    schema = SampleSchema()
+    dumped = schema.iter_dump(iter([Sample(name="a"), Sample()]))
+    assert next(dumped) == schema.dump(Sample(name="a"))
+    assert list(dumped) == [schema.dump(Sample())]
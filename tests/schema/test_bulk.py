@@ -0,0 +1,61 @@
+from datetime import date
+
+import pytest
+
+from aliceplex.schema import Episode, Person, SlottedEpisode
+from aliceplex.schema.schema import EpisodeSchema, bulk_dump, bulk_load
+from aliceplex.schema.schema import bulk as bulk_module
+
+RECORDS = [
+    {"title": ["Episode 1"], "aired": "2018-01-01", "directors": ["A"]},
+    {"title": ["Episode 2"], "aired": "invalid"},
+    {"title": ["Episode 3"], "content_rating": "TV-14"},
+    "invalid",
+    {"title": ["Episode 5"], "writers": ["B"]}
+]
+
+
+@pytest.fixture(params=[1, 2])
+def workers(request, monkeypatch) -> int:
+    # Use worker processes for small inputs too
+    monkeypatch.setattr(bulk_module, "_PARALLEL_THRESHOLD", 1)
+    return request.param
+
+
+def test_bulk_load(workers: int):
+    result = bulk_load(EpisodeSchema, RECORDS, workers=workers, chunksize=2)
+    assert result.results == [
+        Episode(title=["Episode 1"], aired=date(2018, 1, 1),
+                directors=[Person(name="A")]),
+        None,
+        Episode(title=["Episode 3"], content_rating="TV-14"),
+        None,
+        Episode(title=["Episode 5"], writers=[Person(name="B")])
+    ]
+    assert result.errors == {
+        1: {"aired": ["Not a valid date."]},
+        3: {"_schema": ["Invalid input type."]}
+    }
+
+
+def test_bulk_load_options(workers: int):
+    result = bulk_load(EpisodeSchema, RECORDS[:1], workers=workers,
+                       slots=True)
+    assert isinstance(result.results[0], SlottedEpisode)
+    assert not result.errors
+
+
+def test_bulk_dump(workers: int):
+    episodes = [Episode(title=[f"Episode {i}"]) for i in range(5)]
+    assert bulk_dump(EpisodeSchema, episodes, workers=workers,
+                     chunksize=2) == EpisodeSchema(many=True).dump(episodes)
+
+
+def test_bulk_load_malformed(workers: int):
+    records = [{"title": [f"Episode {i}"]} for i in range(10)]
+    records.append({"title": "Episode", "directors": 5})
+    result = bulk_load(EpisodeSchema, records, workers=workers, chunksize=4)
+    assert result.results[:10] == EpisodeSchema(many=True).load(records[:10])
+    assert result.results[10] is None
+    assert result.errors == {10: {"title": ["Not a valid list."],
+                                  "directors": ["Not a valid list."]}}
@@ -0,0 +1,37 @@
+import pytest
+from marshmallow import fields
+
+from aliceplex.schema.schema import ShowSchema
+from aliceplex.schema.schema.codegen import CodeGenerator, dict_fields, \
+    list_inner
+
+
+class _Generator(CodeGenerator):
+    def generate(self, schema, first: str, second: str):
+        self.function(first, "value", ["return value"])
+        self.function(second, "value", ["return -value"])
+
+
+def test_code_generator():
+    generator = _Generator({"one": 1})
+    schema = ShowSchema()
+    names = generator.schema(schema)
+    assert generator.schema(schema) == names
+    assert generator.constant(2, "two") not in names
+    namespace = generator.namespace
+    assert namespace["one"] == 1
+    exec(generator.compile("test"), namespace)
+    assert namespace[names[0]](1) == 1
+    assert namespace[names[1]](1) == -1
+    with pytest.raises(NotImplementedError):
+        CodeGenerator().schema(schema)
+
+
+def test_field_helpers():
+    inner = fields.Str()
+    assert list_inner(fields.List(inner)) is inner
+    keys, values = dict_fields(fields.Dict(keys=fields.Int(),
+                                           values=fields.Str()))
+    assert isinstance(keys, fields.Int)
+    assert isinstance(values, fields.Str)
+    assert dict_fields(fields.Dict()) == (None, None)
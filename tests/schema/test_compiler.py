@@ -0,0 +1,147 @@
+from datetime import date
+
+import pytest
+from marshmallow import ValidationError, fields, validates
+
+from aliceplex.schema import Actor, Episode, Person, Show
+from aliceplex.schema.schema import ActorSchema, ActorStrictSchema, \
+    AlbumSchema, AlbumStrictSchema, ArtistSchema, ArtistStrictSchema, \
+    EpisodeSchema, EpisodeStrictSchema, MovieSchema, MovieStrictSchema, \
+    PersonSchema, PersonStrictSchema, ShowSchema, ShowStrictSchema
+from aliceplex.schema.schema.compiler import CompiledSchema, compile_schema
+
+SCHEMAS = [
+    ActorSchema, ActorStrictSchema,
+    AlbumSchema, AlbumStrictSchema,
+    ArtistSchema, ArtistStrictSchema,
+    EpisodeSchema, EpisodeStrictSchema,
+    MovieSchema, MovieStrictSchema,
+    PersonSchema, PersonStrictSchema,
+    ShowSchema, ShowStrictSchema
+]
+
+RECORDS = [
+    {},
+    {"name": "name", "photo": "", "role": "role"},
+    {"name": None, "photo": None, "role": None},
+    {"name": 1},
+    {"name": "name", "unknown": "unknown"},
+    {
+        "title": ["title", None, ""],
+        "content_rating": "content_rating",
+        "aired": "2018-01-01",
+        "summary": "summary",
+        "rating": 1,
+        "writers": ["person", ""],
+        "directors": ["person"]
+    },
+    {"title": "title", "rating": 11, "writers": [None], "directors": [1]},
+    {
+        "title": "title",
+        "sort_title": "",
+        "original_title": "original_title",
+        "content_rating": "content_rating",
+        "tagline": ["tagline"],
+        "studio": ["studio"],
+        "aired": "2018-01-01",
+        "summary": "summary",
+        "rating": 10.0,
+        "genres": ["genre"],
+        "collections": ["collection"],
+        "actors": [
+            {"name": "name", "role": "role", "photo": None},
+            {"name": "name", "role": ""}
+        ],
+        "season_summary": {"1": "summary"}
+    },
+    {"actors": [{"name": "name", "role": 1}], "studio": [], "genres": None},
+    {"actors": [{"name": 1}], "season_summary": {"x": 1}},
+    {
+        "title": "title",
+        "genres": ["genre"],
+        "collections": [],
+        "summary": None,
+        "aired": "2018-01-01",
+        "directors": ["person"],
+        "writers": ["person"],
+        "studio": ["studio"],
+        "original_title": ["title"]
+    }
+]
+
+
+def _load(schema, data, many=None):
+    try:
+        return schema.load(data, many=many), None
+    except ValidationError as error:
+        return None, (error.messages, error.valid_data)
+
+
+@pytest.mark.parametrize("schema_class", SCHEMAS)
+def test_compiled_schema_load(schema_class):
+    schema = schema_class()
+    compiled = compile_schema(schema_class)
+    for data in RECORDS:
+        assert _load(compiled, data) == _load(schema, data)
+    assert _load(compiled, RECORDS, True) == _load(schema, RECORDS, True)
+    assert _load(compiled, [{}], True) == _load(schema, [{}], True)
+    compiled = compile_schema(schema_class(many=True))
+    assert _load(compiled, RECORDS) == _load(schema, RECORDS, True)
+
+
+@pytest.mark.parametrize("schema_class", SCHEMAS)
+def test_compiled_schema_dump(schema_class):
+    schema = schema_class()
+    compiled = compile_schema(schema)
+    for data in RECORDS:
+        obj, _ = _load(schema, data)
+        if obj is not None:
+            assert compiled.dump(obj) == schema.dump(obj)
+            assert compiled.dump([obj], many=True) == \
+                schema.dump([obj], many=True)
+
+
+def test_compiled_schema_fast_path(monkeypatch):
+    compiled = compile_schema(ShowStrictSchema)
+    show = Show(
+        title="title",
+        sort_title="sort_title",
+        original_title="original_title",
+        content_rating="content_rating",
+        studio=["studio"],
+        aired=date(2018, 1, 1),
+        summary="summary",
+        genres=["genre"],
+        collections=["collection"],
+        actors=[Actor(name="name", role="role")],
+        season_summary={1: "summary"}
+    )
+    data = ShowStrictSchema().dump(show)
+    # Generic schema must not be used for valid input
+    monkeypatch.setattr(compiled.schema, "load", None)
+    monkeypatch.setattr(compiled.schema, "dump", None)
+    assert compiled.load(data) == show
+    assert compiled.dump(show) == data
+    compiled = compile_schema(EpisodeSchema())
+    monkeypatch.setattr(compiled.schema, "load", None)
+    episode = compiled.load({"writers": ["person", ""], "title": ["title"]})
+    assert episode == Episode(title=["title"], writers=[Person("person")])
+    assert "def " in compiled.source
+
+
+def test_compiled_schema_invalid():
+    class ValidatedSchema(PersonSchema):
+        @validates("name")
+        def validate_name(self, value):
+            pass
+
+    class DottedSchema(PersonSchema):
+        extra = fields.Str(attribute="a.b")
+
+    with pytest.raises(ValueError):
+        compile_schema(ValidatedSchema)
+    with pytest.raises(ValueError):
+        compile_schema(PersonSchema(partial=True))
+    with pytest.raises(ValueError):
+        compile_schema(DottedSchema)
+    assert isinstance(compile_schema(PersonSchema), CompiledSchema)
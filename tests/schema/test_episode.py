@@ -168,3 +168,18 @@ def test_episode_strict_schema_dump(
         "writers": [],
         "directors": []
     }
+
+
+def test_episode_schema_load_trusted(episode_schema: EpisodeSchema):
+    schema = episode_schema
+    data = {
+        "title": ["title", ""],
+        "content_rating": "",
+        "aired": "2018-01-01",
+        "summary": "summary",
+        "rating": 1,
+        "writers": ["person", None],
+        "directors": ["person"]
+    }
+    assert schema.load_trusted(data) == schema.load(data)
+    assert schema.load_trusted({}) == Episode()
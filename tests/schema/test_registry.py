@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aliceplex.schema import InternPool, Person, SlottedPerson
+from aliceplex.schema.schema import PersonSchema, PersonStrictSchema, \
+    ShowStrictSchema, clear_schemas, get_schema
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    clear_schemas()
+    yield
+    clear_schemas()
+
+
+def test_get_schema():
+    schema = get_schema(PersonSchema)
+    assert isinstance(schema, PersonSchema)
+    assert get_schema(PersonSchema) is schema
+    assert get_schema(PersonStrictSchema) is not schema
+
+
+def test_get_schema_options():
+    many = get_schema(PersonSchema, many=True)
+    assert many.many
+    assert many is not get_schema(PersonSchema)
+    assert get_schema(PersonSchema, many=True) is many
+    only = get_schema(PersonSchema, only=["name"])
+    assert get_schema(PersonSchema, only=("name",)) is only
+    assert list(only.fields) == ["name"]
+    assert get_schema(PersonSchema, slots=True).load({"name": "A"}) == \
+        SlottedPerson(name="A")
+    pool = InternPool()
+    assert get_schema(PersonSchema, pool=pool).pool is pool
+
+
+def test_get_schema_unhashable():
+    with pytest.raises(ValueError):
+        get_schema(PersonSchema, context={"slots": True})
+
+
+def test_clear_schemas():
+    schema = get_schema(PersonSchema)
+    clear_schemas()
+    assert get_schema(PersonSchema) is not schema
+
+
+def test_get_schema_threads():
+    with ThreadPoolExecutor(8) as executor:
+        schemas = list(executor.map(
+            lambda _: get_schema(ShowStrictSchema), range(64)
+        ))
+    assert all(schema is schemas[0] for schema in schemas)
+
+
+def test_shared_schema_threads():
+    schema = get_schema(PersonSchema)
+    records = [{"name": f"Person {i}"} for i in range(200)]
+
+    def load(record):
+        return schema.dump(schema.load(record))
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(load, records)) == [
+            {"name": f"Person {i}", "photo": None} for i in range(200)
+        ]
+    assert schema.load({"name": "A"}) == Person(name="A")
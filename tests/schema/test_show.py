@@ -4,6 +4,7 @@ import pytest
 from marshmallow import ValidationError
 
 from aliceplex.schema import Actor, Show, ShowSchema, ShowStrictSchema
+from aliceplex.schema.model import SlottedActor, SlottedShow
 
 
 def test_show_schema_load(show_schema: ShowSchema):
@@ -230,3 +231,35 @@ def test_show_strict_schema_dump(show_strict_schema: ShowStrictSchema):
         "actors": [],
         "season_summary": {}
     }
+
+
+def test_show_schema_load_trusted(show_schema: ShowSchema):
+    schema = show_schema
+    data = {
+        "title": "title",
+        "aired": "2018-01-01",
+        "rating": 1,
+        "genres": ["genre", ""],
+        "actors": [{"name": "name", "role": "", "photo": None}],
+        "season_summary": {"1": "summary"}
+    }
+    load = schema.load_trusted(data)
+    assert load == schema.load(data)
+    assert load.actors == [Actor(name="name")]
+    assert load.season_summary == {1: "summary"}
+
+
+def test_show_schema_slots():
+    schema = ShowSchema(slots=True)
+    load = schema.load({
+        "title": "title",
+        "actors": [{"name": "name", "role": "role"}]
+    })
+    assert load == SlottedShow(
+        title="title",
+        actors=[SlottedActor(name="name", role="role")]
+    )
+    assert schema.dump(load) == ShowSchema().dump(Show(
+        title="title",
+        actors=[Actor(name="name", role="role")]
+    ))
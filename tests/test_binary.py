@@ -0,0 +1,143 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from aliceplex.schema import Actor, Episode, InternPool, Movie, Person, \
+    Show, SlottedActor, SlottedShow
+from aliceplex.schema.binary import Archive, BinaryFile, dump_archive, \
+    dump_binary, load_binary, schema_version
+from aliceplex.schema.schema import EpisodeSchema, EpisodeStrictSchema, \
+    MovieSchema, ShowSchema
+
+SHOWS = [
+    Show(
+        title="タイトル",
+        sort_title="",
+        aired=date(2018, 1, 1),
+        rating=8.5,
+        genres=["Drama", "Comedy"],
+        actors=[Actor(name="Actor", role="Role"), Actor(name="Actor")],
+        season_summary={1: "Summary", 2: ""}
+    ),
+    Show(),
+    Show(title="Show", genres=["Drama"], actors=[Actor(name="Actor")])
+]
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> str:
+    return str(tmp_path / "library.bin")
+
+
+def test_dump_load(path: str):
+    assert dump_binary(SHOWS, path, ShowSchema) == 3
+    assert load_binary(path, ShowSchema) == SHOWS
+
+
+def test_dump_load_models(path: str):
+    episodes = [
+        Episode(title=["Episode"], aired=date(2018, 1, 2),
+                directors=[Person(name="Director")], writers=[]),
+        Episode(rating=0.0)
+    ]
+    dump_binary(episodes, path, EpisodeSchema)
+    assert load_binary(path, EpisodeSchema) == episodes
+    movies = [Movie(title="Movie", writers=[Person(name="Writer")])]
+    dump_binary(movies, path, MovieSchema)
+    assert load_binary(path, MovieSchema) == movies
+
+
+def test_empty(path: str):
+    assert dump_binary([], path, ShowSchema) == 0
+    assert load_binary(path, ShowSchema) == []
+
+
+def test_binary_file(path: str):
+    dump_binary(SHOWS, path, ShowSchema)
+    with BinaryFile(path, ShowSchema) as file:
+        assert len(file) == 3
+        assert file[0] == SHOWS[0]
+        assert file[-1] == SHOWS[2]
+        assert file.read(file.offset(1)) == SHOWS[1]
+        with pytest.raises(IndexError):
+            file[3]
+        assert list(file) == SHOWS
+
+
+def test_options(path: str):
+    dump_binary(SHOWS, path, ShowSchema)
+    shows = load_binary(path, ShowSchema, slots=True)
+    assert isinstance(shows[0], SlottedShow)
+    assert isinstance(shows[0].actors[0], SlottedActor)
+    shows = load_binary(path, ShowSchema, pool=InternPool())
+    assert shows[0].actors[1] is shows[2].actors[0]
+
+
+def test_shared_strings(path: str):
+    dump_binary(SHOWS, path, ShowSchema)
+    shows = load_binary(path, ShowSchema)
+    assert shows[0].genres[0] is shows[2].genres[0]
+
+
+def test_invalid_file(path: str):
+    Path(path).write_bytes(b"invalid")
+    with pytest.raises(ValueError):
+        BinaryFile(path, ShowSchema)
+    Path(path).write_bytes(bytes(100))
+    with pytest.raises(ValueError):
+        BinaryFile(path, ShowSchema)
+
+
+def test_schema_version(path: str):
+    assert schema_version(ShowSchema) == schema_version(ShowSchema)
+    assert schema_version(EpisodeSchema) != schema_version(ShowSchema)
+    assert schema_version(EpisodeSchema) != \
+        schema_version(EpisodeStrictSchema)
+    dump_binary(SHOWS, path, ShowSchema)
+    with pytest.raises(ValueError):
+        BinaryFile(path, EpisodeSchema)
+
+
+def test_nul(path: str):
+    shows = [Show(title="a\0b", genres=["", "c"]), Show(title="")]
+    dump_binary(shows, path, ShowSchema)
+    with BinaryFile(path, ShowSchema) as file:
+        assert file[0] == shows[0]
+        assert list(file) == shows
+
+
+def test_archive(path: str):
+    items = {"b/show.yaml": SHOWS[0], "a/show.yaml": SHOWS[1],
+             "ç/show.yaml": SHOWS[2]}
+    assert dump_archive(items.items(), path, ShowSchema) == 3
+    with Archive(path, ShowSchema) as archive:
+        assert len(archive) == 3
+        assert list(archive.keys()) == sorted(items)
+        assert list(archive) == [items[key] for key in sorted(items)]
+        for key, show in items.items():
+            assert key in archive
+            assert archive.get(key) == show
+        assert archive.index("a/show.yaml") == 0
+        assert "c/show.yaml" not in archive
+        assert archive.get("", SHOWS[1]) is SHOWS[1]
+        assert archive.get("z") is None
+        with pytest.raises(KeyError):
+            archive.index("z")
+    assert load_binary(path, ShowSchema) == \
+        [items[key] for key in sorted(items)]
+
+
+def test_archive_empty(path: str):
+    dump_archive([], path, ShowSchema)
+    with Archive(path, ShowSchema) as archive:
+        assert len(archive) == 0
+        assert archive.get("show") is None
+
+
+def test_archive_invalid(path: str):
+    with pytest.raises(ValueError):
+        dump_archive([("show", Show()), ("show", Show())], path, ShowSchema)
+    dump_binary(SHOWS, path, ShowSchema)
+    with pytest.raises(ValueError):
+        Archive(path, ShowSchema)
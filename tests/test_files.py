@@ -0,0 +1,138 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from aliceplex.schema import Actor, Episode, Show
+from aliceplex.schema import files
+from aliceplex.schema.files import BACKENDS, aload_file, aload_many, \
+    dump_file, dumps, load_file, load_files, loads
+from aliceplex.schema.schema import EpisodeSchema, ShowSchema
+
+SHOW = Show(
+    title="タイトル",
+    aired=date(2018, 1, 1),
+    actors=[Actor(name="Actor", role="Role")],
+    season_summary={1: "Summary"}
+)
+
+
+@pytest.mark.parametrize("name", ["show.json", "show.yaml", "show.YML"])
+def test_dump_load_file(tmp_path: Path, name: str):
+    if not name.endswith("json"):
+        pytest.importorskip("yaml")
+    path = str(tmp_path / name)
+    dump_file(SHOW, path, ShowSchema)
+    assert load_file(path, ShowSchema) == SHOW
+
+
+def test_loads_json():
+    assert loads(b'{"title": "Title"}', "show.json") == {"title": "Title"}
+    with pytest.raises(ValueError):
+        loads(b"{", "show.json")
+
+
+def test_dumps_json():
+    assert json.loads(dumps({"title": "タイトル", 1: "a"}, "show.json")) == \
+        {"title": "タイトル", "1": "a"}
+
+
+def test_loads_yaml():
+    pytest.importorskip("yaml")
+    assert BACKENDS["yaml"] in ("libyaml", "pyyaml")
+    assert loads(b"title: Title\n", "show.yaml") == {"title": "Title"}
+    with pytest.raises(ValueError):
+        loads(b"title: [", "show.yaml")
+    with pytest.raises(ValueError):
+        # Only standard YAML tags are allowed
+        loads(b"!!python/object:object {}", "show.yaml")
+
+
+def test_load_file_yaml_date(tmp_path: Path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "S01E01.yaml"
+    path.write_text("title:\n- Episode\naired: 2018-01-01\n")
+    assert load_file(str(path), EpisodeSchema) == \
+        Episode(title=["Episode"], aired=date(2018, 1, 1))
+    assert loads(b"aired: 2018-01-01", "show.yaml") == {"aired": "2018-01-01"}
+
+
+def test_unsupported():
+    with pytest.raises(ValueError):
+        loads(b"", "show.txt")
+    with pytest.raises(ValueError):
+        dumps({}, "show.txt")
+
+
+def _write_episodes(tmp_path: Path) -> list:
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"S01E{i:02d}.json"
+        path.write_text(json.dumps({"title": [f"Episode {i}"]}))
+        paths.append(str(path))
+    (tmp_path / "S01E03.json").write_text('{"aired": "x"}')
+    (tmp_path / "S01E04.json").write_text("{")
+    paths.append(str(tmp_path / "missing.json"))
+    return paths
+
+
+def _check_episodes(result):
+    assert len(result.results) == 21
+    assert result.results[0] == Episode(title=["Episode 0"])
+    assert result.results[19] == Episode(title=["Episode 19"])
+    assert result.results[3] is None
+    assert set(result.errors) == {3, 4, 20}
+    assert result.errors[3] == {"aired": ["Not a valid date."]}
+    assert list(result.errors[20]) == ["_schema"]
+
+
+def test_load_files(tmp_path: Path):
+    paths = _write_episodes(tmp_path)
+    _check_episodes(load_files(paths, EpisodeSchema, workers=4))
+
+
+def test_aload_file(tmp_path: Path):
+    path = str(tmp_path / "show.yaml")
+    dump_file(SHOW, path, ShowSchema)
+    assert asyncio.run(aload_file(path, ShowSchema)) == SHOW
+    with ThreadPoolExecutor(1) as executor:
+        assert asyncio.run(aload_file(path, ShowSchema, executor)) == SHOW
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(aload_file(str(tmp_path / "missing.yaml"), ShowSchema))
+
+
+def test_aload_many(tmp_path: Path):
+    paths = _write_episodes(tmp_path)
+    _check_episodes(asyncio.run(aload_many(paths, EpisodeSchema, limit=3)))
+    with pytest.raises(ValueError):
+        asyncio.run(aload_many(paths, EpisodeSchema, limit=0))
+
+
+def test_aload_many_cancel(monkeypatch):
+    started = []
+    release = threading.Event()
+
+    def load_path(path, schema_class, options):
+        started.append(path)
+        release.wait(5)
+        return None, None
+
+    monkeypatch.setattr(files, "_load_path", load_path)
+
+    async def cancel():
+        task = asyncio.ensure_future(
+            aload_many(["a", "b", "c", "d"], EpisodeSchema, limit=2)
+        )
+        while len(started) < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+
+    asyncio.run(cancel())
+    assert started == ["a", "b"]
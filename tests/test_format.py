@@ -1,3 +1,9 @@
+import random
+import unicodedata
+from io import StringIO
+
+import pytest
+
 from aliceplex.schema import format
 
 
@@ -60,3 +66,184 @@ def test_normalize():
     assert format.normalize("。 \n! ") == "。!"
     assert format.normalize("test.....") == "test……"
     assert format.normalize("Hello     World!") == "Hello World!"
+
+
+def _normalize_step_by_step(string: str) -> str:
+    result = unicodedata.normalize("NFKC", string)
+    result = format.remove_trailing_space(result)
+    result = format.remove_leading_space(result)
+    result = format.replace_continuous_newlines(result)
+    result = format.replace_continuous_space(result)
+    result = format.replace_ending_space(result)
+    result = format.remove_single_linebreak(result)
+    result = format.replace_tilde(result)
+    result = format.replace_dot(result)
+    result = format.replace_arrow_brackets(result)
+    return result.strip()
+
+
+def test_normalizer():
+    normalizer = format.Normalizer()
+    assert normalizer("。 \n! ") == "。!"
+    assert normalizer("test.....") == "test……"
+    assert normalizer("Hello     World!") == "Hello World!"
+    assert normalizer(" a \n \t\x0c b \n\n \n c? \n") == "a b\n\nc?"
+
+
+def test_normalizer_random():
+    alphabet = " \t\n\r\x0b\x0c\x85\xa0\u3000\u2028?!。？！.．、・･<>＜＞~～˜〜aあ"
+    rand = random.Random(0)
+    normalizer = format.Normalizer()
+    for _ in range(20000):
+        length = rand.randint(0, 30)
+        string = "".join(rand.choice(alphabet) for _ in range(length))
+        assert normalizer(string) == _normalize_step_by_step(string)
+
+
+def test_normalize_many():
+    strings = ["。 \n! ", "test.....", "Hello     World!"]
+    expected = ["。!", "test……", "Hello World!"]
+    assert list(format.normalize_many(strings)) == expected
+    assert list(format.normalize_many(iter(strings), workers=1)) == expected
+    assert not list(format.normalize_many([]))
+
+
+def test_normalize_many_parallel(monkeypatch):
+    monkeypatch.setattr(format, "_PARALLEL_THRESHOLD", 10)
+    strings = [f"{i}  ~{i}..." for i in range(100)]
+    expected = [format.normalize(string) for string in strings]
+    result = format.normalize_many(strings, workers=2, chunksize=7)
+    assert list(result) == expected
+
+
+def test_memoized_normalizer():
+    normalizer = format.MemoizedNormalizer(maxsize=2, max_length=10)
+    assert normalizer("a  b") == "a b"
+    assert normalizer("a  b") == "a b"
+    assert normalizer("c...") == "c…"
+    assert normalizer("d~") == "d〜"
+    assert normalizer("long  string....") == "long string……"
+    assert normalizer.currsize == 2
+    assert normalizer.cache_info() == format.CacheInfo(
+        hits=1, misses=3, evictions=1, maxsize=2, currsize=2
+    )
+    normalizer.cache_clear()
+    assert normalizer.cache_info() == format.CacheInfo(
+        hits=0, misses=0, evictions=0, maxsize=2, currsize=0
+    )
+
+
+def test_is_normalized():
+    assert format.is_normalized("")
+    assert format.is_normalized("Hello World…")
+    assert format.is_normalized("Hello.\n\nWorld。")
+    assert format.is_normalized("a\n\n\x0cb")
+    assert format.is_normalized("<a\n\nb>")
+    assert not format.is_normalized(" Hello")
+    assert not format.is_normalized("Hello  World")
+    assert not format.is_normalized("Hello\nWorld")
+    assert not format.is_normalized("Hello? World")
+    assert not format.is_normalized("Hello...")
+    assert not format.is_normalized("~Hello")
+    assert not format.is_normalized("<Hello>")
+    assert not format.is_normalized("Ｈello")
+
+
+def test_is_normalized_ellipsis():
+    normalizer = format.Normalizer()
+    assert normalizer._is_clean("Plain title…")
+    assert normalizer._is_clean("…a…")
+    assert not normalizer._is_clean("a……")
+    assert not normalizer._is_clean("a….")
+    assert not normalizer._is_clean("a、…")
+    assert not normalizer._is_clean("ａ…")
+    assert format.normalize("a……") == "a……"
+    assert format.normalize("a.…") == "a……"
+
+
+def test_is_normalized_random():
+    alphabet = " \t\n\n\n\r\x0c\xa0?!。.、・<>~〜aあ……\u0301"
+    rand = random.Random(0)
+    for _ in range(40000):
+        length = rand.randint(0, 15)
+        string = "".join(rand.choice(alphabet) for _ in range(length))
+        normalized = format.normalize(string)
+        assert format.is_normalized(normalized) == (
+            format.normalize(normalized) == normalized
+        )
+        assert format.is_normalized(string) == (normalized == string)
+
+
+def test_normalize_stream():
+    text = " Hello  World...\n \n\nNext~\nline? test\n\n<a\n\n>\n"
+    expected = format.normalize(text)
+    assert "".join(format.normalize_stream(StringIO(text), 4)) == expected
+    chunks = ["\n\n", " Hello  World..", ".\n \n", "\nNext~\nline", "? test",
+              "\n\n<a\n", "\n>\n"]
+    assert "".join(format.normalize_stream(chunks)) == expected
+    assert not list(format.normalize_stream(["\n\n", " "]))
+
+
+def test_normalize_stream_random():
+    alphabet = " \t\n\n\n\n\r\x0c\xa0?!。.、・<>~aあ\u0301˜"
+    rand = random.Random(0)
+    for _ in range(5000):
+        length = rand.randint(0, 40)
+        string = "".join(rand.choice(alphabet) for _ in range(length))
+        cuts = sorted(rand.randint(0, length) for _ in range(3))
+        chunks = [string[start:end]
+                  for start, end in zip([0] + cuts, cuts + [length])]
+        result = "".join(format.normalize_stream(chunks))
+        assert result == format.normalize(string)
+
+
+def test_character_map():
+    character_map = format.CharacterMap({"~〜": "〜"})
+    assert character_map.mapping == {"~": "〜"}
+    assert character_map("~a~") == "〜a〜"
+    assert character_map.register("‐–—", "-") is character_map
+    assert character_map("a–b—c~") == "a-b-c〜"
+    assert character_map.matches("a—b")
+    assert not character_map.matches("a-b")
+    assert format.CharacterMap()("~a~") == "~a~"
+    with pytest.raises(ValueError):
+        character_map.register("　", " ")
+
+
+def test_normalizer_character_map():
+    characters = format.CharacterMap({"~˜⁓∼∽∿〜～": "〜", "‐–—": "-"})
+    normalizer = format.Normalizer(characters)
+    assert normalizer("Hello–World~  test") == "Hello-World〜 test"
+    assert not normalizer.is_normalized("Hello–World")
+    assert normalizer.is_normalized("Hello-World")
+
+
+def test_pipeline():
+    pipeline = format.Pipeline(["nfkc", "whitespace"])
+    assert pipeline.steps == ("nfkc", "whitespace")
+    assert pipeline(" Ｔaro  Yamada~ ") == "Taro Yamada~"
+    pipeline = format.Pipeline([
+        "replace_tilde", "replace_full_stop",
+        format.CharacterMap({"・": "･"}), "strip"
+    ])
+    assert pipeline(" ~a．b ") == "〜a･b"
+    with pytest.raises(ValueError):
+        format.Pipeline(["nfkc", "unknown"])
+
+
+def test_pipeline_normalize():
+    alphabet = " \t\n\n\r\x0c\xa0　?!。？！.．、・<>＜＞~～aあ"
+    rand = random.Random(0)
+    pipeline = format.Pipeline(format.NORMALIZE_STEPS)
+    step_by_step = format.Pipeline([
+        "nfkc", "remove_trailing_space", "remove_leading_space",
+        "replace_continuous_newlines", "replace_continuous_space",
+        "replace_ending_space", "remove_single_linebreak", "replace_tilde",
+        "replace_dot", "replace_arrow_brackets", "strip"
+    ])
+    for _ in range(20000):
+        length = rand.randint(0, 30)
+        string = "".join(rand.choice(alphabet) for _ in range(length))
+        expected = format.normalize(string)
+        assert pipeline(string) == expected
+        assert step_by_step(string) == expected
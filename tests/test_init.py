@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pytest
+
+import aliceplex.schema
+from aliceplex.schema import schema
+from aliceplex.schema.model import Show
+from aliceplex.schema.schema.show import ShowSchema
+
+
+def _imported(statement: str, module: str = "marshmallow") -> bool:
+    """
+    Check if module is imported by statement in a new interpreter.
+    """
+    code = f"{statement}\nimport sys\nprint({module!r} in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True)
+    return output.stdout.strip() == "True"
+
+
+@pytest.mark.parametrize("statement", [
+    "import aliceplex.schema",
+    "import aliceplex.schema.format",
+    "import aliceplex.schema.model",
+    "import aliceplex.schema.verify",
+    "from aliceplex.schema import Show, InternPool"
+])
+def test_lazy_import(statement: str):
+    assert not _imported(statement)
+
+
+def test_lazy_import_numpy():
+    assert not _imported("import aliceplex.schema.verify", "numpy")
+
+
+def test_import_schema():
+    assert _imported("from aliceplex.schema import ShowSchema")
+
+
+def test_getattr():
+    assert aliceplex.schema.Show is Show
+    assert aliceplex.schema.ShowSchema is ShowSchema
+    assert schema.ShowSchema is ShowSchema
+    with pytest.raises(AttributeError):
+        getattr(aliceplex.schema, "Unknown")
+    with pytest.raises(AttributeError):
+        getattr(schema, "Unknown")
+
+
+def test_dir():
+    assert set(aliceplex.schema.__all__) <= set(dir(aliceplex.schema))
+    assert set(schema.__all__) <= set(dir(schema))
@@ -0,0 +1,171 @@
+import json
+import os
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from aliceplex.schema import Actor, Episode, Person, Show, SlottedEpisode
+from aliceplex.schema.library import INDEX_NAME, LibraryScanner
+from aliceplex.schema.schema import EpisodeSchema, ShowSchema
+
+SHOW = {
+    "title": "Show",
+    "aired": "2018-01-01",
+    "actors": [{"name": "Actor", "role": "Role"}],
+    "season_summary": {"1": "Summary"}
+}
+
+EPISODE = {"title": ["Episode"], "directors": ["Director"]}
+
+
+def _write(path: Path, data, age: int = 60):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data) if not isinstance(data, str) else data)
+    # Files older than the previous scan are trusted by mtime and size
+    mtime = path.stat().st_mtime - age
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    _write(tmp_path / "Show" / "show.json", SHOW)
+    _write(tmp_path / "Show" / "Season 1" / "S01E01.json", EPISODE)
+    _write(tmp_path / "Show" / "Season 1" / "S01E02.json", {"aired": "x"})
+    _write(tmp_path / "Show" / "Season 1" / "S01E03.json", "{")
+    _write(tmp_path / "Show" / "notes.json", {})
+    _write(tmp_path / ".hidden" / "show.json", SHOW)
+    return tmp_path
+
+
+def test_scan(library: Path):
+    result = LibraryScanner(str(library)).scan()
+    assert result.items == {
+        "Show/show.json": Show(
+            title="Show", aired=date(2018, 1, 1),
+            actors=[Actor(name="Actor", role="Role")],
+            season_summary={1: "Summary"}
+        ),
+        "Show/Season 1/S01E01.json": Episode(
+            title=["Episode"], directors=[Person(name="Director")]
+        )
+    }
+    assert set(result.errors) == {
+        "Show/Season 1/S01E02.json", "Show/Season 1/S01E03.json"
+    }
+    assert result.errors["Show/Season 1/S01E02.json"] == {
+        "aired": ["Not a valid date."]
+    }
+    assert sorted(result.changed) == sorted(
+        list(result.items) + list(result.errors)
+    )
+    assert not result.removed
+    assert (library / INDEX_NAME).exists()
+
+
+def test_rescan(library: Path):
+    scanner = LibraryScanner(str(library))
+    first = scanner.scan()
+    second = scanner.scan()
+    assert second.items == first.items
+    assert second.errors == first.errors
+    assert not second.changed
+    assert not second.removed
+
+    episode = library / "Show" / "Season 1" / "S01E01.json"
+    _write(episode, {"title": ["Changed"]}, age=0)
+    (library / "Show" / "Season 1" / "S01E02.json").unlink()
+    third = scanner.scan()
+    assert third.changed == ["Show/Season 1/S01E01.json"]
+    assert third.removed == ["Show/Season 1/S01E02.json"]
+    assert third.items["Show/Season 1/S01E01.json"] == \
+        Episode(title=["Changed"])
+    assert third.items["Show/show.json"] is first.items["Show/show.json"]
+
+
+def test_touch(library: Path):
+    scanner = LibraryScanner(str(library))
+    scanner.scan()
+    os.utime(library / "Show" / "show.json")
+    assert not scanner.scan().changed
+
+
+def test_index(library: Path, monkeypatch):
+    first = LibraryScanner(str(library)).scan()
+
+    def load(*args, **kwargs):
+        raise AssertionError("Unchanged files must not be validated")
+
+    # A new scanner loads unchanged files from the index without validation
+    monkeypatch.setattr(ShowSchema, "load", load)
+    monkeypatch.setattr(EpisodeSchema, "load", load)
+    second = LibraryScanner(str(library)).scan()
+    assert second.items == first.items
+    assert second.errors == first.errors
+    assert not second.changed
+
+
+def test_invalid_index(library: Path):
+    (library / INDEX_NAME).write_text("{")
+    result = LibraryScanner(str(library)).scan()
+    assert len(result.changed) == 4
+
+
+def test_options(library: Path):
+    result = LibraryScanner(str(library), slots=True).scan()
+    assert isinstance(result.items["Show/Season 1/S01E01.json"],
+                      SlottedEpisode)
+
+
+def test_yaml(tmp_path: Path):
+    pytest.importorskip("yaml")
+    _write(tmp_path / "Movie" / "movie.yaml", "title: Movie\nrating: 8.5\n")
+    scanner = LibraryScanner(str(tmp_path), patterns=[("movie", ShowSchema)])
+    assert scanner.scan().items == {
+        "Movie/movie.yaml": Show(title="Movie", rating=8.5)
+    }
+
+
+def test_malformed(library: Path, monkeypatch):
+    _write(library / "Other" / "show.json", {"title": "Other", "genres": 5})
+    scanner = LibraryScanner(str(library))
+    walk = scanner._walk
+
+    def walk_missing(failed):
+        yield from walk(failed)
+        yield "Gone/show.json", str(library / "Gone" / "show.json"), \
+            ShowSchema
+
+    monkeypatch.setattr(scanner, "_walk", walk_missing)
+    result = scanner.scan()
+    assert result.errors["Other/show.json"] == {
+        "genres": ["Not a valid list."]
+    }
+    assert list(result.errors["Gone/show.json"]) == ["_schema"]
+    assert "Show/show.json" in result.items
+    monkeypatch.undo()
+    result = LibraryScanner(str(library)).scan()
+    assert "Gone/show.json" not in result.errors
+    assert result.changed == []
+
+
+def test_unreadable(library: Path, monkeypatch):
+    os.symlink("..", library / "Show" / "loop")
+    LibraryScanner(str(library)).scan()
+    unreadable = str(library / "Show" / "Season 1")
+    scandir = os.scandir
+
+    def scandir_denied(path):
+        if path == unreadable:
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir_denied)
+    result = LibraryScanner(str(library)).scan()
+    assert list(result.errors["Show/Season 1/"]) == ["_schema"]
+    assert "Show/show.json" in result.items
+    assert result.removed == []
+    monkeypatch.undo()
+    result = LibraryScanner(str(library)).scan()
+    assert "Show/Season 1/" not in result.errors
+    assert "Show/Season 1/S01E01.json" in result.items
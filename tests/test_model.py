@@ -0,0 +1,39 @@
+import pickle
+from dataclasses import asdict, dataclass, fields
+
+import pytest
+
+from aliceplex.schema.model import Actor, Person, Show, SlottedActor, \
+    SlottedPerson, SlottedShow, slotted
+
+
+def test_slotted():
+    assert slotted(Person) is SlottedPerson
+    assert slotted(SlottedPerson) is SlottedPerson
+    assert issubclass(SlottedActor, SlottedPerson)
+    assert [f.name for f in fields(SlottedActor)] == \
+        [f.name for f in fields(Actor)]
+    actor = SlottedActor(name="name", role="role")
+    assert not hasattr(actor, "__dict__")
+    assert actor == SlottedActor(name="name", role="role")
+    assert actor != Actor(name="name", role="role")
+    assert asdict(actor) == asdict(Actor(name="name", role="role"))
+    assert repr(actor) == \
+        "SlottedActor(name='name', photo=None, role='role')"
+    assert pickle.loads(pickle.dumps(actor)) == actor
+    show = SlottedShow(title="title")
+    assert show.genres == [] and show.genres is not SlottedShow().genres
+    assert asdict(show) == asdict(Show(title="title"))
+    with pytest.raises(AttributeError):
+        show.unknown = "unknown"
+
+
+def test_slotted_invalid():
+    with pytest.raises(ValueError):
+        slotted(dict)
+
+    @dataclass
+    class Sample:
+        value: int = 0
+
+    assert slotted(Sample)(1).value == 1
@@ -0,0 +1,14 @@
+from aliceplex.schema.parallel import map_chunks
+
+
+def _sum(chunk):
+    return sum(chunk)
+
+
+def test_map_chunks():
+    results = list(map_chunks(_sum, range(10), workers=2, chunksize=3))
+    assert results == [3, 12, 21, 9]
+
+
+def test_map_chunks_empty():
+    assert not list(map_chunks(_sum, [], workers=2))
@@ -0,0 +1,94 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from aliceplex.schema import Episode, EpisodeSchema, InternPool, Person
+from aliceplex.schema.schema.compiler import compile_schema
+
+
+def test_intern_pool():
+    pool = InternPool(maxsize=3)
+    name = "".join(["na", "me"])
+    assert pool.intern("name") == name
+    assert pool.intern(name) is not name
+    person = pool.intern(Person(name="name"))
+    assert pool.intern(Person(name="name")) is person
+    assert pool.intern(Person(name="other")) is not person
+    assert len(pool) == 3
+    assert pool.cache_info() == (2, 3, 0, 3, 3)
+    # Pool is cleared when it is full
+    pool.intern("value")
+    assert len(pool) == 1
+    assert pool.cache_info().evictions == 3
+    pool.cache_clear()
+    assert len(pool) == 0
+    assert pool.cache_info() == (0, 0, 0, 3, 0)
+
+
+def test_intern_pool_unhashable():
+    @dataclass
+    class Sample:
+        values: List[str] = field(default_factory=list)
+
+    @dataclass
+    class Other:
+        values: Optional[Dict[str, str]] = None
+        value: Any = None
+
+    pool = InternPool(field_names=["name", "values"])
+    sample = Sample()
+    assert pool.intern(sample) is sample
+    assert pool.intern(Other()) == Other()
+    other = Other(value=["a"])
+    assert pool.intern(other) is other
+    assert pool.intern(1) == 1
+    assert len(pool) == 0
+    data = {"name": "name", "values": ["a", None], "other": "other"}
+    pool.intern_data(data, ["name", "values", "missing"])
+    assert data == {"name": "name", "values": ["a", None], "other": "other"}
+    assert len(pool) == 2
+
+
+def test_intern_pool_unique():
+    pool = InternPool(maxsize=10, max_length=8)
+    summary = "summary" * 2
+    assert pool.intern(summary) is summary
+    assert len(pool) == 0
+    schema = EpisodeSchema(pool=pool, many=True)
+    records = [
+        {
+            "title": [f"Episode {i}"],
+            "summary": f"Summary {i}",
+            "content_rating": "PG",
+            "directors": ["person"]
+        }
+        for i in range(100)
+    ]
+    for loader in (schema.load, compile_schema(schema).load):
+        pool.cache_clear()
+        episodes = loader(records)
+        assert episodes[0].content_rating is episodes[-1].content_rating
+        assert episodes[0].directors[0] is episodes[-1].directors[0]
+        assert pool.cache_info().evictions == 0
+        assert len(pool) == 3
+
+
+def test_intern_pool_schema():
+    pool = InternPool()
+    schema = EpisodeSchema(pool=pool, many=True)
+    records = [
+        {"content_rating": "".join(["P", "G"]), "directors": ["person"]}
+        for _ in range(3)
+    ]
+    episodes = schema.load(records)
+    assert episodes == [
+        Episode(content_rating="PG", directors=[Person(name="person")])
+    ] * 3
+    assert episodes[0].directors[0] is episodes[1].directors[0]
+    assert episodes[0].content_rating is episodes[2].content_rating
+    size = len(pool)
+    schema.dump(episodes)
+    assert len(pool) == size
+    for loaded in (schema.load_trusted(records),
+                   compile_schema(schema).load(records)):
+        assert loaded == episodes
+        assert loaded[0].directors[0] is episodes[0].directors[0]
@@ -0,0 +1,154 @@
+import copy
+import pickle
+from datetime import date
+
+import pytest
+
+from aliceplex.schema import Actor, Episode, EpisodeSchema, Person, Show, \
+    ShowSchema, SlottedPerson
+from aliceplex.schema.table import DateColumn, FloatColumn, ObjectColumn, \
+    PersonListColumn, StringColumn, StringListColumn, Table, mask_and, \
+    mask_not, mask_or
+
+EPISODES = [
+    Episode(title=["a"], aired=date(2018, 1, 1), content_rating="PG",
+            rating=8.0, directors=[Person(name="x")]),
+    Episode(title=["b", "c"], content_rating="G", rating=5.5,
+            writers=[Person(name="y")]),
+    Episode(aired=date(2018, 2, 1), content_rating="PG",
+            directors=[Person(name="x"), Person(name="y")]),
+    Episode(title=["d"], aired=date(2017, 1, 1), rating=9.0)
+]
+
+
+def test_mask():
+    assert mask_and(b"\x01\x01\x00", b"\x01\x00\x00") == b"\x01\x00\x00"
+    assert mask_or(b"\x01\x00\x00", b"\x00\x00\x01") == b"\x01\x00\x01"
+    assert mask_not(b"\x01\x00\x00") == b"\x00\x01\x01"
+
+
+def test_table():
+    table = Table.from_objects(EPISODES)
+    assert len(table) == 4
+    assert isinstance(table["title"], StringListColumn)
+    assert isinstance(table["aired"], DateColumn)
+    assert isinstance(table["content_rating"], StringColumn)
+    assert isinstance(table["directors"], PersonListColumn)
+    assert isinstance(table["rating"], FloatColumn)
+    assert [row.to_object() for row in table] == EPISODES
+    assert table[-1].title == ["d"]
+    assert table[2].rating is None
+    assert table[2].directors == [Person(name="x"), Person(name="y")]
+    with pytest.raises(IndexError):
+        table[4]
+    with pytest.raises(AttributeError):
+        table[0].unknown
+    dumped = EpisodeSchema(many=True).dump(EPISODES)
+    assert [row.to_object() for row in Table.from_dicts(dumped, Episode)] == \
+        EPISODES
+
+
+def test_table_person_photo():
+    episodes = [
+        Episode(directors=[Person(name="x", photo="x.jpg"),
+                           Person(photo="y.jpg")]),
+        Episode(directors=[Person(name="x")]),
+        Episode(directors=[Person(name="z", photo="z.jpg")])
+    ]
+    table = Table.from_objects(episodes)
+    assert [row.to_object() for row in table] == episodes
+    filtered = table.filter(b"\x00\x01\x01")
+    assert [row.to_object() for row in filtered] == episodes[1:]
+    assert table["directors"].value_counts() == {"x": 2, "z": 1}
+
+
+def test_table_slotted():
+    episodes = EpisodeSchema(slots=True, many=True).load([
+        {"title": ["a"], "directors": ["x"], "writers": ["y", "x"]},
+        {"title": ["b"]}
+    ])
+    table = Table.from_objects(episodes)
+    assert [row.to_object() for row in table] == episodes
+    assert isinstance(table[0].directors[0], SlottedPerson)
+    assert table["writers"].value_counts() == {"x": 1, "y": 1}
+    shows = ShowSchema(slots=True, many=True).load(
+        [{"actors": [{"name": "a", "role": "r"}]}]
+    )
+    dumped = ShowSchema(many=True).dump(shows)
+    table = Table.from_dicts(dumped, type(shows[0]))
+    assert table[0].to_object() == shows[0]
+    assert table.filter(b"\x01")[0].actors == shows[0].actors
+
+
+def test_row_copy():
+    row = Table.from_objects(EPISODES)[2]
+    for other in (copy.copy(row), pickle.loads(pickle.dumps(row))):
+        assert other.to_object() == EPISODES[2]
+    with pytest.raises(AttributeError):
+        row._unknown
+
+
+def test_table_filter():
+    table = Table.from_objects(EPISODES)
+    rating = table["rating"]
+    assert rating.between(6) == b"\x01\x00\x00\x01"
+    assert rating.between(high=8) == b"\x01\x01\x00\x00"
+    assert rating.between() == rating.valid() == b"\x01\x01\x00\x01"
+    aired = table["aired"]
+    assert aired.between(date(2018, 1, 1), "2018-12-31") == \
+        b"\x01\x00\x01\x00"
+    content_rating = table["content_rating"]
+    assert content_rating.isin(["PG"]) == b"\x01\x00\x01\x00"
+    assert content_rating.isin(["PG"], invert=True) == b"\x00\x01\x00\x01"
+    assert content_rating.valid() == b"\x01\x01\x01\x00"
+    directors = table["directors"]
+    assert directors.isin(["y"]) == b"\x00\x00\x01\x00"
+    assert directors.isin(["x"], invert=True) == b"\x00\x01\x00\x01"
+    assert directors.valid() == b"\x01\x00\x01\x00"
+    mask = mask_and(content_rating.isin(["PG"]), rating.valid())
+    filtered = table.filter(mask)
+    assert [row.to_object() for row in filtered] == EPISODES[:1]
+    assert [row.to_object() for row in table.rows(mask)] == EPISODES[:1]
+
+
+def test_table_aggregate():
+    table = Table.from_objects(EPISODES)
+    rating = table["rating"]
+    assert rating.count() == 3
+    assert rating.sum() == 22.5
+    assert rating.mean() == 7.5
+    assert rating.mean(b"\x01\x01\x00\x00") == 6.75
+    assert rating.mean(b"\x00\x00\x01\x00") is None
+    assert rating.min() == 5.5 and rating.max() == 9.0
+    assert table["aired"].min() == date(2017, 1, 1)
+    assert table["aired"].max(b"\x01\x01\x00\x00") == date(2018, 1, 1)
+    assert table["content_rating"].value_counts() == {"PG": 2, "G": 1}
+    assert table["content_rating"].value_counts(b"\x00\x01\x00\x01") == \
+        {"G": 1}
+    assert table["directors"].value_counts() == {"x": 2, "y": 1}
+    assert table["title"].value_counts(b"\x00\x01\x00\x00") == \
+        {"b": 1, "c": 1}
+
+
+def test_table_large_dictionary():
+    column = StringColumn("name")
+    for index in range(300):
+        column.append(str(index))
+    column.append(None)
+    assert column.codes.typecode == "L"
+    assert column[299] == "299" and column[300] is None
+    assert column.isin(["1", "299"]).count(1) == 2
+    assert column.value_counts()["5"] == 1
+
+
+def test_table_show():
+    show = Show(title="title", actors=[Actor(name="name", role="role")],
+                season_summary={1: "summary"})
+    table = Table.from_dicts([ShowSchema().dump(show)], Show)
+    assert isinstance(table["actors"], ObjectColumn)
+    assert table[0].to_object() == show
+    with pytest.raises(ValueError):
+        Table(dict)
+    with pytest.raises(ValueError):
+        Table.from_objects([])
+    assert len(Table.from_objects([], Show)) == 0
@@ -1,6 +1,24 @@
+import pytest
+
 from aliceplex.schema import verify
 
 
 def test_has_diacritics():
     assert not verify.has_diacritics("ご")
     assert verify.has_diacritics("ご")
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_has_diacritics_many(monkeypatch, numpy: bool):
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(verify, "numpy", None)
+    monkeypatch.setattr(verify, "_CHUNK", 3)
+    strings = ["\u3054", "\u3053\u3099", "", "\u306f\u309a", "\u309b",
+               "text", "\u30d1", "\u306f\u3099\0"]
+    assert verify.has_diacritics_many(strings) == \
+        bytearray([0, 1, 0, 1, 1, 0, 0, 1])
+    assert verify.has_diacritics_many(iter(strings[:2])) == bytearray([0, 1])
+    assert verify.has_diacritics_many([]) == bytearray()
+    assert verify.has_diacritics_many(["a"] * 7) == bytearray(7)